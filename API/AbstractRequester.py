@@ -1,8 +1,61 @@
 import abc
+import logging
+import socket
+import threading
 from typing import Any, Callable, Optional
 
 from requests import Response, Session
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from urllib3.connection import HTTPConnection
+
+from API.RetryPolicy import RetryPolicy
+
+
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    """An `HTTPAdapter` with custom socket options and connection reuse counters.
+
+    Socket options are passed to the connection pools, which is used to enable
+    TCP keep-alive on pooled connections. The adapter counts the requests it
+    sends and the sockets its connection pools open (including reconnects of
+    dropped pooled connections), so connection reuse can be verified.
+    """
+
+    def __init__(self, socket_options: Optional[list[tuple[int, int, int]]] = None, **kwargs: Any):
+        # must be set before super().__init__, which calls init_poolmanager
+        self.socket_options = socket_options
+        self._stats_lock = threading.Lock()
+        self.requests_sent = 0
+        self.sockets_opened = 0
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        if self.socket_options is not None:
+            kwargs['socket_options'] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: self._counting_pool_class(pool_class)
+            for scheme, pool_class in self.poolmanager.pool_classes_by_scheme.items()}
+
+    def _counting_pool_class(self, pool_class: type) -> type:
+        adapter = self
+
+        class CountingConnection(pool_class.ConnectionCls):
+            def _new_conn(self):
+                sock = super()._new_conn()
+                adapter._count_socket()
+                return sock
+
+        return type(pool_class.__name__, (pool_class,), {'ConnectionCls': CountingConnection})
+
+    def _count_socket(self) -> None:
+        with self._stats_lock:
+            self.sockets_opened += 1
+
+    def send(self, request, **kwargs: Any) -> Response:
+        with self._stats_lock:
+            self.requests_sent += 1
+        return super().send(request, **kwargs)
 
 
 class AbstractRequester(Session, metaclass=abc.ABCMeta):
@@ -13,23 +66,47 @@ class AbstractRequester(Session, metaclass=abc.ABCMeta):
     functional (not abstract) and will:
 
     - prepend `first_part_url` to the provided `url`
-    - retry up to `retries` times
+    - try up to `retries` times, waiting between attempts as decided by the
+      `retry_policy`
     - return the first 2xx response
-    - raise `RuntimeError` after retries are exhausted
+    - raise `RuntimeError` when the request failed and can't be retried
+
+    Connections are pooled per host through a mounted `KeepAliveHTTPAdapter`.
+    The pool is sized with `pool_connections` (number of hosts to keep a pool
+    for) and `pool_maxsize` (connections kept per host). When several threads
+    share one requester, `pool_maxsize` should be at least the number of
+    threads, otherwise connections are discarded and re-opened (new TLS
+    handshake) on every request. Use `get_connection_stats` to verify reuse.
 
     Notes:
-        - This implements a *basic* retry strategy: it retries on non-2xx
-          responses and on `requests` exceptions, without backoff.
-        - If you need smarter retry behaviour (backoff, retry-only-on-specific
-          codes, etc.), override `_request_with_retries`.
+        - Only responses with a retryable status code (429, 5xx, ...) and
+          network exceptions are retried, with exponential backoff and jitter.
+          Other non-2xx responses (400, 404, ...) fail immediately.
+        - Retries are limited by the retry budget of the policy, so a batch job
+          doesn't multiply its load on the server during an outage.
     """
 
-    def __init__(self, first_part_url: str = "", retries: int = 3):
+    def __init__(self, first_part_url: str = "", retries: int = 3, pool_connections: int = 10,
+                 pool_maxsize: int = 10, pool_block: bool = False, keep_alive: bool = True,
+                 keep_alive_idle: Optional[int] = None, retry_policy: Optional[RetryPolicy] = None):
         """Create a requester.
 
         Args:
             first_part_url: Prefix added to every request URL.
             retries: Number of attempts for each request (must be >= 1).
+            pool_connections: Number of per-host connection pools to cache.
+            pool_maxsize: Maximum number of connections kept open per host.
+            pool_block: When True, block when all `pool_maxsize` connections
+                are in use instead of opening (and discarding) an extra one.
+            keep_alive: Reuse connections between requests and enable TCP
+                keep-alive on them. When False, every request is sent with
+                `Connection: close`.
+            keep_alive_idle: Seconds of idle time before the first TCP
+                keep-alive probe is sent (only on platforms supporting
+                `TCP_KEEPIDLE`). Defaults to the OS setting.
+            retry_policy: Decides which failures are retried and how long to
+                wait in between. Defaults to a new `RetryPolicy()` with its own
+                retry budget.
         """
         super().__init__()
         self.first_part_url = first_part_url
@@ -37,6 +114,56 @@ class AbstractRequester(Session, metaclass=abc.ABCMeta):
         if retries < 1:
             raise ValueError("retries must be at least 1")
         self.retries = retries
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError("pool_connections and pool_maxsize must be at least 1")
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+
+        socket_options = None
+        if keep_alive:
+            socket_options = HTTPConnection.default_socket_options + [
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+            if keep_alive_idle is not None and hasattr(socket, 'TCP_KEEPIDLE'):
+                socket_options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, keep_alive_idle))
+        else:
+            self.headers['Connection'] = 'close'
+
+        adapter = KeepAliveHTTPAdapter(socket_options=socket_options, pool_connections=pool_connections,
+                                       pool_maxsize=pool_maxsize, pool_block=pool_block)
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+
+    def get_connection_stats(self) -> dict[str, int]:
+        """Return connection reuse statistics of this requester.
+
+        Returns:
+            A dict with:
+                - `pools`: number of (host) connection pools currently cached
+                - `connections_opened`: number of sockets opened, reconnects
+                  of dropped pooled connections included
+                - `requests_sent`: number of requests sent
+                - `requests_on_reused_connections`: requests that did not need
+                  a new socket (`requests_sent - connections_opened`)
+        """
+        pools = 0
+        connections_opened = 0
+        requests_sent = 0
+        for adapter in set(self.adapters.values()):
+            if not isinstance(adapter, KeepAliveHTTPAdapter):
+                continue
+            pools += len(adapter.poolmanager.pools)
+            connections_opened += adapter.sockets_opened
+            requests_sent += adapter.requests_sent
+        return {
+            'pools': pools,
+            'connections_opened': connections_opened,
+            'requests_sent': requests_sent,
+            'requests_on_reused_connections': max(requests_sent - connections_opened, 0),
+        }
 
     def get(self, url: str = "", **kwargs: Any) -> Response:
         """Send a GET request with base URL + retries."""
@@ -77,21 +204,37 @@ class AbstractRequester(Session, metaclass=abc.ABCMeta):
             The first successful response (`Response.ok` is True).
 
         Raises:
-            RuntimeError: when all retries are exhausted.
+            RuntimeError: when the request failed and the retry policy doesn't
+                allow (another) retry.
         """
         full_url = f"{self.first_part_url}{url}"
+        policy = self.retry_policy
         last_response: Optional[Response] = None
         last_exception: Optional[BaseException] = None
+        attempts = 0
 
-        for _ in range(self.retries):
+        while attempts < self.retries:
+            attempts += 1
+            last_response = None
             try:
                 last_response = request_func(url=full_url, **kwargs)
             except RequestException as exc:
                 last_exception = exc
-                continue
+                if not policy.is_retryable_exception(exc):
+                    break
+            else:
+                if last_response.ok:
+                    policy.register_success()
+                    return last_response
+                if not policy.is_retryable_response(last_response):
+                    break
 
-            if last_response.ok:
-                return last_response
+            if attempts >= self.retries or not policy.allow_retry():
+                break
+            backoff = policy.get_backoff(attempts, last_response)
+            logging.debug(f"{method} {full_url} failed (attempt {attempts}), retrying in {backoff:.2f}s")
+            if backoff > 0:
+                policy.sleep(backoff)
 
         error_details = self._get_error_details_from_response(last_response)
         response_summary = str(last_response) if last_response is not None else "<no response>"
@@ -100,11 +243,11 @@ class AbstractRequester(Session, metaclass=abc.ABCMeta):
         )
 
         raise RuntimeError(
-            f"{method} request failed after {self.retries} retries. "
+            f"{method} request failed after {attempts} retries. "
             f"Last response: {response_summary}\n"
             f"Error details: {error_details}"
             f"{exception_summary}"
-        )
+        ) from last_exception
 
     def _get_error_details_from_response(self, response: Optional[Response]) -> object:
         """Extract the most useful error details from a response.
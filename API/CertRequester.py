@@ -6,8 +6,8 @@ from API.AbstractRequester import AbstractRequester
 
 
 class CertRequester(AbstractRequester):
-    def __init__(self, cert_path: str = None, key_path: str = None, first_part_url: str = ''):
-        super().__init__(first_part_url=first_part_url)
+    def __init__(self, cert_path: str = None, key_path: str = None, first_part_url: str = '', **kwargs):
+        super().__init__(first_part_url=first_part_url, **kwargs)
         
         if not Path(cert_path).exists():
             raise FileNotFoundError(f"{cert_path} is not a valid path. Cert file does not exist.")
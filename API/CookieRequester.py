@@ -4,8 +4,8 @@ from API.AbstractRequester import AbstractRequester
 
 
 class CookieRequester(AbstractRequester):
-    def __init__(self, cookie: str = '', first_part_url: str = ''):
-        super().__init__(first_part_url=first_part_url)
+    def __init__(self, cookie: str = '', first_part_url: str = '', **kwargs):
+        super().__init__(first_part_url=first_part_url, **kwargs)
         self.cookie = cookie
         self.headers.update({'Cookie': f'acm-awv={cookie}'})
 
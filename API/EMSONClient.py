@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from API.eminfra.EMInfraDomain import BaseDataclass
+from API.eminfra.Generic import read_ahead_generator
 from API.Enums import AuthType, Environment
 from API.RequesterFactory import RequesterFactory
 
@@ -15,9 +16,14 @@ class Query(BaseDataclass):
 
 
 class EMSONClient:
-    def __init__(self, auth_type: AuthType, env: Environment, settings_path: Path = None, cookie: str = None):
+    def __init__(self, auth_type: AuthType, env: Environment, settings_path: Path = None, cookie: str = None,
+                 **requester_kwargs):
+        """
+        :param requester_kwargs: connection settings forwarded to RequesterFactory.create_requester
+            (pool_connections, pool_maxsize, pool_block, keep_alive, keep_alive_idle, retry_policy)
+        """
         self.requester = RequesterFactory.create_requester(auth_type=auth_type, env=env, settings_path=settings_path,
-                                                           cookie=cookie)
+                                                           cookie=cookie, **requester_kwargs)
         self.requester.first_part_url += 'emson/'
 
     def get_asset_by_uuid(self, uuid: str) -> dict:
@@ -50,7 +56,8 @@ class EMSONClient:
             raise ProcessLookupError(response.content.decode("utf-8"))
         return response.json()
 
-    def get_assets_by_filter(self, filter: dict, size: int = 100, order_by_property: str = None) -> [dict]:
+    def get_assets_by_filter(self, filter: dict, size: int = 100, order_by_property: str = None,
+                             read_ahead: int = 0) -> [dict]:
         """See https://apps.mow.vlaanderen.be/emson/docs/#_post_emsonapiotlassetssearch for more details
         +---------------------+----------------------------------------+------------------------------------+\n
         |       Filter        |              Omschrijving              |                Type                |\n
@@ -69,20 +76,15 @@ class EMSONClient:
         | aangemaaktInContext | asset aangemaakt in context            | string of string[]                 |\n
         | gewijzigdInContext  | asset gewijzigd in context             | string of string[]                 |\n
         +---------------------+----------------------------------------+------------------------------------+
+
+        Set read_ahead to fetch up to that many pages in the background while the results are being processed.
         """
         query = Query(filters=filter, size=size, orderByProperty=order_by_property)
-        while True:
-            response = self.requester.post(url='api/otl/assets/search', data=query.json())
-            if response.status_code != 200:
-                print(response)
-                raise ProcessLookupError(response.content.decode("utf-8"))
-            yield from response.json()['@graph']
-            paging_cursor = response.headers.get('em-paging-next-cursor')
-            if paging_cursor is None:
-                break
-            query.fromCursor = paging_cursor
+        yield from read_ahead_generator(self._search_pages(url='api/otl/assets/search', query=query),
+                                        read_ahead=read_ahead)
 
-    def get_assetrelaties_by_filter(self, filter: dict, size: int = 100, order_by_property: str = None) -> [dict]:
+    def get_assetrelaties_by_filter(self, filter: dict, size: int = 100, order_by_property: str = None,
+                                    read_ahead: int = 0) -> [dict]:
         """
         +-----------+---------------------------------------------------------------------------------+--------------------+\n
         |  Filter   |                                  Omschrijving                                   |        Type        |\n
@@ -93,15 +95,21 @@ class EMSONClient:
         | doelAsset | Asset uuid of lijst van asset uuid’s, van assets die als doel voorkomen         | string of string[] |\n
         | asset     | Asset uuid of lijst van asset uuid’s, van assets die als bron of doel voorkomen | string of string[] |\n
         +-----------+---------------------------------------------------------------------------------+--------------------+
+
+        Set read_ahead to fetch up to that many pages in the background while the results are being processed.
         """
         query = Query(filters=filter, size=size, orderByProperty=order_by_property)
+        yield from read_ahead_generator(self._search_pages(url='api/otl/assetrelaties/search', query=query),
+                                        read_ahead=read_ahead)
+
+    def _search_pages(self, url: str, query: Query) -> Generator[list[dict]]:
         while True:
-            response = self.requester.post(url='api/otl/assetrelaties/search', data=query.json())
+            response = self.requester.post(url=url, data=query.json())
             if response.status_code != 200:
                 print(response)
                 raise ProcessLookupError(response.content.decode("utf-8"))
 
-            yield from response.json()['@graph']
+            yield response.json()['@graph']
             paging_cursor = response.headers.get('em-paging-next-cursor')
             if paging_cursor is None:
                 break
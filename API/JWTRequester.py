@@ -2,6 +2,7 @@ import datetime
 import json
 import logging
 import sys
+import threading
 from pathlib import Path
 
 from jwt import encode
@@ -17,7 +18,14 @@ from API.AbstractRequester import AbstractRequester
 
 
 class JWTRequester(AbstractRequester):
-    def __init__(self, private_key_path: Path, client_id: str, first_part_url: str = ''):
+    """Requester authenticating with an OAuth access token obtained with a JWT client assertion.
+
+    The requester can be shared by several threads: the private key is read and parsed once, only one thread
+    requests a new access token at a time and, once a token is within `refresh_ahead_seconds` of expiring, it is
+    refreshed in a background thread while requests keep using the current (still valid) token.
+    """
+    def __init__(self, private_key_path: Path, client_id: str, first_part_url: str = '',
+                 refresh_ahead_seconds: int = 120, **kwargs):
         if 'cryptography' not in sys.modules:
             raise ModuleNotFoundError('Needs module cryptography to work. Please install it with "pip install pyjwt cryptography"')
 
@@ -28,7 +36,12 @@ class JWTRequester(AbstractRequester):
         self.oauth_token: str = ''
         self.expires: datetime.datetime = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(seconds=1)
         self.requested_at: datetime.datetime = self.expires
-        super().__init__(first_part_url=first_part_url)
+        self.refresh_ahead = datetime.timedelta(seconds=refresh_ahead_seconds)
+
+        self._private_key = None
+        self._token_lock = threading.Lock()
+        self._background_refresh: threading.Thread | None = None
+        super().__init__(first_part_url=first_part_url, **kwargs)
 
     def get(self, url='', **kwargs) -> Response:
         kwargs = self.modify_kwargs_for_bearer_token(kwargs)
@@ -52,14 +65,55 @@ class JWTRequester(AbstractRequester):
         return super().delete(url=url, **kwargs)
 
     def get_oauth_token(self) -> str:
-        if self.expires > datetime.datetime.now(datetime.timezone.utc):
+        now = datetime.datetime.now(datetime.timezone.utc)
+        if self.expires > now:
+            if self.expires - self.refresh_ahead <= now:
+                self._start_background_refresh()
             return self.oauth_token
 
-        authentication_token = self.generate_authentication_token()
-        self.oauth_token, expires_in = self.get_access_token(authentication_token)
-        self.expires = self.requested_at + datetime.timedelta(seconds=expires_in) - datetime.timedelta(minutes=1)
+        with self._token_lock:
+            # another thread may have refreshed the token while this one was waiting for the lock
+            if self.expires <= datetime.datetime.now(datetime.timezone.utc):
+                self._refresh_oauth_token()
+            return self.oauth_token
 
-        return self.oauth_token
+    def _refresh_oauth_token(self) -> None:
+        """Request a new access token. Must be called while holding _token_lock."""
+        authentication_token = self.generate_authentication_token()
+        requested_at = self.requested_at
+        oauth_token, expires_in = self.get_access_token(authentication_token)
+        # set the token before the expiry, threads that read without the lock never see a new expiry with an old token
+        self.oauth_token = oauth_token
+        self.expires = requested_at + datetime.timedelta(seconds=expires_in) - datetime.timedelta(minutes=1)
+
+    def _start_background_refresh(self) -> None:
+        if not self._token_lock.acquire(blocking=False):
+            return  # a refresh is already in progress
+        try:
+            if self._background_refresh is not None and self._background_refresh.is_alive():
+                return
+            self._background_refresh = threading.Thread(target=self._background_refresh_oauth_token, daemon=True,
+                                                        name='JWTRequester-token-refresh')
+            self._background_refresh.start()
+        finally:
+            self._token_lock.release()
+
+    def _background_refresh_oauth_token(self) -> None:
+        with self._token_lock:
+            if self.expires - self.refresh_ahead > datetime.datetime.now(datetime.timezone.utc):
+                return
+            try:
+                self._refresh_oauth_token()
+            except Exception as exc:
+                # the current token is still valid, the next request will retry the refresh
+                logging.warning(f'Background refresh of the access token failed: {exc}')
+
+    def _get_private_key(self):
+        if self._private_key is None:
+            with open(self.private_key_path) as private_key:
+                private_key_json = json.load(private_key)
+            self._private_key = jwt_algo.RSAAlgorithm.from_jwk(private_key_json)
+        return self._private_key
 
     def modify_kwargs_for_bearer_token(self, kwargs: dict) -> dict:
         bearer_token = self.get_oauth_token()
@@ -93,12 +147,7 @@ class JWTRequester(AbstractRequester):
                    'jti': ''.join(choice(string.ascii_lowercase) for _ in range(20))
                    }
 
-        with open(self.private_key_path) as private_key:
-            private_key_json = json.load(private_key)
-            key = jwt_algo.RSAAlgorithm.from_jwk(private_key_json)
-            token = encode(payload=payload, key=key, algorithm='RS256')
-
-        return token
+        return encode(payload=payload, key=self._get_private_key(), algorithm='RS256')
 
     def get_access_token(self, token: str) -> (str, int):
         # Authorization access token generation
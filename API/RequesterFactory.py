@@ -5,6 +5,7 @@ from API.AbstractRequester import AbstractRequester
 from API.CertRequester import CertRequester
 from API.Enums import Environment, AuthType
 from API.JWTRequester import JWTRequester
+from API.RetryPolicy import RetryPolicy
 from API.CookieRequester import CookieRequester
 
 
@@ -17,15 +18,49 @@ class RequesterFactory:
     }
 
     @classmethod
-    def create_requester(cls, auth_type: AuthType, env: Environment, settings_path: Path = None, cookie: str = None) -> AbstractRequester:
+    def create_requester(cls, auth_type: AuthType, env: Environment, settings_path: Path = None, cookie: str = None,
+                         pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False,
+                         keep_alive: bool = True, keep_alive_idle: int = None,
+                         retry_policy: RetryPolicy = None) -> AbstractRequester:
+        """
+        Create a requester for the given authentication type and environment.
+
+        :param auth_type: authentication type
+        :type auth_type: AuthType
+        :param env: environment
+        :type env: Environment
+        :param settings_path: path to the settings file (required for JWT and CERT)
+        :type settings_path: Path
+        :param cookie: cookie value (required for COOKIE)
+        :type cookie: str
+        :param pool_connections: number of per-host connection pools to keep
+        :type pool_connections: int
+        :param pool_maxsize: maximum number of connections per host. Set this to at least the number of threads
+            sharing the requester.
+        :type pool_maxsize: int
+        :param pool_block: block when the pool is exhausted instead of opening extra connections
+        :type pool_block: bool
+        :param keep_alive: reuse connections and enable TCP keep-alive
+        :type keep_alive: bool
+        :param keep_alive_idle: seconds idle before the first TCP keep-alive probe. Defaults to the OS setting.
+        :type keep_alive_idle: int
+        :param retry_policy: backoff, retryable status codes and retry budget. Defaults to a new RetryPolicy.
+        :type retry_policy: RetryPolicy
+        :return: AbstractRequester
+        """
         first_part_url = cls.first_part_url_dict.get(env)
         if first_part_url is None:
             raise ValueError(f"Invalid environment: {env}")
 
+        connection_settings = {'pool_connections': pool_connections, 'pool_maxsize': pool_maxsize,
+                               'pool_block': pool_block, 'keep_alive': keep_alive,
+                               'keep_alive_idle': keep_alive_idle, 'retry_policy': retry_policy}
+
         if auth_type == AuthType.COOKIE:
             if cookie is None:
                 raise ValueError("argument cookie is required for COOKIE authentication")
-            return CookieRequester(cookie=cookie, first_part_url=first_part_url.replace('services.', ''))
+            return CookieRequester(cookie=cookie, first_part_url=first_part_url.replace('services.', ''),
+                                   **connection_settings)
 
         with open(settings_path) as settings_file:
             settings = json.load(settings_file)
@@ -34,10 +69,10 @@ class RequesterFactory:
         if auth_type == AuthType.JWT:
             return JWTRequester(private_key_path=specific_settings['key_path'],
                                 client_id=specific_settings['client_id'],
-                                first_part_url=first_part_url)
+                                first_part_url=first_part_url, **connection_settings)
         elif auth_type == AuthType.CERT:
             return CertRequester(cert_path=specific_settings['cert_path'],
                                  key_path=specific_settings['key_path'],
-                                 first_part_url=first_part_url)
+                                 first_part_url=first_part_url, **connection_settings)
         else:
             raise ValueError(f"Invalid authentication type: {auth_type}")
@@ -0,0 +1,116 @@
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional
+
+from requests import Response
+from requests.exceptions import ChunkedEncodingError, ConnectionError, Timeout
+
+
+class RetryBudget:
+    """A thread-safe token bucket limiting the number of retries of a client.
+
+    Every retry withdraws one token, every successful request deposits
+    `token_ratio` tokens (up to `max_tokens`). When the bucket is empty, failing
+    requests are no longer retried, so a client that mostly fails (e.g. during
+    an outage) stops multiplying its load on the server.
+    """
+
+    def __init__(self, max_tokens: float = 10.0, token_ratio: float = 0.1):
+        if max_tokens < 1:
+            raise ValueError("max_tokens must be at least 1")
+        if token_ratio < 0:
+            raise ValueError("token_ratio can't be negative")
+        self.max_tokens = max_tokens
+        self.token_ratio = token_ratio
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+    def try_withdraw(self) -> bool:
+        """Withdraw a token for a retry. Returns False when the budget is exhausted."""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def deposit(self) -> None:
+        """Register a successful request."""
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.token_ratio)
+
+
+@dataclass
+class RetryPolicy:
+    """Decides whether and when a failed request is retried.
+
+    The wait before retry n (1-based) is `backoff_factor * 2 ** (n - 1)`, capped
+    at `max_backoff`. With `jitter` the wait is drawn uniformly from [0, wait]
+    ("full jitter"), so clients that failed together don't retry together.
+    A `Retry-After` header on a retryable response overrides the computed wait
+    (still capped at `max_backoff`) when `respect_retry_after` is set.
+
+    Responses with a status code outside `retryable_status_codes` (e.g. 400,
+    404) are not retried. Of the exceptions, only the ones in
+    `retryable_exceptions` (network problems) are retried.
+
+    The `budget` is shared by all requests using this policy, a policy instance
+    should therefore not be shared between unrelated clients.
+    """
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    retryable_status_codes: frozenset[int] = frozenset({408, 429, 500, 502, 503, 504})
+    retryable_exceptions: tuple[type[BaseException], ...] = (ConnectionError, Timeout, ChunkedEncodingError)
+    respect_retry_after: bool = True
+    budget: Optional[RetryBudget] = field(default_factory=RetryBudget)
+    sleep: Callable[[float], None] = time.sleep
+
+    def is_retryable_response(self, response: Response) -> bool:
+        return response.status_code in self.retryable_status_codes
+
+    def is_retryable_exception(self, exception: BaseException) -> bool:
+        return isinstance(exception, self.retryable_exceptions)
+
+    def get_backoff(self, retry_number: int, response: Optional[Response] = None) -> float:
+        """Return the number of seconds to wait before the given retry (1-based)."""
+        if self.respect_retry_after and response is not None:
+            retry_after = self.parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+
+        backoff = min(self.backoff_factor * 2 ** (retry_number - 1), self.max_backoff)
+        if self.jitter:
+            return random.uniform(0, backoff)
+        return backoff
+
+    def allow_retry(self) -> bool:
+        return self.budget is None or self.budget.try_withdraw()
+
+    def register_success(self) -> None:
+        if self.budget is not None:
+            self.budget.deposit()
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse a Retry-After header value (delay in seconds or HTTP date) to seconds."""
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
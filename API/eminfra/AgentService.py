@@ -1,13 +1,15 @@
 from collections.abc import Generator
 from API.eminfra.EMInfraDomain import (QueryDTO, ExpressionDTO, TermDTO, OperatorEnum, LogicalOpEnum, SelectionDTO,
                                        PagingModeEnum, AgentDTO, BetrokkenerelatieDTO, AssetDTO)
+from API.eminfra.Generic import search_offset_paged_generator
 
 
 class AgentService:
     def __init__(self, requester):
         self.requester = requester
 
-    def search_agent(self, naam: str, ovocode: str = None, actief: bool = True) -> Generator[AgentDTO]:
+    def search_agent(self, naam: str, ovocode: str = None, actief: bool = True, prefetch_workers: int = 0) \
+            -> Generator[AgentDTO]:
         """
 
         :param naam: agent name
@@ -16,6 +18,8 @@ class AgentService:
         :type ovocode: str
         :param actief:
         :type actief: bool
+        :param prefetch_workers: number of threads fetching the pages concurrently. 0 (default) disables prefetching.
+        :type prefetch_workers: int
         :return: Generator[AgentDTO]
         :rtype:
         """
@@ -41,13 +45,8 @@ class AgentService:
                               , logicalOp=LogicalOpEnum.AND)
             )
         url = "core/api/agents/search"
-        while True:
-            json_dict = self.requester.post(url, data=query_dto.json()).json()
-            yield from [AgentDTO.from_dict(item) for item in json_dict['data']]
-            dto_list_total = json_dict['totalCount']
-            query_dto.from_ = json_dict['from'] + query_dto.size
-            if query_dto.from_ >= dto_list_total:
-                break
+        for item in search_offset_paged_generator(self.requester, url, query_dto, prefetch_workers=prefetch_workers):
+            yield AgentDTO.from_dict(item)
 
     def search_betrokkenerelaties(self, query_dto: QueryDTO) -> Generator[BetrokkenerelatieDTO]:
         query_dto.from_ = 0
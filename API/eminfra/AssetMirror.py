@@ -0,0 +1,166 @@
+import json
+import sqlite3
+from collections.abc import Generator, Iterable
+from datetime import datetime, timezone
+from pathlib import Path
+
+from API.eminfra.EMInfraDomain import (AssetDTO, EntryObject, EntryObjectContent, ExpressionDTO, FeedCheckpoint,
+                                       OperatorEnum, PagingModeEnum, QueryDTO, SelectionDTO, TermDTO)
+from API.eminfra.FeedService import FeedCheckpointStore
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS assets (
+    uuid TEXT PRIMARY KEY,
+    naam TEXT,
+    type_uri TEXT,
+    parent_uuid TEXT,
+    actief INTEGER,
+    json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS assets_naam ON assets (naam);
+CREATE INDEX IF NOT EXISTS assets_type_uri ON assets (type_uri);
+CREATE INDEX IF NOT EXISTS assets_parent_uuid ON assets (parent_uuid);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class SQLiteFeedCheckpointStore(FeedCheckpointStore):
+    """Keeps the checkpoint in the sync_state table of the mirror"""
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+
+    def load(self) -> FeedCheckpoint | None:
+        row = self.connection.execute("SELECT value FROM sync_state WHERE key = 'feed_checkpoint'").fetchone()
+        return None if row is None else FeedCheckpoint.from_dict(json.loads(row[0]))
+
+    def save(self, checkpoint: FeedCheckpoint) -> None:
+        with self.connection:
+            self.connection.execute("INSERT OR REPLACE INTO sync_state (key, value) VALUES ('feed_checkpoint', ?)",
+                                    (checkpoint.json(),))
+
+
+class AssetMirror:
+    """
+    Local SQLite copy of the EM-Infra assets. bootstrap fills it with a full scan of the assets, sync keeps it current
+    by following the feedproxy from where the previous sync (or the bootstrap) stopped.
+    Read-heavy scripts can look up assets by uuid, naam, type and parent without calling the API.
+    """
+    def __init__(self, eminfra_client, db_path: Path | str, feed_name: str = 'assets', page_size: int = 100):
+        """
+        :param eminfra_client: EMInfraClient used for the asset search and the feedproxy
+        :param db_path: path of the SQLite database, created if it doesn't exist
+        :param feed_name: name of the feedproxy feed with the asset events
+        :param page_size: amount of feed entries per feedproxy request
+        """
+        self.asset_service = eminfra_client.asset_service
+        self.feed_service = eminfra_client.feed_service
+        self.feed_name = feed_name
+        self.page_size = page_size
+        self.connection = sqlite3.connect(db_path)
+        self.connection.executescript(SCHEMA)
+        self.checkpoint_store = SQLiteFeedCheckpointStore(self.connection)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def bootstrap(self, prefetch_workers: int = 0) -> int:
+        """
+        Replace the content of the mirror with all assets. The feed position is determined before the scan, so changes
+        made during the scan are applied by the next sync.
+
+        :param prefetch_workers: number of threads fetching the pages of the asset search concurrently
+        :return: the amount of assets in the mirror
+        """
+        current_page = self.feed_service.get_current_feedproxy_page(self.feed_name)
+        feed_page_num, feed_page_size = self.feed_service.get_page_num_and_size(current_page)
+
+        query_dto = QueryDTO(size=100, from_=0, pagingMode=PagingModeEnum.OFFSET)
+        assets = self.asset_service.search_assets_generator(query_dto, prefetch_workers=prefetch_workers)
+        with self.connection:
+            self.connection.execute('DELETE FROM assets')
+            self._upsert_assets(assets)
+            self._set_state('bootstrapped', datetime.now(timezone.utc).isoformat())
+        # the same entries, counted in pages of our own page size
+        self.checkpoint_store.save(FeedCheckpoint(page_num=feed_page_num * feed_page_size // self.page_size,
+                                                  page_size=self.page_size))
+        return self.connection.execute('SELECT count(*) FROM assets').fetchone()[0]
+
+    def sync(self, poll_interval: float = None) -> int:
+        """
+        Apply the changes from the feedproxy since the last sync. The assets of every feed entry are fetched again,
+        so processing an entry twice (after a crash between applying a page and saving the checkpoint) does no harm.
+
+        :param poll_interval: seconds to wait for new entries at the end of the feed. None (default) returns there.
+        :return: the amount of feed entries processed
+        """
+        if self.checkpoint_store.load() is None:
+            raise ValueError('The mirror is not bootstrapped yet, call bootstrap first.')
+
+        entry_count = 0
+        for entries in self.feed_service.tail_feedproxy_pages(self.feed_name, self.checkpoint_store,
+                                                              page_size=self.page_size, poll_interval=poll_interval):
+            uuids = list(dict.fromkeys(uuid for entry in entries for uuid in self._get_asset_uuids(entry)))
+            with self.connection:
+                self._refresh_assets(uuids)
+                self._set_state('synced', datetime.now(timezone.utc).isoformat())
+            entry_count += len(entries)
+        return entry_count
+
+    def get_asset_by_uuid(self, uuid: str) -> AssetDTO | None:
+        row = self.connection.execute('SELECT json FROM assets WHERE uuid = ?', (uuid,)).fetchone()
+        return None if row is None else AssetDTO.from_dict(json.loads(row[0]))
+
+    def get_assets_by_naam(self, naam: str) -> Generator[AssetDTO]:
+        yield from self._select_assets('naam = ?', naam)
+
+    def get_assets_by_type(self, type_uri: str) -> Generator[AssetDTO]:
+        yield from self._select_assets('type_uri = ?', type_uri)
+
+    def get_assets_by_parent(self, parent_uuid: str) -> Generator[AssetDTO]:
+        yield from self._select_assets('parent_uuid = ?', parent_uuid)
+
+    def _select_assets(self, where: str, value: str) -> Generator[AssetDTO]:
+        for row in self.connection.execute(f'SELECT json FROM assets WHERE {where} ORDER BY uuid', (value,)):
+            yield AssetDTO.from_dict(json.loads(row[0]))
+
+    def _upsert_assets(self, assets: Iterable[AssetDTO]) -> None:
+        self.connection.executemany(
+            'INSERT OR REPLACE INTO assets (uuid, naam, type_uri, parent_uuid, actief, json) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            ((asset.uuid, asset.naam, asset.type.uri if asset.type is not None else None,
+              asset.parent.uuid if asset.parent is not None else None, asset.actief, asset.json())
+             for asset in assets))
+
+    def _refresh_assets(self, uuids: [str]) -> None:
+        """Fetch the assets again, the ones the search doesn't return anymore are removed."""
+        for i in range(0, len(uuids), 100):
+            chunk = uuids[i:i + 100]
+            query_dto = QueryDTO(size=100, from_=0, pagingMode=PagingModeEnum.OFFSET,
+                                 selection=SelectionDTO(expressions=[ExpressionDTO(
+                                     terms=[TermDTO(property='id', operator=OperatorEnum.IN, value=chunk)])]))
+            assets = list(self.asset_service.search_assets_generator(query_dto))
+            self._upsert_assets(assets)
+            found = {asset.uuid for asset in assets}
+            self.connection.executemany('DELETE FROM assets WHERE uuid = ?',
+                                        ((uuid,) for uuid in chunk if uuid not in found))
+
+    @staticmethod
+    def _get_asset_uuids(entry: EntryObject) -> list[str]:
+        value = entry.content.value if isinstance(entry.content, EntryObjectContent) else entry.content['value']
+        uuids = list(value.get('uuids') or [])
+        aggregate_id = value.get('aggregateId')
+        if aggregate_id is not None:
+            uuids.append(aggregate_id['uuid'])
+        return uuids
+
+    def _set_state(self, key: str, value: str) -> None:
+        self.connection.execute('INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)', (key, value))
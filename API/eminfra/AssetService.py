@@ -3,7 +3,8 @@ from collections.abc import Generator
 from API.eminfra.EMInfraDomain import (AssetDTO, AssetDTOToestand, QueryDTO, ExpressionDTO, TermDTO, OperatorEnum,
                                        LogicalOpEnum, ExpansionsDTO, SelectionDTO, PagingModeEnum, AssettypeDTO,
                                        RelatieEnum, BoomstructuurAssetTypeEnum, BeheerobjectDTO)
-from API.eminfra.Generic import get_kenmerktype_and_relatietype_id
+from API.eminfra.Generic import (get_kenmerktype_and_relatietype_id, search_offset_paged_generator,
+                                 read_ahead_generator)
 from API.eminfra.BeheerobjectService import BeheerobjectService
 
 
@@ -130,24 +131,22 @@ class AssetService:
     def deactiveer_asset(self, asset: AssetDTO) -> dict:
         return self._update_asset(asset=asset, actief=False)
 
-    def _search_assets_helper_generator(self, query_dto: QueryDTO) -> Generator[AssetDTO]:
+    def _search_assets_helper_generator(self, query_dto: QueryDTO, prefetch_workers: int = 0) \
+            -> Generator[AssetDTO]:
         query_dto.from_ = 0
         if query_dto.size is None:
             query_dto.size = 100
 
         url = "core/api/assets/search"
-        while True:
-            json_dict = self.requester.post(url, data=query_dto.json()).json()
-            yield from [AssetDTO.from_dict(item) for item in json_dict['data']]
-            dto_list_total = json_dict['totalCount']
-            query_dto.from_ = json_dict['from'] + query_dto.size
-            if query_dto.from_ >= dto_list_total:
-                break
+        for item in search_offset_paged_generator(self.requester, url, query_dto, prefetch_workers=prefetch_workers):
+            yield AssetDTO.from_dict(item)
 
-    def search_assets_generator(self, query_dto: QueryDTO, actief: bool = None) -> Generator[AssetDTO]:
+    def search_assets_generator(self, query_dto: QueryDTO, actief: bool = None, prefetch_workers: int = 0) \
+            -> Generator[AssetDTO]:
         """
         Search assets using a query.
         Status actief default None. Set status actief (boolean) to filter active or inactive assets.
+        Set prefetch_workers to fetch the pages concurrently with that many threads (the order is kept).
         """
         if actief is not None:
             query_dto.selection.expressions.append(
@@ -157,7 +156,7 @@ class AssetService:
                                    value=actief)
                            ], logicalOp=LogicalOpEnum.AND)
             )
-        yield from self._search_assets_helper_generator(query_dto)
+        yield from self._search_assets_helper_generator(query_dto, prefetch_workers=prefetch_workers)
 
     def search_asset_by_name_generator(self, asset_name: str, exact_search: bool = True) -> Generator[AssetDTO]:
         """
@@ -393,13 +392,14 @@ class AssetService:
         return self.create_asset_by_uuid(parent_asset_uuid=parent_asset.uuid, naam=naam,
                                          assettype=assettype, parent_assettype=parent_assettype)
 
-    def get_assets_by_filter_gen(self, filter: dict, size: int = 100) -> Generator[dict]:
+    def get_assets_by_filter_gen(self, filter: dict, size: int = 100, read_ahead: int = 0) -> Generator[dict]:
         """filter for otl/assets/search"""
-        yield from self.get_objects_from_oslo_search_endpoint_gen(url_part='assets', filter_dict=filter, size=size)
+        yield from self.get_objects_from_oslo_search_endpoint_gen(url_part='assets', filter_dict=filter, size=size,
+                                                                  read_ahead=read_ahead)
 
     def get_objects_from_oslo_search_endpoint_gen(self, url_part: str,
                                                   filter_dict: dict = '{}', size: int = 100,
-                                                  expansions_fields: [str] = None) -> Generator:
+                                                  expansions_fields: [str] = None, read_ahead: int = 0) -> Generator:
         """Returns Generator objects for each OSLO endpoint
 
         :param url_part: keyword to complete the url
@@ -410,14 +410,19 @@ class AssetService:
         :type size: int
         :param expansions_fields: additional fields to append to the results
         :type expansions_fields: [str]
+        :param read_ahead: amount of pages to fetch in the background while the results are being processed
+        :type read_ahead: int
         :return: Generator
         """
         body = {'size': size, 'fromCursor': None, 'filters': filter_dict, 'expansion': {"fields": []}}
         if expansions_fields:
             body['expansion']['fields'] = expansions_fields
-        paging_cursor = None
         url = f'core/api/otl/{url_part}/search'
+        yield from read_ahead_generator(self._get_pages_from_oslo_search_endpoint(url=url, body=body),
+                                        read_ahead=read_ahead)
 
+    def _get_pages_from_oslo_search_endpoint(self, url: str, body: dict) -> Generator[list[dict]]:
+        paging_cursor = None
         while True:
             # update fromCursor
             if paging_cursor:
@@ -428,7 +433,7 @@ class AssetService:
             decoded_string = response.content.decode("utf-8")
             dict_obj = json.loads(decoded_string)
 
-            yield from dict_obj["@graph"]
+            yield dict_obj["@graph"]
 
             if 'em-paging-next-cursor' in response.headers.keys():
                 paging_cursor = response.headers['em-paging-next-cursor']
@@ -0,0 +1,71 @@
+import json
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timezone
+from pathlib import Path
+
+from API.eminfra.EMInfraDomain import AssettypeDTO
+
+CATALOGUE_VERSION = 1
+
+
+class AssettypeCatalogue:
+    """
+    All assettypes (legacy and OTL), indexed by uri, uuid and korteUri so lookups don't need the API.
+    Load it once with AssettypeService.get_assettype_catalogue and save it to disk to reuse it in later runs.
+    The lookups return the AssettypeDTO objects of the catalogue itself, don't modify them.
+    """
+    def __init__(self, assettypes: Iterable[AssettypeDTO], created: str = None):
+        self.assettypes = list(assettypes)
+        self.created = created if created is not None else datetime.now(timezone.utc).isoformat()
+        self._by_uri = {assettype.uri: assettype for assettype in self.assettypes}
+        self._by_uuid = {assettype.uuid: assettype for assettype in self.assettypes}
+        self._by_korte_uri = {assettype.korteUri: assettype for assettype in self.assettypes}
+
+    def __len__(self) -> int:
+        return len(self.assettypes)
+
+    def __iter__(self) -> Iterator[AssettypeDTO]:
+        return iter(self.assettypes)
+
+    def __contains__(self, uri: str) -> bool:
+        return uri in self._by_uri
+
+    def get_by_uri(self, uri: str) -> AssettypeDTO | None:
+        return self._by_uri.get(uri)
+
+    def get_by_uuid(self, uuid: str) -> AssettypeDTO | None:
+        return self._by_uuid.get(uuid)
+
+    def get_by_korte_uri(self, korte_uri: str) -> AssettypeDTO | None:
+        """
+        :param korte_uri: e.g. 'onderdeel#Camera' or 'lgc:installatie#Kast'
+        :type korte_uri: str
+        """
+        return self._by_korte_uri.get(korte_uri)
+
+    def get_legacy_assettypes(self) -> list[AssettypeDTO]:
+        return [assettype for assettype in self.assettypes if assettype.korteUri.startswith('lgc:')]
+
+    def get_otl_assettypes(self) -> list[AssettypeDTO]:
+        return [assettype for assettype in self.assettypes if ':' not in assettype.korteUri]
+
+    def save(self, path: Path | str) -> None:
+        """Writes the catalogue to a json file"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CATALOGUE_VERSION, 'created': self.created,
+                       'assettypes': [assettype.asdict() for assettype in self.assettypes]}, f)
+
+    @classmethod
+    def load(cls, path: Path | str) -> 'AssettypeCatalogue':
+        """
+        Reads a catalogue written by save.
+
+        :raises ValueError: when the file was written by an other version of the catalogue
+        """
+        with open(path, encoding='utf-8') as f:
+            catalogue_dict = json.load(f)
+        if catalogue_dict.get('version') != CATALOGUE_VERSION:
+            raise ValueError(f'{path} is a catalogue of version {catalogue_dict.get("version")}, '
+                             f'expected version {CATALOGUE_VERSION}.')
+        return cls((AssettypeDTO.from_dict(item) for item in catalogue_dict['assettypes']),
+                   created=catalogue_dict['created'])
@@ -1,11 +1,14 @@
 from collections.abc import Generator
 from API.eminfra.EMInfraDomain import (AssettypeDTO, QueryDTO, PagingModeEnum, SelectionDTO, TermDTO,
                                        ExpressionDTO, OperatorEnum)
+from API.eminfra.AssettypeCatalogue import AssettypeCatalogue
+from API.eminfra.MetadataCache import MetadataCache
 
 
 class AssettypeService:
-    def __init__(self, requester):
+    def __init__(self, requester, cache: MetadataCache = None):
         self.requester = requester
+        self.cache = cache if cache is not None else MetadataCache(maxsize=0)
 
     def get_assettype(self, assettype_uuid: str) -> AssettypeDTO:
         """
@@ -24,10 +27,15 @@ class AssettypeService:
         """
         Search assettype by URI.
         One single Assettype is returned, based on an exact search of the URI.
+        The result is kept in the metadata cache.
         :param uri: assettype URI
         :type uri: str
         :return:
         """
+        item = self.cache.get_or_load(f'assettype:uri:{uri}', lambda: self._search_assettype(uri))
+        return AssettypeDTO.from_dict(item)
+
+    def _search_assettype(self, uri: str) -> dict:
         query_dto = QueryDTO(
             size=1,
             from_=0,
@@ -41,10 +49,9 @@ class AssettypeService:
         )
         url = "core/api/assettypes/search"
         json_dict = self.requester.post(url, data=query_dto.json()).json()
-        assettypes = [AssettypeDTO.from_dict(item) for item in json_dict['data']]
-        if len(assettypes) != 1:
+        if len(json_dict['data']) != 1:
             raise ValueError(f'Exactly one Assettype should be returned when searching for uri: "{uri}" Check URI.')
-        return assettypes[0]
+        return json_dict['data'][0]
 
     def get_all_assettypes_generator(self, size: int = 100) -> Generator[AssettypeDTO]:
         from_ = 0
@@ -66,4 +73,14 @@ class AssettypeService:
 
     def get_all_otl_assettypes_generator(self, size: int = 100) -> Generator[AssettypeDTO]:
         yield from [assettype_dto for assettype_dto in self.get_all_assettypes_generator(size)
-                    if ':' not in assettype_dto.korteUri]
\ No newline at end of file
+                    if ':' not in assettype_dto.korteUri]
+
+    def get_assettype_catalogue(self, size: int = 100) -> AssettypeCatalogue:
+        """
+        Loads all assettypes in an AssettypeCatalogue, for lookups by uri, uuid or korteUri without further API calls.
+
+        :param size: page size used to fetch the assettypes
+        :type size: int
+        :return: AssettypeCatalogue
+        """
+        return AssettypeCatalogue(self.get_all_assettypes_generator(size=size))
@@ -0,0 +1,155 @@
+import asyncio
+import functools
+import inspect
+from collections.abc import AsyncGenerator, Callable
+from itertools import islice
+from pathlib import Path
+
+from API.Enums import AuthType, Environment
+from API.eminfra.EMInfraClient import EMInfraClient
+
+
+class LoopSemaphore:
+    """asyncio.Semaphore that is created in the running event loop on first use.
+
+    This way the client can be built outside of the event loop it is used in (e.g. before asyncio.run). A new semaphore
+    is created when the client is used in another event loop.
+    """
+    def __init__(self, value: int):
+        self.value = value
+        self._semaphore = None
+        self._loop = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore, self._loop = asyncio.Semaphore(self.value), loop
+        return self._semaphore
+
+    async def __aenter__(self):
+        await self._get_semaphore().acquire()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self._semaphore.release()
+
+
+class AsyncCall:
+    """A call of a method of an AsyncService.
+
+    Await it for the return value, or iterate it with `async for` when the method returns a generator. The method is
+    called in a worker thread and a returned generator is drained in batches, so this works for generator functions as
+    well as for regular functions that return a generator.
+    """
+    def __init__(self, service: 'AsyncService', func: Callable, args: tuple, kwargs: dict):
+        self._service = service
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+
+    async def _call(self):
+        async with self._service._semaphore:
+            return await asyncio.to_thread(self._func, *self._args, **self._kwargs)
+
+    def __await__(self):
+        return self._call().__await__()
+
+    def __aiter__(self) -> AsyncGenerator:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncGenerator:
+        generator = await self._call()
+        if not inspect.isgenerator(generator):
+            raise TypeError(f"'async for' requires a method returning a generator, {self._func.__name__} returned "
+                            f"{type(generator).__name__}")
+        batch_size = self._service._generator_batch_size
+        try:
+            while True:
+                # pull a batch at a time, so there's a thread switch per batch instead of per item
+                async with self._service._semaphore:
+                    batch = await asyncio.to_thread(lambda: list(islice(generator, batch_size)))
+                for item in batch:
+                    yield item
+                if len(batch) < batch_size:
+                    return
+        finally:
+            generator.close()
+
+
+class AsyncService:
+    """Async view on a synchronous EM-Infra service.
+
+    Every public method of the wrapped service is available with the same name and arguments:
+    - await the methods for their result (`await service.get_asset_by_uuid(...)`)
+    - iterate the methods returning a generator with async for
+      (`async for asset in service.search_assets_generator(...)`)
+
+    The calls run in worker threads, at most `semaphore` calls of all services of a client at the same time.
+    """
+    def __init__(self, service: object, semaphore: asyncio.Semaphore | LoopSemaphore, generator_batch_size: int = 100):
+        self._service = service
+        self._semaphore = semaphore
+        self._generator_batch_size = generator_batch_size
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self._service, name)
+        if name.startswith('_') or not callable(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        def wrapper(*args, **kwargs) -> AsyncCall:
+            return AsyncCall(self, attribute, args, kwargs)
+        setattr(self, name, wrapper)
+        return wrapper
+
+
+class AsyncEMInfraClient:
+    """Async counterpart of EMInfraClient, with the same sub-services.
+
+    The services use the synchronous requester (with its authentication, connection pool and retry policy) in worker
+    threads, so many requests can be in flight from one event loop:
+
+        async with AsyncEMInfraClient(auth_type=AuthType.JWT, env=Environment.PRD, settings_path=path) as client:
+            assets = await asyncio.gather(*[client.asset_service.get_asset_by_uuid(uuid) for uuid in uuids])
+
+    `max_concurrency` limits the number of simultaneous requests (and sizes the connection pool accordingly).
+    """
+    service_names = ('agent_service', 'asset_service', 'assettype_service', 'beheerobject_service', 'bestek_service',
+                     'document_service', 'eigenschap_service', 'event_service', 'feed_service', 'geometrie_service',
+                     'graph_service', 'kenmerk_service', 'locatie_service', 'onderdeel_service', 'postit_service',
+                     'relatie_service', 'schadebeheerder_service', 'toezichter_service')
+
+    def __init__(self, auth_type: AuthType, env: Environment, settings_path: Path = None, cookie: str = None,
+                 max_concurrency: int = 10, generator_batch_size: int = 100, **requester_kwargs):
+        """
+        :param max_concurrency: maximum number of requests in flight at the same time
+        :type max_concurrency: int
+        :param generator_batch_size: number of items the async generators fetch per worker thread call
+        :type generator_batch_size: int
+        :param requester_kwargs: settings forwarded to RequesterFactory.create_requester. pool_maxsize defaults to
+            max_concurrency.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        requester_kwargs.setdefault('pool_maxsize', max_concurrency)
+        self.client = EMInfraClient(auth_type=auth_type, env=env, settings_path=settings_path, cookie=cookie,
+                                    **requester_kwargs)
+        self.requester = self.client.requester
+        self.max_concurrency = max_concurrency
+        self.semaphore = LoopSemaphore(max_concurrency)
+
+        for service_name in self.service_names:
+            setattr(self, service_name, AsyncService(getattr(self.client, service_name), self.semaphore,
+                                                     generator_batch_size=generator_batch_size))
+
+    async def get_oef_schema_as_json(self, name: str) -> str:
+        async with self.semaphore:
+            return await asyncio.to_thread(self.client.get_oef_schema_as_json, name)
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self.requester.close)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
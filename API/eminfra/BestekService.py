@@ -1,16 +1,21 @@
 import json
 import logging
+from collections.abc import Iterable
 from datetime import datetime
 
 from API.eminfra.EMInfraDomain import (BestekKoppeling, BestekRef, PagingModeEnum, SelectionDTO, OperatorEnum,
                                        ExpressionDTO, TermDTO, QueryDTO, BestekCategorieEnum,
-                                       BestekKoppelingStatusEnum, AssetDTO)
+                                       BestekKoppelingStatusEnum, AssetDTO, BestekKoppelingOperation,
+                                       BestekKoppelingOperationEnum, BulkUpdateResult, BulkUpdateStatusEnum)
+from API.eminfra.MetadataCache import MetadataCache
+from API.eminfra.Generic import asset_uuid_of, bulk_update
 from utils.date_helpers import validate_dates, format_datetime
 
 
 class BestekService:
-    def __init__(self, requester):
+    def __init__(self, requester, cache: MetadataCache = None):
         self.requester = requester
+        self.cache = cache if cache is not None else MetadataCache(maxsize=0)
         self.BESTEKKOPPELING_UUID = 'ee2e627e-bb79-47aa-956a-ea167d20acbd'
 
     def get_bestekkoppeling_by_uuid(self, asset_uuid: str) -> list[BestekKoppeling]:
@@ -42,6 +47,7 @@ class BestekService:
     def get_bestekref(self, eDelta_dossiernummer: str = None, eDelta_besteknummer: str = None) -> BestekRef | None:
         """
         Opzoeken van een BestekRef op basis van een dossiernummer of een besteknummer.
+        Het resultaat wordt bijgehouden in de metadata cache.
 
         :param eDelta_dossiernummer:
         :type eDelta_dossiernummer: str
@@ -59,43 +65,83 @@ class BestekService:
                              'be provided')
 
     def _get_bestekref_by_eDelta_dossiernummer(self, eDelta_dossiernummer: str) -> BestekRef | None:
-        query_dto = QueryDTO(size=10, from_=0, pagingMode=PagingModeEnum.OFFSET,
-                             selection=SelectionDTO(
-                                 expressions=[ExpressionDTO(
-                                     terms=[TermDTO(property='eDeltaDossiernummer',
-                                                    operator=OperatorEnum.EQ,
-                                                    value=eDelta_dossiernummer)])]))
-
-        response = self.requester.post('core/api/bestekrefs/search', data=query_dto.json())
-        if response.status_code != 200:
-            logging.error(response)
-            raise ProcessLookupError(response.content.decode("utf-8"))
-
-        bestekrefs_list = [BestekRef.from_dict(item) for item in response.json()['data']]
-        if len(bestekrefs_list) != 1:
-            raise ValueError(
-                f'Expected one single bestek for {eDelta_dossiernummer}. Got {len(bestekrefs_list)} instead.')
-        return bestekrefs_list[0]
+        return self._get_bestekref_by_property('eDeltaDossiernummer', eDelta_dossiernummer)
 
     def _get_bestekref_by_eDelta_besteknummer(self, eDelta_besteknummer: str) -> BestekRef | None:
-        query_dto = QueryDTO(size=10, from_=0, pagingMode=PagingModeEnum.OFFSET,
-                             selection=SelectionDTO(
-                                 expressions=[ExpressionDTO(
-                                     terms=[TermDTO(property='eDeltaBesteknummer',
-                                                    operator=OperatorEnum.EQ,
-                                                    value=eDelta_besteknummer)])]))
-
-        response = self.requester.post('core/api/bestekrefs/search', data=query_dto.json())
-        if response.status_code != 200:
-            logging.error(response)
-            raise ProcessLookupError(response.content.decode("utf-8"))
-
-        bestekrefs_list = [BestekRef.from_dict(item) for item in response.json()['data']]
-        if len(bestekrefs_list) != 1:
-            raise ValueError(
-                f'Expected one single bestek for {eDelta_besteknummer}. Got {len(bestekrefs_list)} instead.')
-        return bestekrefs_list[0]
-
+        return self._get_bestekref_by_property('eDeltaBesteknummer', eDelta_besteknummer)
+
+    def _get_bestekref_by_property(self, property_name: str, value: str) -> BestekRef:
+        """The bestekref of which property_name equals value, kept in the metadata cache"""
+        def search() -> dict:
+            bestekrefs_list = self._search_bestekrefs(property_name, OperatorEnum.EQ, value)
+            if len(bestekrefs_list) != 1:
+                raise ValueError(f'Expected one single bestek for {value}. Got {len(bestekrefs_list)} instead.')
+            return bestekrefs_list[0]
+
+        return BestekRef.from_dict(self.cache.get_or_load(f'bestekref:{property_name}:{value}', search))
+
+    def _search_bestekrefs(self, property_name: str, operator: OperatorEnum, value: str | list[str],
+                           size: int = 100) -> list[dict]:
+        bestekrefs_list = []
+        from_ = 0
+        while True:
+            query_dto = QueryDTO(size=size, from_=from_, pagingMode=PagingModeEnum.OFFSET,
+                                 selection=SelectionDTO(
+                                     expressions=[ExpressionDTO(
+                                         terms=[TermDTO(property=property_name,
+                                                        operator=operator,
+                                                        value=value)])]))
+
+            response = self.requester.post('core/api/bestekrefs/search', data=query_dto.json())
+            if response.status_code != 200:
+                logging.error(response)
+                raise ProcessLookupError(response.content.decode("utf-8"))
+
+            json_dict = response.json()
+            bestekrefs_list.extend(json_dict['data'])
+            from_ += size
+            if from_ >= json_dict.get('totalCount', 0):
+                return bestekrefs_list
+
+    def get_bestekrefs(self, eDelta_dossiernummers: Iterable[str] = None, eDelta_besteknummers: Iterable[str] = None,
+                       chunk_size: int = 100) -> dict[str, BestekRef]:
+        """
+        Opzoeken van veel BestekRefs in een beperkt aantal requests: de nummers die nog niet in de cache zitten worden
+        per chunk opgezocht met de IN operator. Daarna geeft get_bestekref deze BestekRefs terug zonder request.
+
+        :param eDelta_dossiernummers: dossiernummers
+        :type eDelta_dossiernummers: Iterable[str]
+        :param eDelta_besteknummers: besteknummers
+        :type eDelta_besteknummers: Iterable[str]
+        :param chunk_size: maximum number of nummers per search request
+        :type chunk_size: int
+        :return: the BestekRef per nummer, nummers without exactly one bestek are left out
+        :rtype: dict[str, BestekRef]
+        """
+        bestekrefs = {}
+        for property_name, nummers in (('eDeltaDossiernummer', eDelta_dossiernummers),
+                                       ('eDeltaBesteknummer', eDelta_besteknummers)):
+            missing = []
+            for nummer in dict.fromkeys(nummers or []):
+                item = self.cache.get(f'bestekref:{property_name}:{nummer}')
+                if item is None:
+                    missing.append(nummer)
+                else:
+                    bestekrefs[nummer] = BestekRef.from_dict(item)
+
+            for i in range(0, len(missing), chunk_size):
+                chunk = missing[i:i + chunk_size]
+                items_per_nummer: dict[str, list[dict]] = {}
+                for item in self._search_bestekrefs(property_name, OperatorEnum.IN, chunk):
+                    items_per_nummer.setdefault(item.get(property_name), []).append(item)
+                for nummer in chunk:
+                    items = items_per_nummer.get(nummer, [])
+                    if len(items) != 1:
+                        logging.warning(f'Expected one single bestek for {nummer}. Got {len(items)} instead.')
+                        continue
+                    self.cache.put(f'bestekref:{property_name}:{nummer}', items[0])
+                    bestekrefs[nummer] = BestekRef.from_dict(items[0])
+        return bestekrefs
 
     def change_bestekkoppelingen_by_uuid(self, asset_uuid: str, bestekkoppelingen: [BestekKoppeling]) -> None:
         """
@@ -352,4 +398,65 @@ class BestekService:
                                                     eDelta_besteknummer_new=eDelta_besteknummer_new,
                                                     eDelta_dossiernummer_new=eDelta_dossiernummer_new,
                                                     start_datetime=start_datetime, end_datetime=end_datetime,
-                                                    categorie=categorie)
\ No newline at end of file
+                                                    categorie=categorie)
+
+    def bulk_update_bestekkoppelingen(self, operations: Iterable[tuple[AssetDTO | str, BestekKoppelingOperation]],
+                                      workers: int = 0) -> list[BulkUpdateResult]:
+        """
+        Applies a list of (asset, operation) pairs. The operations of an asset are applied in order on its current
+        bestekkoppelingen, which are fetched once. Only assets of which the bestekkoppelingen change are updated, with
+        one PUT per asset. A failing asset is logged and reported, the other assets are still processed.
+
+        :param operations: pairs of an asset (or asset uuid) and the operation to apply on it
+        :type operations: Iterable[tuple[AssetDTO | str, BestekKoppelingOperation]]
+        :param workers: number of threads processing assets concurrently. 0 (default) processes them one by one.
+        :type workers: int
+        :return: one result per asset, in the order in which the assets first occur in operations
+        :rtype: list[BulkUpdateResult]
+        """
+        operations_per_asset: dict[str, list[BestekKoppelingOperation]] = {}
+        for asset, operation in operations:
+            operations_per_asset.setdefault(asset_uuid_of(asset), []).append(operation)
+
+        return bulk_update(list(operations_per_asset.items()), lambda item: self._update_bestekkoppelingen(*item),
+                           get_asset_uuid=lambda item: item[0], description='bestekkoppelingen', workers=workers)
+
+    def _update_bestekkoppelingen(self, asset_uuid: str, operations: [BestekKoppelingOperation]
+                                  ) -> BulkUpdateStatusEnum:
+        current = self.get_bestekkoppeling_by_uuid(asset_uuid=asset_uuid)
+        bestekkoppelingen = [BestekKoppeling.from_dict(k.asdict()) for k in current]
+        for operation in operations:
+            bestekkoppelingen = self._apply_bestekkoppeling_operation(bestekkoppelingen, operation)
+        if [k.asdict() for k in bestekkoppelingen] == [k.asdict() for k in current]:
+            return BulkUpdateStatusEnum.UNCHANGED
+        self.change_bestekkoppelingen_by_uuid(asset_uuid, bestekkoppelingen)
+        return BulkUpdateStatusEnum.UPDATED
+
+    @staticmethod
+    def _apply_bestekkoppeling_operation(bestekkoppelingen: [BestekKoppeling], operation: BestekKoppelingOperation
+                                         ) -> [BestekKoppeling]:
+        """Same behaviour as add_, end_ and adjust_date_bestekkoppeling, on a local list of bestekkoppelingen"""
+        bestek_ref_uuid = operation.bestekRef.uuid
+        matching_koppeling = next((k for k in bestekkoppelingen if k.bestekRef.uuid == bestek_ref_uuid), None)
+
+        if operation.operation == BestekKoppelingOperationEnum.ADD:
+            if matching_koppeling is None:
+                bestekkoppelingen.insert(operation.insert_index, BestekKoppeling(
+                    bestekRef=operation.bestekRef,
+                    status=BestekKoppelingStatusEnum.ACTIEF,
+                    startDatum=format_datetime(operation.start_datetime or datetime.now()),
+                    eindDatum=format_datetime(operation.end_datetime) if operation.end_datetime else None,
+                    categorie=operation.categorie))
+        elif operation.operation == BestekKoppelingOperationEnum.END:
+            if matching_koppeling is not None:
+                matching_koppeling.eindDatum = format_datetime(operation.end_datetime or datetime.now())
+        elif operation.operation == BestekKoppelingOperationEnum.ADJUST:
+            validate_dates(start_datetime=operation.start_datetime, end_datetime=operation.end_datetime)
+            if matching_koppeling is not None:
+                if operation.start_datetime:
+                    matching_koppeling.startDatum = format_datetime(operation.start_datetime)
+                if operation.end_datetime:
+                    matching_koppeling.eindDatum = format_datetime(operation.end_datetime)
+        elif operation.operation == BestekKoppelingOperationEnum.REMOVE:
+            bestekkoppelingen = [k for k in bestekkoppelingen if k.bestekRef.uuid != bestek_ref_uuid]
+        return bestekkoppelingen
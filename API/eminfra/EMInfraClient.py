@@ -13,6 +13,7 @@ from API.eminfra.GeometrieService import GeometrieService
 from API.eminfra.GraphService import GraphService
 from API.eminfra.KenmerkService import KenmerkService
 from API.eminfra.LocatieService import LocatieService
+from API.eminfra.MetadataCache import MetadataCache
 from API.eminfra.OnderdeelService import OnderdeelService
 from API.eminfra.PostitService import PostitService
 from API.eminfra.RelatieService import RelatieService
@@ -23,30 +24,39 @@ from API.Enums import AuthType, Environment
 from API.RequesterFactory import RequesterFactory
 
 class EMInfraClient:
-    def __init__(self, auth_type: AuthType, env: Environment, settings_path: Path = None, cookie: str = None):
+    def __init__(self, auth_type: AuthType, env: Environment, settings_path: Path = None, cookie: str = None,
+                 metadata_cache: MetadataCache = None, **requester_kwargs):
+        """
+        :param metadata_cache: cache for assettypes, kenmerktypes, eigenschappen, bestekrefs, identiteiten and
+            toezichtgroepen shared by the sub-services.
+            Defaults to an in-memory MetadataCache, pass MetadataCache(path=...) to keep the values between runs.
+        :param requester_kwargs: connection settings forwarded to RequesterFactory.create_requester
+            (pool_connections, pool_maxsize, pool_block, keep_alive, keep_alive_idle, retry_policy)
+        """
         self.requester = RequesterFactory.create_requester(auth_type=auth_type, env=env, settings_path=settings_path,
-                                                           cookie=cookie)
+                                                           cookie=cookie, **requester_kwargs)
         self.requester.first_part_url += 'eminfra/'
+        self.metadata_cache = metadata_cache if metadata_cache is not None else MetadataCache()
 
         # Sub-services
         self.agent_service = AgentService(self.requester)
         self.asset_service = AssetService(self.requester)
-        self.assettype_service = AssettypeService(self.requester)
+        self.assettype_service = AssettypeService(self.requester, cache=self.metadata_cache)
         self.beheerobject_service = BeheerobjectService(self.requester)
-        self.bestek_service = BestekService(self.requester)
+        self.bestek_service = BestekService(self.requester, cache=self.metadata_cache)
         self.document_service = DocumentService(self.requester)
-        self.eigenschap_service = EigenschapService(self.requester)
+        self.eigenschap_service = EigenschapService(self.requester, cache=self.metadata_cache)
         self.event_service = EventService(self.requester)
         self.feed_service = FeedService(self.requester)
         self.geometrie_service = GeometrieService(self.requester)
         self.graph_service = GraphService(self.requester)
-        self.kenmerk_service = KenmerkService(self.requester)
+        self.kenmerk_service = KenmerkService(self.requester, cache=self.metadata_cache)
         self.locatie_service = LocatieService(self.requester)
         self.onderdeel_service = OnderdeelService(self.requester)
         self.postit_service = PostitService(self.requester)
         self.relatie_service = RelatieService(self.requester)
         self.schadebeheerder_service = SchadebeheerderService(self.requester)
-        self.toezichter_service = ToezichterService(self.requester)
+        self.toezichter_service = ToezichterService(self.requester, cache=self.metadata_cache)
 
     def get_oef_schema_as_json(self, name: str) -> str:
         url = f"core/api/otl/schema/oef/{name}"
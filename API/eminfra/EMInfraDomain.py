@@ -1,30 +1,11 @@
 import dataclasses
 import json
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
+from datetime import datetime
 from enum import Enum
 from json import dumps
-from typing import Optional
-
-_asdict_inner_actual = dataclasses._asdict_inner
-def _asdict_inner(obj, dict_factory):
-
-    # if override exists, intercept and return that instead
-    if dataclasses._is_dataclass_instance(obj):
-        if getattr(obj, '__dict_factory_override__', None):
-            user_dict = obj.__dict_factory_override__()
-
-            for k, v in user_dict.items(): # in case of further nesting
-                if isinstance(v, list) and len(v) > 0 and dataclasses._is_dataclass_instance(v[0]):
-                    user_dict[k] = [_asdict_inner(vv, dict_factory) for vv in v]
-                if dataclasses._is_dataclass_instance(v):
-                    user_dict[k] = _asdict_inner(v, dict_factory)
-            return user_dict
-
-    # otherwise do original behavior
-    return _asdict_inner_actual(obj, dict_factory)
-dataclasses._asdict_inner = _asdict_inner
-asdict = dataclasses.asdict
-
+from typing import ClassVar, Optional
 
 class OperatorEnum(Enum):
     EQ = 'EQ'
@@ -86,7 +67,10 @@ class KenmerkTypeEnum(Enum):
     ELEKTRISCH_AANSLUITPUNT = 'Elektrisch aansluitpunt'
     VTC = 'VTC'
 
-RESERVED_WORD_LIST = ('from_', '_next')
+# keys in the API responses that are stored in a field with a different name
+RESERVED_WORD_RENAMES = {'from': 'from_', 'next': '_next'}
+# the json key of these fields
+RESERVED_WORD_KEYS = {name: key for key, name in RESERVED_WORD_RENAMES.items()}
 
 class RelatieEnum(Enum):
     """
@@ -118,47 +102,54 @@ class RelatieEnum(Enum):
 
 @dataclass
 class BaseDataclass:
-    def __dict_factory_override__(self):
-        normal_dict = {k: getattr(self, k) for k in self.__dataclass_fields__}
-        d = {}
-        for k, v in normal_dict.items():
-            if k in RESERVED_WORD_LIST:
-                k = k[:-1]
-
-            d[k] = v.value if isinstance(v, Enum) else v
-        return d
-
-    def asdict(self):
-        return asdict(self)
+    def asdict(self) -> dict:
+        """
+        get a dict that can be serialized to json: nested classes are converted to dicts, enums to their values and
+        the reserved words are renamed to the keys the API uses
+        """
+        return _serialize(self)
 
     def json(self):
         """
         get the json formatted string
         """
-        d = self.asdict()
-        return dumps(self.asdict())
+        return dumps(_serialize(self))
+
+    # conversion of the values of fields after construction, per field name:
+    # a nested dict to a class, a list of dicts to a list of a class, a value to an enum member
+    _nested_classes: ClassVar[dict[str, type]] = {}
+    _nested_list_classes: ClassVar[dict[str, type]] = {}
+    _enums: ClassVar[dict[str, type[Enum]]] = {}
+
+    def __post_init__(self):
+        self._fix_nested_classes(self._nested_classes.items())
+        self._fix_enums(self._enums.items())
+        self._fix_nested_list_classes(self._nested_list_classes.items())
 
     @classmethod
     def from_dict(cls, dict_: dict):
-        for k in list(dict_.keys()):
-            if k in RESERVED_WORD_LIST:
-                dict_[f'{k}_'] = dict_[k]
-                del dict_[k]
-        return cls(**dict_)
+        """
+        Create an instance from a dict (a decoded json response). The dict is not modified.
+        Nested classes and enums are converted in the same pass, using a decoder that is built once per class.
+        """
+        decoder = _decoders.get(cls)
+        if decoder is None:
+            decoder = _get_decoder(cls)
+        return decoder(dict_)
 
-    def _fix_enums(self, list_of_fields: set[tuple[str, type]]):
+    def _fix_enums(self, list_of_fields: Iterable[tuple[str, type]]):
         for field_tuple in list_of_fields:
             attr = getattr(self, field_tuple[0])
             if attr is not None:
                 setattr(self, field_tuple[0], field_tuple[1](attr))
 
-    def _fix_nested_classes(self, list_of_fields: set[tuple[str, type]]):
+    def _fix_nested_classes(self, list_of_fields: Iterable[tuple[str, type]]):
         for field_tuple in list_of_fields:
             attr = getattr(self, field_tuple[0])
             if attr is not None and isinstance(attr, dict):
                 setattr(self, field_tuple[0], field_tuple[1].from_dict(attr))
 
-    def _fix_nested_list_classes(self, list_of_fields: set[tuple[str, type]]):
+    def _fix_nested_list_classes(self, list_of_fields: Iterable[tuple[str, type]]):
         for field_tuple in list_of_fields:
             attr = getattr(self, field_tuple[0])
             if attr is not None and isinstance(attr, list) and len(attr) > 0 and isinstance(attr[0], dict):
@@ -191,6 +182,139 @@ class BaseDataclass:
     #             delattr(self, field.name)
 
 
+_decoders: dict[type, Callable[[dict], BaseDataclass]] = {}
+_decoders_building: set[type] = set()
+
+
+def _get_decoder(cls: type) -> Callable[[dict], BaseDataclass]:
+    decoder = _decoders.get(cls)
+    if decoder is None:
+        _decoders_building.add(cls)
+        try:
+            decoder = _decoders[cls] = _build_decoder(cls)
+        finally:
+            _decoders_building.discard(cls)
+    return decoder
+
+
+def _nested_decoder(nested_class: type) -> Callable[[dict], BaseDataclass]:
+    # a class that (indirectly) nests itself can't use its own decoder while it is being built
+    if nested_class in _decoders_building:
+        return nested_class.from_dict
+    return _get_decoder(nested_class)
+
+
+def _build_decoder(cls: type) -> Callable[[dict], BaseDataclass]:
+    """
+    Generates a function that creates an instance of cls from a dict, equivalent to cls(**dict_) with the reserved
+    word renames, but converting the nested classes and enums of cls._nested_classes, cls._nested_list_classes and
+    cls._enums while setting the fields, instead of afterwards in the reflective __post_init__.
+    A __post_init__ defined by cls itself is still called.
+    """
+    fields = [f for f in dataclasses.fields(cls) if f.init]
+    field_names = {f.name for f in fields}
+    renames = {name: key for key, name in RESERVED_WORD_RENAMES.items() if name in field_names and key not in field_names}
+    namespace = {'cls': cls, 'MISSING': dataclasses.MISSING, 'new_instance': object.__new__,
+                 'valid_keys': frozenset(field_names) | frozenset(renames.values()),
+                 'invalid_dict': _raise_invalid_dict}
+
+    lines = ['def decode(d):',
+             '    if not d.keys() <= valid_keys:',
+             '        invalid_dict(cls, d, valid_keys)',
+             '    instance = new_instance(cls)',
+             '    try:']
+    for index, f in enumerate(fields):
+        if f.default is not dataclasses.MISSING:
+            namespace[f'default_{index}'] = f.default
+            missing = f'default_{index}'
+        elif f.default_factory is not dataclasses.MISSING:
+            namespace[f'default_factory_{index}'] = f.default_factory
+            missing = f'default_factory_{index}()'
+        else:
+            missing = None
+
+        key = renames.get(f.name)
+        if key is not None:
+            value = f"d[{key!r}] if {key!r} in d else d[{f.name!r}]"
+            if missing is not None:
+                value = f"d[{key!r}] if {key!r} in d else d.get({f.name!r}, MISSING)"
+        elif missing is None:
+            value = f"d[{f.name!r}]"
+        else:
+            value = f"d.get({f.name!r}, MISSING)"
+        lines.append(f'        value = {value}')
+        if missing is not None:
+            lines.append(f'        if value is MISSING:')
+            lines.append(f'            value = {missing}')
+
+        if f.name in cls._nested_classes:
+            namespace[f'nested_{index}'] = _nested_decoder(cls._nested_classes[f.name])
+            lines.append(f'        if value.__class__ is dict:')
+            lines.append(f'            value = nested_{index}(value)')
+        elif f.name in cls._nested_list_classes:
+            namespace[f'nested_{index}'] = _nested_decoder(cls._nested_list_classes[f.name])
+            lines.append(f'        if value.__class__ is list and value and value[0].__class__ is dict:')
+            lines.append(f'            value = [nested_{index}(item) for item in value]')
+        if f.name in cls._enums:
+            namespace[f'enum_{index}'] = cls._enums[f.name]
+            lines.append(f'        if value is not None:')
+            lines.append(f'            value = enum_{index}(value)')
+        lines.append(f'        instance.{f.name} = value')
+    if not fields:
+        lines.append('        pass')
+    lines.extend(['    except KeyError:',
+                  '        invalid_dict(cls, d, valid_keys)'])
+    if cls.__post_init__ is not BaseDataclass.__post_init__:
+        lines.append('    instance.__post_init__()')
+    lines.append('    return instance')
+
+    exec('\n'.join(lines), namespace)
+    return namespace['decode']
+
+
+def _raise_invalid_dict(cls: type, dict_: dict, valid_keys: frozenset):
+    """Raises the TypeError cls(**dict_) would raise."""
+    for key in dict_:
+        if key not in valid_keys:
+            raise TypeError(f"{cls.__qualname__}.__init__() got an unexpected keyword argument '{key}'")
+    missing = [f.name for f in dataclasses.fields(cls)
+               if f.init and f.default is dataclasses.MISSING and f.default_factory is dataclasses.MISSING
+               and f.name not in dict_ and RESERVED_WORD_KEYS.get(f.name) not in dict_]
+    raise TypeError(f"{cls.__qualname__}.__init__() missing {len(missing)} required argument(s): "
+                    f"{', '.join(repr(name) for name in missing)}")
+
+
+_serialized_fields: dict[type, tuple[tuple[str, str], ...]] = {}
+_JSON_PRIMITIVES = frozenset((str, int, float, bool, type(None)))
+
+
+def _get_serialized_fields(cls: type) -> tuple[tuple[str, str], ...]:
+    """The (field name, json key) pairs of cls, computed once per class."""
+    fields = _serialized_fields.get(cls)
+    if fields is None:
+        fields = _serialized_fields[cls] = tuple(
+            (f.name, RESERVED_WORD_KEYS.get(f.name, f.name)) for f in dataclasses.fields(cls))
+    return fields
+
+
+def _serialize(value):
+    """Converts a value to something json.dumps accepts, without copying the json primitives."""
+    if value.__class__ in _JSON_PRIMITIVES:
+        return value
+    if isinstance(value, BaseDataclass):
+        fields = _serialized_fields.get(value.__class__) or _get_serialized_fields(value.__class__)
+        return {key: _serialize(getattr(value, name)) for name, key in fields}
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, list):
+        return [_serialize(item) for item in value]
+    if isinstance(value, dict):
+        return {k: _serialize(v) for k, v in value.items()}
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    return value
+
+
 @dataclass
 class Link(BaseDataclass):
     rel: str
@@ -202,8 +326,7 @@ class ResourceRefDTO(BaseDataclass):
     uuid: str
     links: Optional[list[Link]] = None
 
-    def __post_init__(self):
-        self._fix_nested_list_classes({('links', Link)})
+    _nested_list_classes = {'links': Link}
 
 
 @dataclass
@@ -233,16 +356,14 @@ class AssettypeDTO(BaseDataclass):
     label: str | None = None
     data: dict | None = None
 
-    def __post_init__(self):
-        self._fix_nested_list_classes({('links', Link)})
+    _nested_list_classes = {'links': Link}
 
 
 @dataclass
 class AssettypeDTOList(DTOList):
     data: list[AssettypeDTO]
 
-    def __post_init__(self):
-        self._fix_nested_list_classes({('data', AssettypeDTO)})
+    _nested_list_classes = {'data': AssettypeDTO}
 
 
 @dataclass
@@ -259,8 +380,7 @@ class ExpressionDTO(BaseDataclass):
     terms: list[dict] | list[TermDTO]
     logicalOp: LogicalOpEnum | None = None
 
-    def __post_init__(self):
-        self._fix_nested_list_classes({('terms', TermDTO)})
+    _nested_list_classes = {'terms': TermDTO}
 
 
 @dataclass
@@ -268,8 +388,7 @@ class SelectionDTO(BaseDataclass):
     expressions: list[dict] | list[ExpressionDTO]
     settings: dict | None = None
 
-    def __post_init__(self):
-        self._fix_nested_list_classes({('expressions', ExpressionDTO)})
+    _nested_list_classes = {'expressions': ExpressionDTO}
 
 
 @dataclass
@@ -313,11 +432,13 @@ class QueryDTO(BaseDataclass):
     orderByDirection: DirectionEnum | None = None
     pagingMode: PagingModeEnum | None = None
 
+    _nested_classes = {'selection': SelectionDTO, 'expansions': ExpansionsDTO}
+    _enums = {'pagingMode': PagingModeEnum}
+
     def __post_init__(self):
         if self.settings is None:
             self.settings = {}
-        self._fix_enums({('pagingMode', PagingModeEnum)})
-        self._fix_nested_classes({('selection', SelectionDTO), ('expansions', ExpansionsDTO)})
+        super().__post_init__()
 
 
 
@@ -337,8 +458,7 @@ class BestekRef(BaseDataclass):
     nummer: str | None = None
     lot: str | None = None
 
-    def __post_init__(self):
-        self._fix_nested_list_classes({('links', Link)})
+    _nested_list_classes = {'links': Link}
 
 
 class BestekCategorieEnum(Enum):
@@ -362,9 +482,51 @@ class BestekKoppeling(BaseDataclass):
     subcategorie: SubCategorieEnum | None = None
     bron: str | None = None
 
-    def __post_init__(self):
-        self._fix_enums({('categorie', BestekCategorieEnum), ('subcategorie', SubCategorieEnum), ('status', BestekKoppelingStatusEnum)})
-        self._fix_nested_classes({('bestekRef', BestekRef)})
+    _nested_classes = {'bestekRef': BestekRef}
+    _enums = {'categorie': BestekCategorieEnum, 'subcategorie': SubCategorieEnum, 'status': BestekKoppelingStatusEnum}
+
+
+class BestekKoppelingOperationEnum(Enum):
+    ADD = 'ADD'
+    END = 'END'
+    ADJUST = 'ADJUST'
+    REMOVE = 'REMOVE'
+
+
+@dataclass
+class BestekKoppelingOperation:
+    """
+    One change to the bestekkoppelingen of an asset, see BestekService.bulk_update_bestekkoppelingen.
+    ADD uses all fields, END the end_datetime (default now), ADJUST the given dates and REMOVE only the bestekRef.
+    """
+    operation: BestekKoppelingOperationEnum
+    bestekRef: BestekRef
+    start_datetime: datetime | None = None
+    end_datetime: datetime | None = None
+    categorie: BestekCategorieEnum = BestekCategorieEnum.WERKBESTEK
+    insert_index: int = 0
+
+
+class BulkUpdateStatusEnum(Enum):
+    UPDATED = 'UPDATED'
+    UNCHANGED = 'UNCHANGED'
+    FAILED = 'FAILED'
+
+
+@dataclass
+class BulkUpdateResult:
+    """Outcome of a bulk update for one asset"""
+    asset_uuid: str
+    status: BulkUpdateStatusEnum
+    error: str | None = None
+
+
+@dataclass
+class BulkAssetRelatieSummary:
+    """Outcome of RelatieService.create_assetrelaties_if_missing"""
+    existing: int = 0
+    created: list[str] = dataclasses.field(default_factory=list)
+    failed: dict[tuple[str, str, RelatieEnum], str] = dataclasses.field(default_factory=dict)
 
 @dataclass
 class EventType(BaseDataclass):
@@ -377,8 +539,7 @@ class EventContext(BaseDataclass):
     omschrijving: str
     links: [Link]
 
-    def __post_init__(self):
-        self._fix_nested_classes({('links', Link)})
+    _nested_classes = {'links': Link}
 
 @dataclass
 class Event(BaseDataclass):
@@ -389,8 +550,7 @@ class Event(BaseDataclass):
     data: dict
     links: [Link]
 
-    def __post_init__(self):
-        self._fix_nested_classes({('type', EventType), ('links', Link)})
+    _nested_classes = {'type': EventType, 'links': Link}
 
 @dataclass
 class LocatieKenmerk(BaseDataclass):
@@ -402,8 +562,7 @@ class LocatieKenmerk(BaseDataclass):
     omschrijving: str | None = None
     relatie: dict | None = None
 
-    def __post_init__(self):
-         self._fix_nested_list_classes({('links', Link)})
+    _nested_list_classes = {'links': Link}
 
 @dataclass
 class ElektrischAansluitpuntKenmerk(BaseDataclass):
@@ -412,8 +571,7 @@ class ElektrischAansluitpuntKenmerk(BaseDataclass):
     links: [Link]
     elektriciteitsAansluitingRef: dict | None = None
 
-    def __post_init__(self):
-         self._fix_nested_list_classes({('links', Link)})
+    _nested_list_classes = {'links': Link}
 
 
 
@@ -428,8 +586,7 @@ class GeometryLog(BaseDataclass):
     overervingen: list[dict] | None = None
     gaVersie: str | None = None
 
-    def __post_init__(self):
-         self._fix_nested_list_classes({('links', Link)})
+    _nested_list_classes = {'links': Link}
 
 
 @dataclass
@@ -439,8 +596,7 @@ class GeometrieKenmerk(BaseDataclass):
     links: [Link]
     logs: list[GeometryLog] | None = None
 
-    def __post_init__(self):
-         self._fix_nested_list_classes({('links', Link), ('logs', GeometryLog)})
+    _nested_list_classes = {'links': Link, 'logs': GeometryLog}
 
 @dataclass
 class ToezichterKenmerk(BaseDataclass):
@@ -450,17 +606,15 @@ class ToezichterKenmerk(BaseDataclass):
     toezichter: ResourceRefDTO | None = None
     toezichtGroep: ResourceRefDTO | None = None
 
-    def __post_init__(self):
-         self._fix_nested_classes({('toezichter', ResourceRefDTO), ('toezichtGroep', ResourceRefDTO)})
-         self._fix_nested_list_classes({('links', Link)})
+    _nested_classes = {'toezichter': ResourceRefDTO, 'toezichtGroep': ResourceRefDTO}
+    _nested_list_classes = {'links': Link}
 
 @dataclass
 class ToezichtKenmerkUpdateDTO(BaseDataclass):
     toezichter: ResourceRefDTO | None
     toezichtGroep: ResourceRefDTO | None
 
-    def __post_init__(self):
-         self._fix_nested_classes({('toezichter', ResourceRefDTO), ('toezichtGroep', ResourceRefDTO)})
+    _nested_classes = {'toezichter': ResourceRefDTO, 'toezichtGroep': ResourceRefDTO}
 
 @dataclass
 class SchadebeheerderKenmerk(BaseDataclass):
@@ -478,8 +632,7 @@ class SchadebeheerderKenmerk(BaseDataclass):
     aanspreking: str | None = None
     links: list[Link] | None = None
 
-    def __post_init__(self):
-         self._fix_nested_list_classes({('links', Link)})
+    _nested_list_classes = {'links': Link}
 
 @dataclass
 class IdentiteitKenmerk(BaseDataclass):
@@ -499,8 +652,7 @@ class IdentiteitKenmerk(BaseDataclass):
     functie: str | None = None
     links: list[Link] | None = None
 
-    def __post_init__(self):
-         self._fix_nested_list_classes({('links', Link)})
+    _nested_list_classes = {'links': Link}
 
 @dataclass
 class Generator(BaseDataclass):
@@ -522,9 +674,8 @@ class EntryObject(BaseDataclass):
     _type: str
     links: list[Link] | None = None
 
-    def __post_init__(self):
-        self._fix_nested_classes({('content', EntryObjectContent)})
-        self._fix_nested_list_classes({('links', Link)})
+    _nested_classes = {'content': EntryObjectContent}
+    _nested_list_classes = {'links': Link}
 
 
 @dataclass
@@ -537,9 +688,16 @@ class FeedPage(BaseDataclass):
     links: list[Link] | None = None
     entries: list[EntryObject] | None = None
 
-    def __post_init__(self):
-        self._fix_nested_classes({('generator', Generator)})
-        self._fix_nested_list_classes({('links', Link), ('entries', EntryObject)})
+    _nested_classes = {'generator': Generator}
+    _nested_list_classes = {'links': Link, 'entries': EntryObject}
+
+
+@dataclass
+class FeedCheckpoint(BaseDataclass):
+    """Position in a feedproxy feed: the page (in pages of page_size) and the last processed entry on that page"""
+    page_num: int
+    page_size: int
+    entry_id: str | None = None
 
 class AssetDTOToestand(Enum):
     IN_ONTWERP = 'IN_ONTWERP'
@@ -575,8 +733,7 @@ class InfraObjectDTO(BaseDataclass):
     commentaar: str | None = None
     type: str | None = None
 
-    def __post_init__(self):
-        self._fix_nested_list_classes({('links', Link)})
+    _nested_list_classes = {'links': Link}
 
 
 @dataclass
@@ -596,11 +753,9 @@ class AssetDTO(BaseDataclass):
     authorizationMetadata: list[dict] | None = None # TODO
     children: list[dict] | None = None
 
-    def __post_init__(self):
-        self._fix_nested_classes({('type', AssettypeDTO)})
-        self._fix_nested_classes({('parent', InfraObjectDTO)})
-        self._fix_enums({('toestand', AssetDTOToestand)})
-        self._fix_nested_list_classes({('links', Link)})
+    _nested_classes = {'type': AssettypeDTO, 'parent': InfraObjectDTO}
+    _nested_list_classes = {'links': Link}
+    _enums = {'toestand': AssetDTOToestand}
 
 @dataclass
 class BeheerobjectDTO(BaseDataclass):
@@ -613,8 +768,7 @@ class BeheerobjectDTO(BaseDataclass):
     naam: str | None = None
     type: dict | None = None
 
-    def __post_init__(self):
-        self._fix_nested_list_classes({('links', Link)})
+    _nested_list_classes = {'links': Link}
 
 @dataclass
 class BeheerobjectTypeDTO(BaseDataclass):
@@ -627,8 +781,7 @@ class BeheerobjectTypeDTO(BaseDataclass):
     definitie: str
     links: [Link]
 
-    def __post_init__(self):
-        self._fix_nested_list_classes({('links', Link)})
+    _nested_list_classes = {'links': Link}
 
 class DocumentCategorieEnum(Enum):
     AANGEBODEN_SERVICES = 'AANGEBODEN_SERVICES'
@@ -679,8 +832,7 @@ class ResourceRefDTO(BaseDataclass):
     uuid: str
     links: Optional[list[Link]] = None
 
-    def __post_init__(self):
-        self._fix_nested_list_classes({('links', Link)})
+    _nested_list_classes = {'links': Link}
 
 
 @dataclass
@@ -696,10 +848,8 @@ class AssetDocumentDTO(BaseDataclass):
         # Hash based on name and value
         return hash(self.uuid)
 
-    def __post_init__(self):
-        self._fix_enums({('categorie', DocumentCategorieEnum)})
-        self._fix_nested_list_classes({('links', Link)})
-        self._fix_nested_list_classes({('document', ResourceRefDTO)})
+    _nested_list_classes = {'links': Link, 'document': ResourceRefDTO}
+    _enums = {'categorie': DocumentCategorieEnum}
 
 @dataclass
 class DocumentDTO(BaseDataclass):
@@ -711,9 +861,8 @@ class DocumentDTO(BaseDataclass):
     grootte: str
     links: [Link]
 
-    def __post_init__(self):
-        self._fix_nested_list_classes({('links', Link)})
-        
+    _nested_list_classes = {'links': Link}
+
 @dataclass
 class BetrokkenerelatieDTO(BaseDataclass):
     uuid: str
@@ -724,8 +873,7 @@ class BetrokkenerelatieDTO(BaseDataclass):
     rol: str # TODO enum
     links: [Link]
 
-    def __post_init__(self):
-        self._fix_nested_list_classes({('links', Link)})
+    _nested_list_classes = {'links': Link}
 
 
 @dataclass
@@ -742,17 +890,15 @@ class RelatieTypeDTO(BaseDataclass):
     authorizationMetadata: dict | None = None
     commentaar: str | None = None
 
-    def __post_init__(self):
-        self._fix_nested_list_classes({('links', Link)})
+    _nested_list_classes = {'links': Link}
 
 @dataclass
 class RelatieTypeDTOList(BaseDataclass):
     relatieType: RelatieTypeDTO | dict
     links: [Link]
 
-    def __post_init__(self):
-        self._fix_nested_list_classes({('links', Link)})
-        self._fix_nested_classes({('relatieType', RelatieTypeDTO)})
+    _nested_classes = {'relatieType': RelatieTypeDTO}
+    _nested_list_classes = {'links': Link}
 
 @dataclass
 class PostitDTO(BaseDataclass):
@@ -764,8 +910,7 @@ class PostitDTO(BaseDataclass):
     eindDatum: str  # mandatory
     commentaar: str | None = None
 
-    def __post_init__(self):
-        self._fix_nested_list_classes({('links', Link)})
+    _nested_list_classes = {'links': Link}
 
 
 @dataclass
@@ -780,8 +925,7 @@ class AgentDTO(BaseDataclass):
     voId: str | None = None
     ovoCode: str | None = None
 
-    def __post_init__(self):
-        self._fix_nested_list_classes({('links', Link)})
+    _nested_list_classes = {'links': Link}
 
 
 
@@ -797,8 +941,7 @@ class KenmerkTypeDTO(BaseDataclass):
     definitie: str
     links: [Link]
 
-    def __post_init__(self):
-        self._fix_nested_list_classes({('links', Link)})
+    _nested_list_classes = {'links': Link}
 
 @dataclass
 class KenmerkType(BaseDataclass):
@@ -811,8 +954,7 @@ class KenmerkType(BaseDataclass):
     toezichter: dict | None =  None
     toezichtGroep: dict | None = None
 
-    def __post_init__(self):
-        self._fix_nested_list_classes({('links', Link)})
+    _nested_list_classes = {'links': Link}
 
 @dataclass
 class ToezichtgroepDTO(BaseDataclass):
@@ -827,8 +969,7 @@ class ToezichtgroepDTO(BaseDataclass):
     createdOn: str | None = None
     modifiedOn: str | None = None
 
-    def __post_init__(self):
-        self._fix_nested_list_classes({('links', Link)})
+    _nested_list_classes = {'links': Link}
 
 @dataclass
 class Eigenschap(BaseDataclass):
@@ -847,8 +988,7 @@ class Eigenschap(BaseDataclass):
     kardinaliteitMin: int | None = None
     kardinaliteitMax: int | None = None
 
-    def __post_init__(self):
-        self._fix_nested_list_classes({('links', Link)})
+    _nested_list_classes = {'links': Link}
 
 @dataclass
 class EigenschapValueDTO(BaseDataclass):
@@ -860,23 +1000,20 @@ class EigenschapValueDTO(BaseDataclass):
     kenmerkType: KenmerkTypeDTO
     alias: str | None = None
 
-    def __post_init__(self):
-        self._fix_nested_classes({('eigenschap', Eigenschap), ('kenmerkType', KenmerkTypeDTO)})
+    _nested_classes = {'eigenschap': Eigenschap, 'kenmerkType': KenmerkTypeDTO}
 
 @dataclass
 class EigenschapValueUpdateDTO(BaseDataclass):
     typedValue: dict
     eigenschap: Eigenschap
 
-    def __post_init__(self):
-        self._fix_nested_classes({('eigenschap', Eigenschap)})
+    _nested_classes = {'eigenschap': Eigenschap}
 
 @dataclass
 class AssetTypeKenmerkTypeAddDTO(BaseDataclass):
     kenmerkType: ResourceRefDTO
 
-    def __post_init__(self):
-        self._fix_nested_classes({('kenmerkType', KenmerkTypeDTO)})
+    _nested_classes = {'kenmerkType': KenmerkTypeDTO}
 
 
 @dataclass
@@ -885,8 +1022,7 @@ class AssetTypeKenmerkTypeDTO(BaseDataclass):
     actief: bool
     standard: bool
 
-    def __post_init__(self):
-        self._fix_nested_classes({('kenmerkType', KenmerkTypeDTO)})
+    _nested_classes = {'kenmerkType': KenmerkTypeDTO}
 
 
 def construct_naampad(asset: AssetDTO) -> str:
@@ -915,8 +1051,7 @@ class AssetRelatieDTO(BaseDataclass):
     doelAsset: AssetDTO
     relatieType: RelatieTypeDTO
 
-    def __post_init__(self):
-        self._fix_nested_list_classes({('links', Link)})
+    _nested_list_classes = {'links': Link}
 @dataclass
 class GraphLinks(BaseDataclass):
     bronUuid: str
@@ -930,5 +1065,4 @@ class Graph(BaseDataclass):
     links: [GraphLinks]
     limitExceeded: bool
 
-    def __post_init__(self):
-        self._fix_nested_list_classes({('nodes', AssetDTO), ('links', GraphLinks)})
+    _nested_list_classes = {'nodes': AssetDTO, 'links': GraphLinks}
@@ -0,0 +1,40 @@
+from collections.abc import Iterable, Iterator
+
+from API.eminfra.EMInfraDomain import Eigenschap
+
+
+class EigenschapIndex:
+    """
+    All eigenschappen, indexed by naam, uri and uuid so they can be looked up without the API.
+    Get it with EigenschapService.get_eigenschap_index, which keeps the eigenschappen in the metadata cache.
+    The lookups return the Eigenschap objects of the index itself, don't modify them.
+    """
+    def __init__(self, eigenschappen: Iterable[Eigenschap]):
+        self.eigenschappen = list(eigenschappen)
+        self._by_naam: dict[str, list[Eigenschap]] = {}
+        for eigenschap in self.eigenschappen:
+            self._by_naam.setdefault(eigenschap.naam, []).append(eigenschap)
+        self._by_uri = {eigenschap.uri: eigenschap for eigenschap in self.eigenschappen}
+        self._by_uuid = {eigenschap.uuid: eigenschap for eigenschap in self.eigenschappen}
+
+    def __len__(self) -> int:
+        return len(self.eigenschappen)
+
+    def __iter__(self) -> Iterator[Eigenschap]:
+        return iter(self.eigenschappen)
+
+    def get_by_naam(self, naam: str, uri: str = None) -> list[Eigenschap]:
+        """
+        Same result as EigenschapService.search_eigenschappen: the eigenschappen with this naam, optionally only those
+        of which the uri contains uri.
+        """
+        eigenschappen = self._by_naam.get(naam, [])
+        if uri:
+            eigenschappen = [eigenschap for eigenschap in eigenschappen if uri in eigenschap.uri]
+        return list(eigenschappen)
+
+    def get_by_uri(self, uri: str) -> Eigenschap | None:
+        return self._by_uri.get(uri)
+
+    def get_by_uuid(self, uuid: str) -> Eigenschap | None:
+        return self._by_uuid.get(uuid)
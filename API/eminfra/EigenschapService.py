@@ -1,16 +1,22 @@
 import logging
-from collections.abc import Generator
+import time
+from collections.abc import Generator, Iterable
 
 from API.eminfra.EMInfraDomain import (Eigenschap, PagingModeEnum, SelectionDTO, ExpressionDTO, TermDTO, QueryDTO,
                                        OperatorEnum, LogicalOpEnum, EigenschapValueDTO, EigenschapValueUpdateDTO,
-                                       KenmerkTypeEnum, AssetDTO, KenmerkType)
+                                       KenmerkTypeEnum, AssetDTO, KenmerkType, BulkUpdateResult,
+                                       BulkUpdateStatusEnum)
+from API.eminfra.EigenschapIndex import EigenschapIndex
 from API.eminfra.KenmerkService import KenmerkService
+from API.eminfra.MetadataCache import MetadataCache
+from API.eminfra.Generic import asset_uuid_of, bulk_update
 
 
 class EigenschapService:
-    def __init__(self, requester):
+    def __init__(self, requester, cache: MetadataCache = None):
         self.requester = requester
-
+        self.cache = cache if cache is not None else MetadataCache(maxsize=0)
+        self._eigenschap_index: tuple[float, EigenschapIndex] | None = None
 
     def get_all_eigenschappen_as_text_generator(self, size: int = 100) -> Generator[str]:
         from_ = 0
@@ -24,16 +30,64 @@ class EigenschapService:
             if from_ >= dto_list_total:
                 break
 
-    def search_eigenschappen(self, eigenschap_naam: str, uri: str = None) -> list[Eigenschap]:
+    def get_eigenschap_index(self) -> EigenschapIndex:
+        """
+        All eigenschappen, indexed by naam, uri and uuid. The eigenschappen are loaded once and kept in the metadata
+        cache (on disk too when the cache has a path), the index is rebuilt when they expire.
+
+        :return: EigenschapIndex
+        """
+        if self._eigenschap_index is None or time.time() - self._eigenschap_index[0] >= self.cache.ttl:
+            data = self.cache.get_or_load('eigenschappen:all',
+                                          lambda: list(self.get_all_eigenschappen_as_text_generator()))
+            self._eigenschap_index = (time.time(), EigenschapIndex(Eigenschap.from_dict(item) for item in data))
+        return self._eigenschap_index[1]
+
+    def get_eigenschap(self, eigenschap_naam: str, kenmerktype_uuid: str = None, uri: str = None) -> Eigenschap:
+        """
+        Resolves an eigenschap by naam without a request (once the eigenschappen are cached), e.g. to build an
+        EigenschapValueUpdateDTO for update_eigenschap or bulk_update_eigenschappen.
+        A naam is not unique: restrict it to the eigenschappen of a kenmerktype and/or to uris containing uri.
+
+        :param eigenschap_naam: naam of the eigenschap
+        :type eigenschap_naam: str
+        :param kenmerktype_uuid: only consider the eigenschappen of this kenmerktype
+        :type kenmerktype_uuid: str
+        :param uri: only consider the eigenschappen of which the uri contains this value
+        :type uri: str
+        :return: Eigenschap
+        :raises ValueError: when not exactly one eigenschap matches
+        """
+        if kenmerktype_uuid is None:
+            eigenschappen = self.get_eigenschap_index().get_by_naam(eigenschap_naam, uri=uri)
+        else:
+            eigenschappen = [eigenschap for eigenschap in self.list_eigenschap(kenmerktype_uuid)
+                             if eigenschap.naam == eigenschap_naam and (not uri or uri in eigenschap.uri)]
+        if len(eigenschappen) != 1:
+            raise ValueError(f'Expected one single eigenschap for "{eigenschap_naam}". Got {len(eigenschappen)} '
+                             f'instead.')
+        return eigenschappen[0]
+
+    def search_eigenschappen(self, eigenschap_naam: str, uri: str = None, use_index: bool = False) -> list[Eigenschap]:
         """
         Search Eigenschap with "eigenschap_naam" (mandatory) and "uri" (optional) parameters.
         The optional parameter "uri" results in one single list item Eigenschap.
         This is usefull when searching for a common eigenschap like e.g. 'merk', 'hoogte',
+        The result is kept in the metadata cache.
 
         :param eigenschap_naam:
         :param uri:
+        :param use_index: search in the EigenschapIndex instead of calling the search endpoint. Loads all eigenschappen
+            the first time, worth it when many different eigenschappen are looked up.
         :return:
         """
+        if use_index:
+            return self.get_eigenschap_index().get_by_naam(eigenschap_naam, uri=uri)
+        data = self.cache.get_or_load(f'eigenschappen:naam:{eigenschap_naam}:uri:{uri or ""}',
+                                      lambda: self._search_eigenschappen(eigenschap_naam, uri))
+        return [Eigenschap.from_dict(item) for item in data]
+
+    def _search_eigenschappen(self, eigenschap_naam: str, uri: str = None) -> list[dict]:
         query_dto = QueryDTO(size=10, from_=0, pagingMode=PagingModeEnum.OFFSET,
                              selection=SelectionDTO(
                                  expressions=[ExpressionDTO(
@@ -53,7 +107,7 @@ class EigenschapService:
             logging.error(response)
             raise ProcessLookupError(response.content.decode("utf-8"))
 
-        return [Eigenschap.from_dict(item) for item in response.json()['data']]
+        return response.json()['data']
 
     def update_eigenschap_by_uuid(self, asset_uuid: str, eigenschap: EigenschapValueDTO | EigenschapValueUpdateDTO, kenmerktype: KenmerkType = None) -> None:
         """
@@ -66,20 +120,23 @@ class EigenschapService:
         :param kenmerktype
         :type kenmerktype: KenmerkType
         """
-        request_body = {
-            "data": [
-                {
-                    "eigenschap": eigenschap.eigenschap.asdict(),
-                    "typedValue": eigenschap.typedValue
-                }]
-        }
-
         # Determine how to retrieve the UUID for the kenmerk
         if hasattr(eigenschap, "kenmerkType") and hasattr(eigenschap.kenmerkType, "uuid"):
             kenmerk_uuid = eigenschap.kenmerkType.uuid
         else:
             kenmerk_uuid = kenmerktype.type.get("uuid", None)
 
+        self._patch_eigenschapwaarden(asset_uuid=asset_uuid, kenmerk_uuid=kenmerk_uuid, eigenschappen=[eigenschap])
+
+    def _patch_eigenschapwaarden(self, asset_uuid: str, kenmerk_uuid: str,
+                                 eigenschappen: [EigenschapValueDTO | EigenschapValueUpdateDTO]) -> None:
+        request_body = {
+            "data": [
+                {
+                    "eigenschap": eigenschap.eigenschap.asdict(),
+                    "typedValue": eigenschap.typedValue
+                } for eigenschap in eigenschappen]
+        }
         response = self.requester.patch(url=f'core/api/assets/{asset_uuid}/kenmerken/{kenmerk_uuid}/eigenschapwaarden',
                                         json=request_body)
         if response.status_code != 202:
@@ -98,16 +155,21 @@ class EigenschapService:
         return self.update_eigenschap_by_uuid(asset_uuid=asset.uuid, eigenschap=eigenschap)
 
     def list_eigenschap(self, kenmerktype_id: str) -> list[Eigenschap]:
-        url = f"core/api/kenmerktypes/{kenmerktype_id}/eigenschappen"
-        json_dict = self.requester.get(url).json()
-        return [Eigenschap.from_dict(item["eigenschap"]) for item in json_dict['data']]
+        """The eigenschappen of a kenmerktype, kept in the metadata cache"""
+        def load() -> list[dict]:
+            url = f"core/api/kenmerktypes/{kenmerktype_id}/eigenschappen"
+            json_dict = self.requester.get(url).json()
+            return [item["eigenschap"] for item in json_dict['data']]
+
+        data = self.cache.get_or_load(f'kenmerktype:eigenschappen:{kenmerktype_id}', load)
+        return [Eigenschap.from_dict(item) for item in data]
 
     def get_eigenschappen(self, asset_uuid: str, kenmerktype: KenmerkTypeEnum) -> list[EigenschapValueDTO] | None:
         """
         Haal de waarde op van een bepaalde eigenschap.
         """
         # ophalen kenmerk_uuid
-        kenmerk_service = KenmerkService(requester=self.requester)
+        kenmerk_service = KenmerkService(requester=self.requester, cache=self.cache)
         kenmerk = kenmerk_service.get_kenmerken_by_uuid(asset_uuid=asset_uuid, naam=kenmerktype)[0]
 
         kenmerk_uuid = kenmerk.type["uuid"]
@@ -139,4 +201,43 @@ class EigenschapService:
         eigenschap_value_list = [EigenschapValueDTO.from_dict(item) for item in json_dict['data']]
         if eigenschap_naam:
             eigenschap_value_list = [item for item in eigenschap_value_list if item.eigenschap.naam == eigenschap_naam]
-        return eigenschap_value_list
\ No newline at end of file
+        return eigenschap_value_list
+
+    def bulk_update_eigenschappen(self, updates: Iterable[tuple[AssetDTO | str, str,
+                                                                EigenschapValueDTO | EigenschapValueUpdateDTO]],
+                                  workers: int = 0) -> list[BulkUpdateResult]:
+        """
+        Updates many eigenschap values at once. Per asset and kenmerk the current values are fetched once, the values
+        that don't change are skipped and the others are sent in a single PATCH.
+        A failing asset is logged and reported, the other assets are still processed.
+
+        :param updates: (asset or asset uuid, kenmerk uuid, new eigenschap value) for every value to update
+        :type updates: Iterable[tuple[AssetDTO | str, str, EigenschapValueDTO | EigenschapValueUpdateDTO]]
+        :param workers: number of threads processing assets concurrently. 0 (default) processes them one by one.
+        :type workers: int
+        :return: one result per asset, in the order in which the assets first occur in updates
+        :rtype: list[BulkUpdateResult]
+        """
+        updates_per_asset: dict[str, dict[str, list[EigenschapValueDTO | EigenschapValueUpdateDTO]]] = {}
+        for asset, kenmerk_uuid, eigenschap in updates:
+            updates_per_asset.setdefault(asset_uuid_of(asset), {}).setdefault(kenmerk_uuid, []).append(eigenschap)
+
+        return bulk_update(list(updates_per_asset.items()), lambda item: self._update_eigenschappen(*item),
+                           get_asset_uuid=lambda item: item[0], description='eigenschappen', workers=workers)
+
+    def _update_eigenschappen(self, asset_uuid: str,
+                              updates_per_kenmerk: dict[str, list[EigenschapValueDTO | EigenschapValueUpdateDTO]]
+                              ) -> BulkUpdateStatusEnum:
+        status = BulkUpdateStatusEnum.UNCHANGED
+        for kenmerk_uuid, eigenschappen in updates_per_kenmerk.items():
+            current_values = {item.eigenschap.uuid: item.typedValue for item in
+                              self.get_eigenschapwaarden(asset_uuid=asset_uuid, kenmerk_uuid=kenmerk_uuid)}
+            # the last value wins when the same eigenschap is given more than once
+            changed = {eigenschap.eigenschap.uuid: eigenschap for eigenschap in eigenschappen}
+            changed = [eigenschap for uuid, eigenschap in changed.items()
+                       if current_values.get(uuid) != eigenschap.typedValue]
+            if changed:
+                self._patch_eigenschapwaarden(asset_uuid=asset_uuid, kenmerk_uuid=kenmerk_uuid,
+                                              eigenschappen=changed)
+                status = BulkUpdateStatusEnum.UPDATED
+        return status
@@ -3,6 +3,7 @@ from datetime import datetime, timedelta
 
 from API.eminfra.EMInfraDomain import EventType, IdentiteitKenmerk, EventContext, Event, QueryDTO, \
     SelectionDTO, PagingModeEnum, ExpressionDTO, TermDTO, OperatorEnum, LogicalOpEnum, AssetDTO
+from API.eminfra.Generic import search_offset_paged_generator
 from utils.date_helpers import format_datetime
 
 
@@ -41,7 +42,7 @@ class EventService:
 
     def search_events_by_uuid_generator(self, asset_uuid: str, created_after: datetime = None, created_before: datetime = None,
                       created_by: IdentiteitKenmerk = None, event_type: EventType = None,
-                      event_context: EventContext = None) -> Generator[Event]:
+                      event_context: EventContext = None, prefetch_workers: int = 0) -> Generator[Event]:
         """
         Search the history of em-infra, called events
         Parameters created_before and created_after have type datetime, but the API only takes into account the datum,
@@ -56,6 +57,7 @@ class EventService:
         :param created_by: person who created the asset
         :param event_type: type of event
         :param event_context: context of the event
+        :param prefetch_workers: number of threads fetching the pages concurrently. 0 (default) disables prefetching.
         :return: A generator yielding Event objects.
         """
         if all(p is None for p in (asset_uuid, created_after, created_before, created_by, event_type, event_context)):
@@ -106,17 +108,12 @@ class EventService:
         query_dto.selection.expressions[0].logicalOp = None
 
         url = "core/api/events/search"
-        while True:
-            json_dict = self.requester.post(url, data=query_dto.json()).json()
-            yield from [Event.from_dict(item) for item in json_dict['data']]
-            dto_list_total = json_dict['totalCount']
-            query_dto.from_ = json_dict['from'] + query_dto.size
-            if query_dto.from_ >= dto_list_total:
-                break
+        for item in search_offset_paged_generator(self.requester, url, query_dto, prefetch_workers=prefetch_workers):
+            yield Event.from_dict(item)
 
     def search_events_generator(self, asset: AssetDTO = None, created_after: datetime = None, created_before: datetime = None,
                       created_by: IdentiteitKenmerk = None, event_type: EventType = None,
-                      event_context: EventContext = None) -> Generator[Event]:
+                      event_context: EventContext = None, prefetch_workers: int = 0) -> Generator[Event]:
         """
         Search the history of em-infra, called events
         Parameters created_before and created_after have type datetime, but the API only takes into account the datum,
@@ -131,8 +128,10 @@ class EventService:
         :param created_by: person who created the asset
         :param event_type: type of event
         :param event_context: context of the event
+        :param prefetch_workers: number of threads fetching the pages concurrently. 0 (default) disables prefetching.
         :return: A generator yielding Event objects.
         """
         return self.search_events_by_uuid_generator(asset_uuid=asset.uuid, created_after=created_after,
                                                     created_before=created_before, created_by=created_by,
-                                                    event_type=event_type, event_context=event_context)
\ No newline at end of file
+                                                    event_type=event_type, event_context=event_context,
+                                                    prefetch_workers=prefetch_workers)
\ No newline at end of file
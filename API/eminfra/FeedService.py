@@ -1,4 +1,40 @@
-from API.eminfra.EMInfraDomain import FeedPage
+import abc
+import json
+import os
+import time
+from collections.abc import Generator
+from pathlib import Path
+
+from API.eminfra.EMInfraDomain import EntryObject, FeedCheckpoint, FeedPage
+
+
+class FeedCheckpointStore(abc.ABC):
+    """Stores the position of a consumer in a feed, so it can resume after a restart"""
+    @abc.abstractmethod
+    def load(self) -> FeedCheckpoint | None:
+        pass
+
+    @abc.abstractmethod
+    def save(self, checkpoint: FeedCheckpoint) -> None:
+        pass
+
+
+class JsonFileFeedCheckpointStore(FeedCheckpointStore):
+    """Keeps the checkpoint in a json file. The file is replaced atomically, a crash never leaves a partial file."""
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+
+    def load(self) -> FeedCheckpoint | None:
+        if not self.path.exists():
+            return None
+        with open(self.path) as f:
+            return FeedCheckpoint.from_dict(json.load(f))
+
+    def save(self, checkpoint: FeedCheckpoint) -> None:
+        temp_path = self.path.with_name(f'{self.path.name}.tmp')
+        with open(temp_path, 'w') as f:
+            f.write(checkpoint.json())
+        os.replace(temp_path, self.path)
 
 
 class FeedService:
@@ -19,4 +55,113 @@ class FeedService:
         """
         url = f"feedproxy/feed/{feed_name}/{page_num}/{page_size}"
         json_dict = self.requester.get(url).json()
-        return FeedPage.from_dict(json_dict)
\ No newline at end of file
+        return FeedPage.from_dict(json_dict)
+
+    def get_current_feedproxy_page(self, feed_name: str) -> FeedPage:
+        """
+        Get the most recent feedproxy page, with the page size chosen by the feedproxy
+
+        :param feed_name:
+        :type feed_name: str
+        :return FeedPage
+        """
+        url = f"feedproxy/feed/{feed_name}"
+        json_dict = self.requester.get(url).json()
+        return FeedPage.from_dict(json_dict)
+
+    @staticmethod
+    def get_page_num_and_size(feed_page: FeedPage, rel: str = 'self') -> tuple[int, int] | None:
+        """
+        Get the page number and page size of a link of a feedproxy page (.../{page_num}/{page_size}).
+        The self link (default) refers to the page itself, the previous link to the next, more recent page.
+
+        :param feed_page:
+        :type feed_page: FeedPage
+        :param rel: rel of the link
+        :type rel: str
+        :return tuple[int, int] or None if the page has no such link
+        """
+        link = next((link for link in feed_page.links or [] if link.rel == rel), None)
+        if link is None:
+            return None
+        page_num, page_size = link.href.rstrip('/').split('/')[-2:]
+        return int(page_num), int(page_size)
+
+    def tail_feedproxy(self, feed_name: str, checkpoint_store: FeedCheckpointStore, page_size: int = 100,
+                       poll_interval: float = None) -> Generator[EntryObject]:
+        """
+        Yield the entries of a feed, starting after the checkpoint. The checkpoint is saved after each entry, when the
+        next one is requested, so an entry that was being processed during a crash is yielded again after a restart.
+        Without a checkpoint, the feed is followed from the current page.
+
+        :param feed_name:
+        :type feed_name: str
+        :param checkpoint_store: loads the checkpoint to start from and saves the progress
+        :type checkpoint_store: FeedCheckpointStore
+        :param page_size: amount of entries per request
+        :type page_size: int
+        :param poll_interval: seconds to wait for new entries at the end of the feed. None (default) stops there.
+        :type poll_interval: float
+        :return Generator[EntryObject]
+        """
+        for page_num, entries, next_page_num in self._follow_feedproxy(feed_name, checkpoint_store, page_size,
+                                                                       poll_interval):
+            for entry in entries:
+                yield entry
+                checkpoint_store.save(FeedCheckpoint(page_num=page_num, page_size=page_size, entry_id=entry.id))
+            if next_page_num is not None:
+                checkpoint_store.save(FeedCheckpoint(page_num=next_page_num, page_size=page_size))
+
+    def tail_feedproxy_pages(self, feed_name: str, checkpoint_store: FeedCheckpointStore, page_size: int = 100,
+                             poll_interval: float = None) -> Generator[list[EntryObject]]:
+        """
+        Same as tail_feedproxy, but yields the new entries per page and saves the checkpoint after each page.
+
+        :return Generator[list[EntryObject]]
+        """
+        for page_num, entries, next_page_num in self._follow_feedproxy(feed_name, checkpoint_store, page_size,
+                                                                       poll_interval):
+            if entries:
+                yield entries
+                checkpoint_store.save(FeedCheckpoint(page_num=page_num, page_size=page_size, entry_id=entries[-1].id))
+            if next_page_num is not None:
+                checkpoint_store.save(FeedCheckpoint(page_num=next_page_num, page_size=page_size))
+
+    def _follow_feedproxy(self, feed_name: str, checkpoint_store: FeedCheckpointStore, page_size: int,
+                          poll_interval: float | None) -> Generator[tuple[int, list[EntryObject], int | None]]:
+        """Yields the page number, the entries after the checkpoint and the number of the next page, if any."""
+        checkpoint = checkpoint_store.load()
+        if checkpoint is None:
+            current_page_num, current_page_size = self.get_page_num_and_size(
+                self.get_current_feedproxy_page(feed_name))
+            checkpoint = FeedCheckpoint(page_num=current_page_num * current_page_size // page_size,
+                                        page_size=page_size)
+        page_num = checkpoint.page_num * checkpoint.page_size // page_size
+        last_entry_id = checkpoint.entry_id
+
+        while True:
+            page = self.get_feedproxy_page(feed_name, page_num=page_num, page_size=page_size)
+            entries = page.entries or []
+            entry_ids = [entry.id for entry in entries]
+            if last_entry_id in entry_ids:
+                entries = entries[entry_ids.index(last_entry_id) + 1:]
+            if entries:
+                last_entry_id = entries[-1].id
+
+            next_link = self.get_page_num_and_size(page, rel='previous')
+            if next_link is not None and next_link[1] == page_size:
+                next_page_num = next_link[0]
+            elif len(entry_ids) >= page_size:
+                next_page_num = page_num + 1
+            else:
+                next_page_num = None
+
+            yield page_num, entries, next_page_num
+
+            if next_page_num is not None:
+                page_num = next_page_num
+                last_entry_id = None
+            elif poll_interval is None:
+                return
+            else:
+                time.sleep(poll_interval)
@@ -1,4 +1,16 @@
-from API.eminfra.EMInfraDomain import RelatieEnum
+import json
+import logging
+import queue
+import threading
+from collections import deque
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import TypeVar
+
+from API.eminfra.EMInfraDomain import RelatieEnum, QueryDTO, AssetDTO, BulkUpdateResult, BulkUpdateStatusEnum
+
+T = TypeVar('T')
 
 def get_kenmerktype_and_relatietype_id(relatie: RelatieEnum) -> (str, str):
     """
@@ -109,4 +121,153 @@ def get_kenmerktype_and_relatietype_id(relatie: RelatieEnum) -> (str, str):
             "de86510a-d61c-46fb-805d-c04c78b27ab6"
         ]
     }
-    return relaties_dict[relatie.value]
\ No newline at end of file
+    return relaties_dict[relatie.value]
+
+def search_offset_paged_generator(requester, url: str, query_dto: QueryDTO, prefetch_workers: int = 0) \
+        -> Generator[dict]:
+    """
+    Yields the items ('data') of all pages of an OFFSET paged search endpoint, in order.
+
+    By default, the pages are fetched one after the other. With prefetch_workers > 0, the remaining pages are fetched
+    concurrently by that many threads once the first page (and the totalCount) is known. At most 2 * prefetch_workers
+    pages are fetched ahead of the consumer.
+
+    :param requester: requester used to post the query
+    :param url: url of the search endpoint, e.g. "core/api/assets/search"
+    :type url: str
+    :param query_dto: the query, from_ is the offset of the first page and size the page size (default 100)
+    :type query_dto: QueryDTO
+    :param prefetch_workers: number of threads fetching pages concurrently. 0 (default) disables prefetching.
+    :type prefetch_workers: int
+    :return: Generator[dict]
+    """
+    if query_dto.from_ is None:
+        query_dto.from_ = 0
+    if query_dto.size is None:
+        query_dto.size = 100
+    size = query_dto.size
+
+    # serialize the query once, only the offset changes between pages
+    query_dict = query_dto.asdict()
+
+    def fetch_page(offset: int) -> dict:
+        query_dict['from'] = offset
+        return requester.post(url, data=json.dumps(query_dict)).json()
+
+    json_dict = fetch_page(query_dto.from_)
+    yield from json_dict['data']
+
+    if prefetch_workers < 1:
+        while True:
+            offset = json_dict['from'] + size
+            if offset >= json_dict['totalCount']:
+                return
+            json_dict = fetch_page(offset)
+            yield from json_dict['data']
+
+    def fetch_page_concurrently(offset: int) -> dict:
+        return requester.post(url, data=json.dumps(dict(query_dict, **{'from': offset}))).json()
+
+    offsets = iter(range(json_dict['from'] + size, json_dict['totalCount'], size))
+    executor = ThreadPoolExecutor(max_workers=prefetch_workers)
+    try:
+        futures = deque(executor.submit(fetch_page_concurrently, offset)
+                        for offset in islice(offsets, 2 * prefetch_workers))
+        while futures:
+            page = futures.popleft().result()
+            futures.extend(executor.submit(fetch_page_concurrently, offset) for offset in islice(offsets, 1))
+            yield from page['data']
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def read_ahead_generator(pages: Iterator[list], read_ahead: int = 0) -> Generator:
+    """
+    Yields the items of the pages. With read_ahead > 0, the pages are fetched in a background thread, up to read_ahead
+    pages ahead of the consumer, so fetching the next (cursor) page overlaps with processing the current one.
+    Exceptions raised while fetching are raised in the consumer, in the same position as without read-ahead.
+
+    :param pages: iterator over the pages (lists of items), typically a generator following a paging cursor
+    :type pages: Iterator[list]
+    :param read_ahead: maximum number of pages fetched ahead of the consumer. 0 (default) disables read-ahead.
+    :type read_ahead: int
+    :return: Generator
+    """
+    if read_ahead < 1:
+        for page in pages:
+            yield from page
+        return
+
+    page_queue = queue.Queue(maxsize=read_ahead)
+    stop = threading.Event()
+
+    def put(item: tuple) -> bool:
+        while not stop.is_set():
+            try:
+                page_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def fetch_pages() -> None:
+        try:
+            for page in pages:
+                if not put((page, None)):
+                    return
+        except BaseException as exc:
+            put((None, exc))
+            return
+        put((None, None))
+
+    thread = threading.Thread(target=fetch_pages, daemon=True, name='read-ahead')
+    thread.start()
+    try:
+        while True:
+            page, exception = page_queue.get()
+            if exception is not None:
+                raise exception
+            if page is None:
+                return
+            yield from page
+    finally:
+        # stops the background thread when the consumer stops early (it finishes the page it is fetching)
+        stop.set()
+
+
+def asset_uuid_of(asset: AssetDTO | str) -> str:
+    """Returns the uuid of an asset given as AssetDTO or as uuid."""
+    return asset.uuid if isinstance(asset, AssetDTO) else asset
+
+
+def bulk_update(items: Iterable[T], update: Callable[[T], BulkUpdateStatusEnum], get_asset_uuid: Callable[[T], str],
+                description: str, workers: int = 0) -> list[BulkUpdateResult]:
+    """
+    Calls update for every item and reports the outcome as a BulkUpdateResult per item, in the order of items.
+    An item for which update raises an exception is logged and reported as FAILED, the other items are still processed.
+
+    :param items: the items to process, e.g. (asset, new value) pairs
+    :type items: Iterable
+    :param update: processes one item and returns UPDATED or UNCHANGED
+    :type update: Callable[[T], BulkUpdateStatusEnum]
+    :param get_asset_uuid: returns the uuid of the asset of an item
+    :type get_asset_uuid: Callable[[T], str]
+    :param description: what is updated, used in the log message of a failing item, e.g. "geometrie"
+    :type description: str
+    :param workers: number of threads processing items concurrently. 0 (default) processes them one by one.
+    :type workers: int
+    :return: one result per item
+    :rtype: list[BulkUpdateResult]
+    """
+    def run(item: T) -> BulkUpdateResult:
+        asset_uuid = get_asset_uuid(item)
+        try:
+            return BulkUpdateResult(asset_uuid=asset_uuid, status=update(item))
+        except Exception as e:
+            logging.error(f'Updating the {description} of asset {asset_uuid} failed: {e}')
+            return BulkUpdateResult(asset_uuid=asset_uuid, status=BulkUpdateStatusEnum.FAILED, error=str(e))
+
+    if workers > 0:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run, items))
+    return [run(item) for item in items]
@@ -1,8 +1,11 @@
 import json
 import logging
+from collections.abc import Iterable
 
-from API.eminfra.EMInfraDomain import GeometrieKenmerk, GeometryNiveau, GeometryBron, GeometryNauwkeurigheid, AssetDTO
-from API.eminfra.wkt_validator import is_valid_wkt
+from API.eminfra.EMInfraDomain import (GeometrieKenmerk, GeometryNiveau, GeometryBron, GeometryNauwkeurigheid, AssetDTO,
+                                       BulkUpdateResult, BulkUpdateStatusEnum)
+from API.eminfra.wkt_validator import is_valid_wkt, wkt_equals
+from API.eminfra.Generic import asset_uuid_of, bulk_update
 
 
 class GeometrieService:
@@ -82,6 +85,13 @@ class GeometrieService:
         """
         if not is_valid_wkt(wkt_string=wkt_geometry):
             raise ValueError(f'WKT Geometry is invalid: {wkt_geometry}.')
+        self._post_geometrie_log(asset_uuid=asset_uuid, wkt_geometry=wkt_geometry, geometry_log=geometry_log,
+                                 geometry_bron=geometry_bron, geometry_nauwkeurigheid=geometry_nauwkeurigheid)
+
+    def _post_geometrie_log(self, asset_uuid: str, wkt_geometry: str,
+                            geometry_log: GeometryNiveau = GeometryNiveau.MIN_1,
+                            geometry_bron: GeometryBron = GeometryBron.MANUEEL,
+                            geometry_nauwkeurigheid: GeometryNauwkeurigheid = GeometryNauwkeurigheid._50) -> None:
         json_body = {
             "wkt": f"{wkt_geometry}",
             "niveau": f"{geometry_log.value}",
@@ -125,7 +135,23 @@ class GeometrieService:
         :type wkt_geometry: str
         :return:
         """
-        return self.update_geometrie_by_uuid(asset_uuid=asset_uuid, wkt_geometry=wkt_geometry)
+        if not is_valid_wkt(wkt_string=wkt_geometry):
+            raise ValueError(f'WKT Geometry is invalid: {wkt_geometry}.')
+        self._replace_geometrie(asset_uuid=asset_uuid, wkt_geometry=wkt_geometry)
+
+    def _replace_geometrie(self, asset_uuid: str, wkt_geometry: str,
+                           geometriekenmerk: GeometrieKenmerk = None) -> None:
+        # step 1: search existing geometry
+        if geometriekenmerk is None:
+            geometriekenmerk = self.get_geometrie_by_uuid(asset_uuid=asset_uuid)
+
+        # step 2: remove existing geometry
+        if geometriekenmerk.logs:
+            if log_id := geometriekenmerk.logs[0].uuid:
+                self.delete_geometrie_by_uuid(asset_uuid=asset_uuid, log_id=log_id)
+
+        # step 3: add new geometry
+        self._post_geometrie_log(asset_uuid=asset_uuid, wkt_geometry=wkt_geometry)
 
     def update_geometrie(self, asset: AssetDTO, wkt_geometry: str) -> None:
         """
@@ -138,16 +164,35 @@ class GeometrieService:
         :param wkt_geometry: Well Known Text representation of the geometrie
         :return:
         """
-        if not is_valid_wkt(wkt_string=wkt_geometry):
-            raise ValueError(f'WKT Geometry is invalid: {wkt_geometry}.')
-
-        # step 1: search existing geometry
-        geometriekenmerk = self.get_geometrie_by_uuid(asset_uuid=asset)
-
-        # step 2: remove existing geometry
-        if geometriekenmerk.logs:
-            if log_id := geometriekenmerk.logs[0].uuid:
-                self.delete_geometrie_by_uuid(asset_uuid=asset, log_id=log_id)
-
-        # step 3: add new geometry
-        self.add_geometrie_by_uuid(asset_uuid=asset, wkt_geometry=wkt_geometry)
\ No newline at end of file
+        return self.update_geometrie_by_uuid(asset_uuid=asset.uuid, wkt_geometry=wkt_geometry)
+
+    def bulk_update_geometrie(self, updates: Iterable[tuple[AssetDTO | str, str]], tolerance: float = 0.0,
+                              workers: int = 0) -> list[BulkUpdateResult]:
+        """
+        Update de geometrie van veel assets, zoals update_geometrie. Elke WKT wordt eenmaal gevalideerd, assets waarvan
+        de huidige geometrie (de eerste log) binnen de tolerantie gelijk is worden overgeslagen.
+        Een asset die faalt wordt gelogd en gerapporteerd, de andere assets worden verder verwerkt.
+
+        :param updates: (asset of asset uuid, WKT geometrie) per asset
+        :type updates: Iterable[tuple[AssetDTO | str, str]]
+        :param tolerance: maximaal verschil per coördinaat om een geometrie als ongewijzigd te beschouwen
+        :type tolerance: float
+        :param workers: aantal threads dat gelijktijdig assets verwerkt. 0 (default) verwerkt ze één voor één.
+        :type workers: int
+        :return: een resultaat per asset, in de volgorde van updates
+        :rtype: list[BulkUpdateResult]
+        """
+        def update(item: tuple[AssetDTO | str, str]) -> BulkUpdateStatusEnum:
+            asset, wkt_geometry = item
+            asset_uuid = asset_uuid_of(asset)
+            if not is_valid_wkt(wkt_string=wkt_geometry):
+                raise ValueError(f'WKT Geometry is invalid: {wkt_geometry}.')
+            geometriekenmerk = self.get_geometrie_by_uuid(asset_uuid=asset_uuid)
+            if geometriekenmerk.logs and wkt_equals(geometriekenmerk.logs[0].wkt, wkt_geometry, tolerance):
+                return BulkUpdateStatusEnum.UNCHANGED
+            self._replace_geometrie(asset_uuid=asset_uuid, wkt_geometry=wkt_geometry,
+                                    geometriekenmerk=geometriekenmerk)
+            return BulkUpdateStatusEnum.UPDATED
+
+        return bulk_update(updates, update, get_asset_uuid=lambda item: asset_uuid_of(item[0]), description='geometrie',
+                           workers=workers)
@@ -4,11 +4,13 @@ from API.eminfra.EMInfraDomain import (AssetTypeKenmerkTypeDTO, KenmerkTypeDTO,
                                        ExpressionDTO, TermDTO, QueryDTO, OperatorEnum, ResourceRefDTO,
                                        AssetTypeKenmerkTypeAddDTO, KenmerkTypeEnum, KenmerkType,
                                        AssetDTO)
+from API.eminfra.MetadataCache import MetadataCache
 
 
 class KenmerkService:
-    def __init__(self, requester):
+    def __init__(self, requester, cache: MetadataCache = None):
         self.requester = requester
+        self.cache = cache if cache is not None else MetadataCache(maxsize=0)
 
     def get(self, asset: AssetDTO, kenmerk_uuid: str) -> dict:
         url = f'core/api/assets/{asset.uuid}/kenmerken/{kenmerk_uuid}'
@@ -39,6 +41,17 @@ class KenmerkService:
         return [AssetTypeKenmerkTypeDTO.from_dict(item) for item in json_dict['data']]
 
     def get_kenmerktype_by_naam(self, naam: str) -> KenmerkTypeDTO:
+        """
+        Search kenmerktype by naam. The result is kept in the metadata cache.
+
+        :param naam: kenmerktype naam
+        :type naam: str
+        :return: KenmerkTypeDTO
+        """
+        data = self.cache.get_or_load(f'kenmerktype:naam:{naam}', lambda: self._search_kenmerktypes(naam))
+        return next(KenmerkTypeDTO.from_dict(item) for item in data)
+
+    def _search_kenmerktypes(self, naam: str) -> list[dict]:
         query_dto = QueryDTO(size=10, from_=0, pagingMode=PagingModeEnum.OFFSET,
                              selection=SelectionDTO(
                                  expressions=[ExpressionDTO(
@@ -51,7 +64,7 @@ class KenmerkService:
             logging.error(response)
             raise ProcessLookupError(response.content.decode("utf-8"))
 
-        return next(KenmerkTypeDTO.from_dict(item) for item in response.json()['data'])
+        return response.json()['data']
 
     def add_kenmerk_to_assettype(self, assettype_uuid: str, kenmerktype_uuid: str) -> None:
         add_dto = AssetTypeKenmerkTypeAddDTO(kenmerkType=ResourceRefDTO(uuid=kenmerktype_uuid))
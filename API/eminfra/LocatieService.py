@@ -1,8 +1,10 @@
 import json
 import logging
+from collections.abc import Iterable
 
-from API.eminfra.EMInfraDomain import LocatieKenmerk, AssetDTO
-from API.eminfra.wkt_validator import is_valid_wkt
+from API.eminfra.EMInfraDomain import LocatieKenmerk, AssetDTO, BulkUpdateResult, BulkUpdateStatusEnum
+from API.eminfra.wkt_validator import is_valid_wkt, wkt_equals
+from API.eminfra.Generic import asset_uuid_of, bulk_update
 
 
 class LocatieService:
@@ -79,6 +81,36 @@ class LocatieService:
         """
         return self.update_locatie_by_uuid(bron_asset_uuid=bron_asset.uuid, doel_asset_uuid=doel_asset.uuid, wkt_geometry=wkt_geometry)
 
+    def bulk_update_locatie(self, updates: Iterable[tuple[AssetDTO | str, str]], tolerance: float = 0.0,
+                            workers: int = 0) -> list[BulkUpdateResult]:
+        """
+        Update de locatie van veel assets via een WKT-string. Elke WKT wordt eenmaal gevalideerd, assets waarvan de
+        huidige locatie binnen de tolerantie gelijk is worden overgeslagen.
+        Een asset die faalt wordt gelogd en gerapporteerd, de andere assets worden verder verwerkt.
+
+        :param updates: (asset of asset uuid, WKT geometrie) per asset
+        :type updates: Iterable[tuple[AssetDTO | str, str]]
+        :param tolerance: maximaal verschil per coördinaat om een locatie als ongewijzigd te beschouwen
+        :type tolerance: float
+        :param workers: aantal threads dat gelijktijdig assets verwerkt. 0 (default) verwerkt ze één voor één.
+        :type workers: int
+        :return: een resultaat per asset, in de volgorde van updates
+        :rtype: list[BulkUpdateResult]
+        """
+        def update(item: tuple[AssetDTO | str, str]) -> BulkUpdateStatusEnum:
+            asset, wkt_geometry = item
+            asset_uuid = asset_uuid_of(asset)
+            if not is_valid_wkt(wkt_string=wkt_geometry):
+                raise ValueError(f'WKT Geometry is invalid: {wkt_geometry}.')
+            locatie = self.get_locatie_by_uuid(asset_uuid=asset_uuid)
+            if wkt_equals(locatie.geometrie, wkt_geometry, tolerance):
+                return BulkUpdateStatusEnum.UNCHANGED
+            self._update_locatie_via_wkt(asset_uuid=asset_uuid, wkt_geom=wkt_geometry)
+            return BulkUpdateStatusEnum.UPDATED
+
+        return bulk_update(updates, update, get_asset_uuid=lambda item: asset_uuid_of(item[0]), description='locatie',
+                           workers=workers)
+
     def _update_locatie_via_wkt(self, asset_uuid: str, wkt_geom: str) -> None:
         """
         Update het kenmerk locatie via een WKT-string
@@ -0,0 +1,123 @@
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS metadata_cache (
+    key TEXT PRIMARY KEY,
+    stored REAL NOT NULL,
+    value TEXT NOT NULL
+);
+"""
+
+
+class MetadataCache:
+    """
+    Cache for metadata that rarely changes (assettypes, kenmerktypes, eigenschappen, bestekrefs, identiteiten,
+    toezichtgroepen), shared by the services of an EMInfraClient. Values are kept in an in-memory LRU and, when a path
+    is given, in a SQLite file so they survive between runs. Both expire after ttl.
+    The cached values are the json dicts of the responses, the services build new DTOs from them on every call.
+    """
+    def __init__(self, maxsize: int = 1024, path: Path | str = None, ttl: timedelta = timedelta(days=1)):
+        """
+        :param maxsize: maximum number of values kept in memory, 0 disables the cache
+        :type maxsize: int
+        :param path: path of the SQLite file for the on-disk store, None (default) keeps the values in memory only
+        :type path: Path | str
+        :param ttl: how long a value stays valid, in memory and on disk
+        :type ttl: timedelta
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl.total_seconds()
+        self.hits = 0
+        self.misses = 0
+        self._values: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.RLock()
+        self.connection = None
+        if path is not None and maxsize > 0:
+            self.connection = sqlite3.connect(path, check_same_thread=False)
+            self.connection.executescript(SCHEMA)
+
+    def get_or_load(self, key: str, load: Callable[[], Any]) -> Any:
+        """
+        Returns the cached value for key, or calls load and caches its result. Exceptions raised by load are not cached.
+
+        :param key: unique key of the value, e.g. 'assettype:uri:<uri>'
+        :type key: str
+        :param load: function fetching the value, must return something json serializable
+        :type load: Callable
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+        result = load()
+        self.put(key, result)
+        return result
+
+    def get(self, key: str) -> Any | None:
+        """Returns the cached value for key, or None when it is not cached (or expired)."""
+        with self._lock:
+            value = self._get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return value[1]
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        :param value: must be json serializable, None can't be cached
+        """
+        if self.maxsize > 0 and value is not None:
+            with self._lock:
+                self._put(key, time.time(), value, store=True)
+
+    def _get(self, key: str) -> tuple[float, Any] | None:
+        now = time.time()
+        value = self._values.get(key)
+        if value is not None:
+            if now - value[0] < self.ttl:
+                self._values.move_to_end(key)
+                return value
+            del self._values[key]
+        if self.connection is None:
+            return None
+        row = self.connection.execute('SELECT stored, value FROM metadata_cache WHERE key = ?', (key,)).fetchone()
+        if row is None or now - row[0] >= self.ttl:
+            return None
+        value = (row[0], json.loads(row[1]))
+        self._put(key, *value, store=False)
+        return value
+
+    def _put(self, key: str, stored: float, value: Any, store: bool) -> None:
+        self._values[key] = (stored, value)
+        self._values.move_to_end(key)
+        while len(self._values) > self.maxsize:
+            self._values.popitem(last=False)
+        if store and self.connection is not None:
+            with self.connection:
+                self.connection.execute('INSERT OR REPLACE INTO metadata_cache (key, stored, value) VALUES (?, ?, ?)',
+                                        (key, stored, json.dumps(value)))
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._values)}
+
+    def clear(self) -> None:
+        """Removes all values, in memory and on disk. The counters are kept."""
+        with self._lock:
+            self._values.clear()
+            if self.connection is not None:
+                with self.connection:
+                    self.connection.execute('DELETE FROM metadata_cache')
+
+    def close(self) -> None:
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
@@ -1,10 +1,10 @@
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
 
 from API.eminfra.EMInfraDomain import (AssetDTO, RelatieTypeDTO, RelatieEnum, AssetRelatieDTO, QueryDTO,
                                        PagingModeEnum, SelectionDTO, ExpressionDTO, TermDTO, OperatorEnum,
-                                       LogicalOpEnum)
+                                       LogicalOpEnum, BulkAssetRelatieSummary, BulkUpdateStatusEnum)
 from API.eminfra.AssetService import AssetService
-from API.eminfra.Generic import get_kenmerktype_and_relatietype_id
+from API.eminfra.Generic import get_kenmerktype_and_relatietype_id, bulk_update
 
 
 class RelatieService:
@@ -29,6 +29,11 @@ class RelatieService:
         :type relatie: RelatieEnum
         :return AssetRelatieDTO
         """
+        return self.get_assetrelatie(self._post_assetrelatie(bron_asset=bron_asset, doel_asset=doel_asset,
+                                                             relatie=relatie))
+
+    def _post_assetrelatie(self, bron_asset: AssetDTO, doel_asset: AssetDTO, relatie: RelatieEnum) -> str:
+        """Creates the assetrelatie and returns its uuid"""
         _, relatietype_id = get_kenmerktype_and_relatietype_id(relatie=relatie)
         json_body = {
             "bronAsset": {
@@ -47,7 +52,7 @@ class RelatieService:
         response = self.requester.post(url=url, json=json_body)
         if response.status_code != 202:
             raise ProcessLookupError(response.content.decode("utf-8"))
-        return self.get_assetrelatie(response.json().get("uuid"))
+        return response.json().get("uuid")
 
     def get_assetrelatie(self, assetrelatie_uuid: str) -> AssetRelatieDTO:
         """
@@ -107,6 +112,66 @@ class RelatieService:
             raise ProcessLookupError(response.content.decode("utf-8"))
         return response.json().get("@graph")
 
+    def create_assetrelaties_if_missing(self, relaties: Iterable[tuple[AssetDTO, AssetDTO, RelatieEnum]],
+                                        chunk_size: int = 100, workers: int = 0) -> BulkAssetRelatieSummary:
+        """
+        Bulk version of UseCases.utils.create_relatie_if_missing. The existing relaties of all bron assets are fetched
+        with a few searches on the OTL endpoint, the missing relaties are determined locally and then created.
+        Bevestiging relaties are not directional: an existing relatie in the other direction counts as well.
+        As in create_relatie_if_missing, an inactive relatie counts as existing, it is not created again.
+
+        :param relaties: (bron asset, doel asset, relatie type) for every relatie that should exist
+        :type relaties: Iterable[tuple[AssetDTO, AssetDTO, RelatieEnum]]
+        :param chunk_size: number of asset uuids per search of the existing relaties
+        :type chunk_size: int
+        :param workers: number of threads creating relaties concurrently. 0 (default) creates them one by one.
+        :type workers: int
+        :return: the number of relaties that already existed, the uuids of the created ones and the errors of the
+            relaties that could not be created
+        :rtype: BulkAssetRelatieSummary
+        """
+        planned: dict[tuple[str, str, RelatieEnum], tuple[AssetDTO, AssetDTO, RelatieEnum]] = {}
+        for bron_asset, doel_asset, relatie in relaties:
+            planned.setdefault((bron_asset.uuid, doel_asset.uuid, relatie), (bron_asset, doel_asset, relatie))
+
+        bron_uuids = list(dict.fromkeys(key[0] for key in planned))
+        existing = set()
+        asset_service = AssetService(self.requester)
+        for i in range(0, len(bron_uuids), chunk_size):
+            for relatie_dict in asset_service.get_objects_from_oslo_search_endpoint_gen(
+                    url_part='assetrelaties', filter_dict={'asset': bron_uuids[i:i + chunk_size]}):
+                existing.add((relatie_dict['RelatieObject.bron']['@id'].split('/')[-1][:36],
+                              relatie_dict['RelatieObject.doel']['@id'].split('/')[-1][:36], relatie_dict['@type']))
+
+        summary = BulkAssetRelatieSummary()
+        missing = []
+        for (bron_uuid, doel_uuid, relatie), item in planned.items():
+            if (bron_uuid, doel_uuid, relatie.value) in existing or (
+                    relatie == RelatieEnum.BEVESTIGING and (doel_uuid, bron_uuid, relatie.value) in existing):
+                summary.existing += 1
+            elif relatie == RelatieEnum.BEVESTIGING and (doel_uuid, bron_uuid, relatie) in planned and \
+                    (doel_uuid, bron_uuid) < (bron_uuid, doel_uuid):
+                # the same relatie in the other direction is created instead
+                continue
+            else:
+                missing.append(item)
+
+        created_uuids: dict[tuple[str, str, RelatieEnum], str] = {}
+
+        def create(item: tuple[AssetDTO, AssetDTO, RelatieEnum]) -> BulkUpdateStatusEnum:
+            created_uuids[(item[0].uuid, item[1].uuid, item[2])] = self._post_assetrelatie(*item)
+            return BulkUpdateStatusEnum.UPDATED
+
+        results = bulk_update(missing, create, get_asset_uuid=lambda item: item[0].uuid, description='relaties',
+                              workers=workers)
+        for (bron_asset, doel_asset, relatie), result in zip(missing, results):
+            key = (bron_asset.uuid, doel_asset.uuid, relatie)
+            if result.status == BulkUpdateStatusEnum.FAILED:
+                summary.failed[key] = result.error
+            else:
+                summary.created.append(created_uuids[key])
+        return summary
+
     def search_assets_via_relatie(self, asset_uuid: str, relatie: RelatieEnum) -> [AssetDTO]:
         """
         Returns a list of assets via the relatie.
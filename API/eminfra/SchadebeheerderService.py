@@ -1,6 +1,10 @@
+import logging
+from collections.abc import Iterable
+
 from API.eminfra.EMInfraDomain import (SchadebeheerderKenmerk, QueryDTO, PagingModeEnum, SelectionDTO, ExpressionDTO,
-                                       TermDTO, OperatorEnum, AssetDTO)
+                                       TermDTO, OperatorEnum, AssetDTO, BulkUpdateResult, BulkUpdateStatusEnum)
 from API.eminfra.KenmerkService import KenmerkService
+from API.eminfra.Generic import asset_uuid_of, bulk_update
 
 
 class SchadebeheerderService:
@@ -12,7 +16,11 @@ class SchadebeheerderService:
         return self.get_schadebeheerder_by_uuid(asset_uuid=asset.uuid)
 
     def get_schadebeheerder_by_uuid(self, asset_uuid: str) -> SchadebeheerderKenmerk | None:
-        data = KenmerkService.get(self, asset_uuid, self.SCHADEBEHEERDER_UUID)
+        response = self.requester.get(url=f'core/api/assets/{asset_uuid}/kenmerken/{self.SCHADEBEHEERDER_UUID}')
+        if response.status_code != 200:
+            logging.error(response)
+            raise ProcessLookupError(response.content.decode("utf-8"))
+        data = response.json()
         if sb := data.get("schadeBeheerder"):
             return [SchadebeheerderKenmerk.from_dict(sb)]
         return None
@@ -54,4 +62,50 @@ class SchadebeheerderService:
         :type schadebeheerder: SchadebeheerderKenmerk
         :return: None
         """
-        return self.add_schadebeheerder_by_uuid(asset_uuid=asset.uuid, schadebeheerder=schadebeheerder)
\ No newline at end of file
+        return self.add_schadebeheerder_by_uuid(asset_uuid=asset.uuid, schadebeheerder=schadebeheerder)
+
+    def bulk_update_schadebeheerder(self, updates: Iterable[tuple[AssetDTO | str, SchadebeheerderKenmerk]],
+                                    workers: int = 0) -> list[BulkUpdateResult]:
+        """
+        Toevoegen van een schadebeheerder aan veel assets. De huidige schadebeheerder van elke asset wordt eerst
+        opgehaald, assets die deze schadebeheerder al hebben worden niet aangepast.
+        Een asset die faalt wordt gelogd en gerapporteerd, de andere assets worden verder verwerkt.
+
+        :param updates: (asset of asset uuid, schadebeheerder) per asset
+        :type updates: Iterable[tuple[AssetDTO | str, SchadebeheerderKenmerk]]
+        :param workers: aantal threads dat gelijktijdig assets verwerkt. 0 (default) verwerkt ze één voor één.
+        :type workers: int
+        :return: een resultaat per asset, in de volgorde van updates
+        :rtype: list[BulkUpdateResult]
+        """
+        def update(item: tuple[AssetDTO | str, SchadebeheerderKenmerk]) -> BulkUpdateStatusEnum:
+            asset, schadebeheerder = item
+            asset_uuid = asset_uuid_of(asset)
+            current = self.get_schadebeheerder_by_uuid(asset_uuid=asset_uuid)
+            if current and current[0].uuid == schadebeheerder.uuid:
+                return BulkUpdateStatusEnum.UNCHANGED
+            self.add_schadebeheerder_by_uuid(asset_uuid=asset_uuid, schadebeheerder=schadebeheerder)
+            return BulkUpdateStatusEnum.UPDATED
+
+        return bulk_update(updates, update, get_asset_uuid=lambda item: asset_uuid_of(item[0]),
+                           description='schadebeheerder', workers=workers)
+
+    def bulk_assign_schadebeheerder(self, assets: Iterable[AssetDTO | str], naam: str,
+                                    workers: int = 0) -> list[BulkUpdateResult]:
+        """
+        Toevoegen van dezelfde schadebeheerder aan veel assets. De naam wordt eenmaal opgezocht.
+
+        :param assets: assets of asset uuids
+        :type assets: Iterable[AssetDTO | str]
+        :param naam: naam van de schadebeheerder
+        :type naam: str
+        :param workers: aantal threads dat gelijktijdig assets verwerkt. 0 (default) verwerkt ze één voor één.
+        :type workers: int
+        :return: een resultaat per asset, in de volgorde van assets
+        :rtype: list[BulkUpdateResult]
+        :raises ValueError: wanneer de naam niet overeenkomt met precies één schadebeheerder
+        """
+        schadebeheerders = self.get_schadebeheerder_by_name(name=naam)
+        if len(schadebeheerders) != 1:
+            raise ValueError(f'Expected one single schadebeheerder for "{naam}". Got {len(schadebeheerders)} instead.')
+        return self.bulk_update_schadebeheerder(((asset, schadebeheerders[0]) for asset in assets), workers=workers)
@@ -1,4 +1,5 @@
-from collections.abc import Generator
+import logging
+from collections.abc import Generator, Iterable
 from typing import Optional
 
 from pyarrow import null
@@ -6,12 +7,16 @@ from pyarrow import null
 from API.eminfra.EMInfraDomain import (AssetDTO, ToezichterKenmerk, IdentiteitKenmerk, ToezichtgroepDTO, QueryDTO,
                                        SelectionDTO, PagingModeEnum, ExpressionDTO, TermDTO, OperatorEnum,
                                        LogicalOpEnum, BetrokkenerelatieDTO, ToezichtgroepTypeEnum,
-                                       ToezichtKenmerkUpdateDTO)
+                                       ToezichtKenmerkUpdateDTO, ResourceRefDTO, BulkUpdateResult,
+                                       BulkUpdateStatusEnum)
+from API.eminfra.MetadataCache import MetadataCache
+from API.eminfra.Generic import asset_uuid_of, bulk_update
 
 
 class ToezichterService:
-    def __init__(self, requester):
+    def __init__(self, requester, cache: MetadataCache = None):
         self.requester = requester
+        self.cache = cache if cache is not None else MetadataCache(maxsize=0)
         self.TOEZICHTER_UUID = 'f0166ba2-757c-4cf3-bf71-2e4fdff43fa3'
 
     def get_toezichter_by_uuid(self, asset_uuid: str) -> ToezichterKenmerk:
@@ -53,6 +58,73 @@ class ToezichterService:
         if response.status_code != 202:
             raise ProcessLookupError(response.content.decode("utf-8"))
 
+    def bulk_update_toezichtkenmerk(self, updates: Iterable[tuple[AssetDTO | str, ToezichtKenmerkUpdateDTO]],
+                                    workers: int = 0) -> list[BulkUpdateResult]:
+        """
+        Update toezicht kenmerk of many assets, as update_toezichtkenmerk.
+        The current toezicht kenmerk of every asset is fetched first, assets that already have the same toezichter and
+        toezichtgroep are not updated. A failing asset is logged and reported, the other assets are still processed.
+
+        :param updates: (asset or asset uuid, new toezicht kenmerk) per asset
+        :type updates: Iterable[tuple[AssetDTO | str, ToezichtKenmerkUpdateDTO]]
+        :param workers: number of threads processing assets concurrently. 0 (default) processes them one by one.
+        :type workers: int
+        :return: one result per asset, in the order of updates
+        :rtype: list[BulkUpdateResult]
+        """
+        def update(item: tuple[AssetDTO | str, ToezichtKenmerkUpdateDTO]) -> BulkUpdateStatusEnum:
+            asset, toezichtkenmerkupdate = item
+            asset_uuid = asset_uuid_of(asset)
+            current = self.get_toezichter_by_uuid(asset_uuid=asset_uuid)
+            if (self._get_ref_uuid(current.toezichter), self._get_ref_uuid(current.toezichtGroep)) == \
+                    (self._get_ref_uuid(toezichtkenmerkupdate.toezichter),
+                     self._get_ref_uuid(toezichtkenmerkupdate.toezichtGroep)):
+                return BulkUpdateStatusEnum.UNCHANGED
+            self.update_toezichtkenmerk(asset_uuid=asset_uuid, toezichtkenmerkupdate=toezichtkenmerkupdate)
+            return BulkUpdateStatusEnum.UPDATED
+
+        return bulk_update(updates, update, get_asset_uuid=lambda item: asset_uuid_of(item[0]),
+                           description='toezicht kenmerk', workers=workers)
+
+    def bulk_assign_toezichter(self, assets: Iterable[AssetDTO | str], toezichter_naam: str = None,
+                               toezichtgroep_naam: str = None, workers: int = 0) -> list[BulkUpdateResult]:
+        """
+        Assign the same toezichter and toezichtgroep to many assets. The names are resolved once, with search_identiteit
+        and search_toezichtgroep_lgc. A name that is not given clears the toezichter or toezichtgroep.
+
+        :param assets: assets or asset uuids
+        :type assets: Iterable[AssetDTO | str]
+        :param toezichter_naam: naam of the toezichter
+        :type toezichter_naam: str
+        :param toezichtgroep_naam: naam or referentie of the toezichtgroep
+        :type toezichtgroep_naam: str
+        :param workers: number of threads processing assets concurrently. 0 (default) processes them one by one.
+        :type workers: int
+        :return: one result per asset, in the order of assets
+        :rtype: list[BulkUpdateResult]
+        :raises ValueError: when a name doesn't match exactly one toezichter or toezichtgroep
+        """
+        toezichter = toezichtgroep = None
+        if toezichter_naam:
+            identiteiten = list(self.search_identiteit(naam=toezichter_naam))
+            if len(identiteiten) != 1:
+                raise ValueError(f'Expected one single toezichter for "{toezichter_naam}". '
+                                 f'Got {len(identiteiten)} instead.')
+            toezichter = ResourceRefDTO(uuid=identiteiten[0].uuid)
+        if toezichtgroep_naam:
+            toezichtgroepen = list(self.search_toezichtgroep_lgc(naam=toezichtgroep_naam))
+            if len(toezichtgroepen) != 1:
+                raise ValueError(f'Expected one single toezichtgroep for "{toezichtgroep_naam}". '
+                                 f'Got {len(toezichtgroepen)} instead.')
+            toezichtgroep = ResourceRefDTO(uuid=toezichtgroepen[0].uuid)
+
+        toezichtkenmerkupdate = ToezichtKenmerkUpdateDTO(toezichter=toezichter, toezichtGroep=toezichtgroep)
+        return self.bulk_update_toezichtkenmerk(((asset, toezichtkenmerkupdate) for asset in assets), workers=workers)
+
+    @staticmethod
+    def _get_ref_uuid(ref: ResourceRefDTO | None) -> str | None:
+        return ref.uuid if ref else None
+
     def add_toezichter(self, asset_uuid: str, toezichtgroep_uuid: str, toezichter_uuid: str) -> None:
         """
         Deprecated. Use function update_toezichtkenmerk() instead.
@@ -82,18 +154,98 @@ class ToezichterService:
             raise ProcessLookupError(response.content.decode("utf-8"))
 
     def get_identiteit(self, toezichter_uuid: str) -> IdentiteitKenmerk:
-        response = self.requester.get(
-            url=f'identiteit/api/identiteiten/{toezichter_uuid}')
-        if response.status_code != 200:
-            raise ProcessLookupError(response.content.decode("utf-8"))
-        return IdentiteitKenmerk.from_dict(response.json())
+        """
+        Opzoeken van een identiteit (toezichter) op basis van diens uuid.
+        Het resultaat wordt bijgehouden in de metadata cache.
+        """
+        def load() -> dict:
+            response = self.requester.get(
+                url=f'identiteit/api/identiteiten/{toezichter_uuid}')
+            if response.status_code != 200:
+                raise ProcessLookupError(response.content.decode("utf-8"))
+            return response.json()
+
+        return IdentiteitKenmerk.from_dict(self.cache.get_or_load(f'identiteit:uuid:{toezichter_uuid}', load))
 
     def get_toezichtgroep(self, toezichtgroep_uuid: str) -> ToezichtgroepDTO:
-        response = self.requester.get(
-            url=f'identiteit/api/toezichtgroepen/{toezichtgroep_uuid}')
-        if response.status_code != 200:
-            raise ProcessLookupError(response.content.decode("utf-8"))
-        return ToezichtgroepDTO.from_dict(response.json())
+        """
+        Opzoeken van een toezichtgroep op basis van diens uuid.
+        Het resultaat wordt bijgehouden in de metadata cache.
+        """
+        def load() -> dict:
+            response = self.requester.get(
+                url=f'identiteit/api/toezichtgroepen/{toezichtgroep_uuid}')
+            if response.status_code != 200:
+                raise ProcessLookupError(response.content.decode("utf-8"))
+            return response.json()
+
+        return ToezichtgroepDTO.from_dict(self.cache.get_or_load(f'toezichtgroep:uuid:{toezichtgroep_uuid}', load))
+
+    def get_identiteiten(self, toezichter_uuids: Iterable[str], chunk_size: int = 100) -> dict[str, IdentiteitKenmerk]:
+        """
+        Opzoeken van veel identiteiten in een beperkt aantal requests: de uuids die nog niet in de cache zitten worden
+        per chunk opgezocht met de IN operator. Daarna geeft get_identiteit deze identiteiten terug zonder request.
+
+        :param toezichter_uuids: uuids of the identiteiten
+        :type toezichter_uuids: Iterable[str]
+        :param chunk_size: maximum number of uuids per search request
+        :type chunk_size: int
+        :return: the identiteit per uuid, uuids that are not found are left out
+        :rtype: dict[str, IdentiteitKenmerk]
+        """
+        items = self._get_by_uuids('identiteit', 'identiteit/api/identiteiten/search', toezichter_uuids, chunk_size)
+        return {uuid: IdentiteitKenmerk.from_dict(item) for uuid, item in items.items()}
+
+    def get_toezichtgroepen(self, toezichtgroep_uuids: Iterable[str],
+                            chunk_size: int = 100) -> dict[str, ToezichtgroepDTO]:
+        """
+        Opzoeken van veel toezichtgroepen in een beperkt aantal requests, zoals get_identiteiten.
+
+        :param toezichtgroep_uuids: uuids of the toezichtgroepen
+        :type toezichtgroep_uuids: Iterable[str]
+        :param chunk_size: maximum number of uuids per search request
+        :type chunk_size: int
+        :return: the toezichtgroep per uuid, uuids that are not found are left out
+        :rtype: dict[str, ToezichtgroepDTO]
+        """
+        items = self._get_by_uuids('toezichtgroep', 'identiteit/api/toezichtgroepen/search', toezichtgroep_uuids,
+                                   chunk_size)
+        return {uuid: ToezichtgroepDTO.from_dict(item) for uuid, item in items.items()}
+
+    def _get_by_uuids(self, key_prefix: str, url: str, uuids: Iterable[str], chunk_size: int) -> dict[str, dict]:
+        items = {}
+        missing = []
+        for uuid in dict.fromkeys(uuids):
+            item = self.cache.get(f'{key_prefix}:uuid:{uuid}')
+            if item is None:
+                missing.append(uuid)
+            else:
+                items[uuid] = item
+
+        for i in range(0, len(missing), chunk_size):
+            query_dto = QueryDTO(size=chunk_size, from_=0, pagingMode=PagingModeEnum.OFFSET,
+                                 selection=SelectionDTO(
+                                     expressions=[ExpressionDTO(
+                                         terms=[TermDTO(property='uuid',
+                                                        operator=OperatorEnum.IN,
+                                                        value=missing[i:i + chunk_size])])]))
+            for item in self._search(url, query_dto):
+                self.cache.put(f'{key_prefix}:uuid:{item["uuid"]}', item)
+                items[item['uuid']] = item
+        return items
+
+    def _search(self, url: str, query_dto: QueryDTO) -> list[dict]:
+        items = []
+        while True:
+            response = self.requester.post(url, data=query_dto.json())
+            if response.status_code != 200:
+                logging.error(response)
+                raise ProcessLookupError(response.content.decode("utf-8"))
+            json_dict = response.json()
+            items.extend(json_dict['data'])
+            query_dto.from_ += query_dto.size
+            if query_dto.from_ >= json_dict['totalCount']:
+                return items
 
     def search_toezichtgroep_lgc(self, naam: str, type: ToezichtgroepTypeEnum = None) -> Generator[ToezichtgroepDTO]:
         query_dto = QueryDTO(size=10, from_=0, pagingMode=PagingModeEnum.OFFSET,
@@ -129,6 +281,8 @@ class ToezichterService:
         """
         Zoek een toezichter (Legacy) op basis van diens naam, bron en actief.
         Splits de naam op spaties en zoek op ieder deel van de naam.
+        De resultaten worden per pagina opgehaald. Elke identiteit wordt bijgehouden in de metadata cache per uuid
+        voor get_identiteit, het volledige resultaat pas wanneer de generator helemaal doorlopen is.
 
         param naam: Naam van de toezichter
         type naam: str
@@ -138,7 +292,7 @@ class ToezichterService:
         type actief: bool
         """
         # initialize the base query
-        query_dto = QueryDTO(size=5, from_=0, pagingMode=PagingModeEnum.OFFSET,
+        query_dto = QueryDTO(size=100, from_=0, pagingMode=PagingModeEnum.OFFSET,
                              selection=SelectionDTO(expressions=[]))
 
         # Split the name into parts and build search expressions for each part
@@ -187,13 +341,28 @@ class ToezichterService:
         if query_dto.size is None:
             query_dto.size = 100
 
+        cache_key = f'identiteit:naam:{naam}:bron:{bron or ""}:actief:{actief}'
+        items = self.cache.get(cache_key)
+        if items is not None:
+            yield from (IdentiteitKenmerk.from_dict(item) for item in items)
+            return
+
         # paginate through results
+        items = []
         url = "identiteit/api/identiteiten/search"
         while True:
-            response = self.requester.post(url, data=query_dto.json()).json()
-            yield from (IdentiteitKenmerk.from_dict(item) for item in response['data'])
+            response = self.requester.post(url, data=query_dto.json())
+            if response.status_code != 200:
+                logging.error(response)
+                raise ProcessLookupError(response.content.decode("utf-8"))
+            json_dict = response.json()
+            for item in json_dict['data']:
+                self.cache.put(f'identiteit:uuid:{item["uuid"]}', item)
+                items.append(item)
+                yield IdentiteitKenmerk.from_dict(item)
 
             # Update the offset for pagination
             query_dto.from_ += query_dto.size
-            if query_dto.from_ >= response['totalCount']:
-                break
\ No newline at end of file
+            if query_dto.from_ >= json_dict['totalCount']:
+                break
+        self.cache.put(cache_key, items)
\ No newline at end of file
@@ -16,4 +16,24 @@ def is_valid_wkt(wkt_string: str) -> bool:
         geom = wkt.loads(wkt_string)
         return geom.is_valid
     except (ShapelyError, Exception):
-        return False
\ No newline at end of file
+        return False
+
+
+def wkt_equals(wkt_string_1: str | None, wkt_string_2: str | None, tolerance: float = 0.0) -> bool:
+    """
+    Compare two WKT geometries: equal when they have the same type and structure and all coordinates differ at most
+    tolerance. Geometries that can't be parsed are never equal, except for identical strings.
+
+    :param wkt_string_1: Geometry in WKT format
+    :param wkt_string_2: Geometry in WKT format
+    :param tolerance: maximum difference per coordinate, in the unit of the coordinate reference system
+    :return: True if the geometries are equal within the tolerance
+    """
+    if wkt_string_1 == wkt_string_2:
+        return True
+    if not wkt_string_1 or not wkt_string_2:
+        return False
+    try:
+        return wkt.loads(wkt_string_1).equals_exact(wkt.loads(wkt_string_2), tolerance)
+    except (ShapelyError, Exception):
+        return False
@@ -0,0 +1,157 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from requests import Response
+from requests.exceptions import ConnectionError
+
+from API.AbstractRequester import KeepAliveHTTPAdapter
+from API.CookieRequester import CookieRequester
+from API.RetryPolicy import RetryBudget, RetryPolicy
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = b'{}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def local_server_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}/'
+    server.shutdown()
+    server.server_close()
+
+
+def test_pool_settings_are_mounted():
+    requester = CookieRequester(cookie='test', pool_connections=2, pool_maxsize=25, pool_block=True)
+    adapter = requester.get_adapter('https://services.apps.mow.vlaanderen.be/')
+
+    assert isinstance(adapter, KeepAliveHTTPAdapter)
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 25
+    assert adapter._pool_block is True
+
+
+def test_invalid_pool_size():
+    with pytest.raises(ValueError, match='pool_connections and pool_maxsize must be at least 1'):
+        CookieRequester(cookie='test', pool_maxsize=0)
+
+
+def test_connections_are_reused(local_server_url):
+    requester = CookieRequester(cookie='test', first_part_url=local_server_url)
+    for _ in range(5):
+        requester.get('assets')
+
+    stats = requester.get_connection_stats()
+    assert stats['pools'] == 1
+    assert stats['connections_opened'] == 1
+    assert stats['requests_sent'] == 5
+    assert stats['requests_on_reused_connections'] == 4
+
+
+def test_connections_are_not_reused_without_keep_alive(local_server_url):
+    requester = CookieRequester(cookie='test', first_part_url=local_server_url, keep_alive=False)
+    for _ in range(3):
+        requester.get('assets')
+
+    stats = requester.get_connection_stats()
+    assert stats['connections_opened'] == 3
+    assert stats['requests_on_reused_connections'] == 0
+
+
+def create_response(status_code: int, headers: dict = None) -> Response:
+    response = Response()
+    response.status_code = status_code
+    response._content = b'{"message": "error"}'
+    response.headers.update(headers or {})
+    return response
+
+
+class FakeRequestFunc:
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = 0
+
+    def __call__(self, url, **kwargs):
+        result = self.results[self.calls]
+        self.calls += 1
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+
+def create_requester_with_policy(retries: int = 3, **policy_kwargs) -> tuple[CookieRequester, list]:
+    sleeps = []
+    policy = RetryPolicy(sleep=sleeps.append, **policy_kwargs)
+    return CookieRequester(cookie='test', retries=retries, retry_policy=policy), sleeps
+
+
+def test_retry_on_retryable_status_with_exponential_backoff():
+    requester, sleeps = create_requester_with_policy(retries=4, backoff_factor=1, jitter=False)
+    request_func = FakeRequestFunc(create_response(503), create_response(502), create_response(500),
+                                   create_response(200))
+
+    response = requester._request_with_retries(request_func, 'GET', 'assets')
+
+    assert response.status_code == 200
+    assert request_func.calls == 4
+    assert sleeps == [1, 2, 4]
+
+
+def test_no_retry_on_client_error():
+    requester, sleeps = create_requester_with_policy()
+    request_func = FakeRequestFunc(create_response(404), create_response(200))
+
+    with pytest.raises(RuntimeError, match='GET request failed after 1 retries'):
+        requester._request_with_retries(request_func, 'GET', 'assets')
+    assert request_func.calls == 1
+    assert sleeps == []
+
+
+def test_retry_on_connection_error():
+    requester, sleeps = create_requester_with_policy(backoff_factor=0)
+    request_func = FakeRequestFunc(ConnectionError('reset'), create_response(200))
+
+    assert requester._request_with_retries(request_func, 'GET', 'assets').status_code == 200
+    assert request_func.calls == 2
+
+
+def test_retry_after_header_is_respected():
+    requester, sleeps = create_requester_with_policy(backoff_factor=1, max_backoff=10)
+    request_func = FakeRequestFunc(create_response(429, {'Retry-After': '7'}),
+                                   create_response(429, {'Retry-After': '120'}), create_response(200))
+
+    requester._request_with_retries(request_func, 'GET', 'assets')
+    assert sleeps == [7, 10]
+
+
+def test_jitter_stays_within_backoff():
+    policy = RetryPolicy(backoff_factor=2, max_backoff=5)
+    for retry_number in range(1, 6):
+        assert 0 <= policy.get_backoff(retry_number) <= min(2 * 2 ** (retry_number - 1), 5)
+
+
+def test_retry_budget_stops_retries():
+    requester, sleeps = create_requester_with_policy(retries=5, backoff_factor=0,
+                                                     budget=RetryBudget(max_tokens=2, token_ratio=0.5))
+    request_func = FakeRequestFunc(*[create_response(503)] * 5)
+
+    with pytest.raises(RuntimeError, match='failed after 3 retries'):
+        requester._request_with_retries(request_func, 'GET', 'assets')
+    assert requester.retry_policy.budget.tokens == 0
+
+    requester._request_with_retries(FakeRequestFunc(create_response(200)), 'GET', 'assets')
+    assert requester.retry_policy.budget.tokens == 0.5
@@ -0,0 +1,107 @@
+from types import SimpleNamespace
+
+import pytest
+
+from API.eminfra.AssetMirror import AssetMirror
+from API.eminfra.EMInfraDomain import AssetDTO, FeedPage, QueryDTO
+from API.eminfra.FeedService import FeedService
+
+
+def create_asset_dict(uuid: str, naam: str, parent_uuid: str = None) -> dict:
+    asset_dict = {'_type': 'onderdeel', 'uuid': uuid, 'createdOn': '2024-01-01', 'modifiedOn': '2024-01-01',
+                  'actief': True, 'naam': naam, 'links': [],
+                  'type': {'_type': 'onderdeeltype', 'uuid': 'type-1', 'createdOn': '2020-01-01',
+                           'modifiedOn': '2020-01-01', 'uri': 'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#Camera',
+                           'korteUri': 'onderdeel#Camera', 'naam': 'Camera', 'actief': True, 'definitie': 'camera',
+                           'links': []}}
+    if parent_uuid is not None:
+        asset_dict['parent'] = {'_type': 'beheerobject', 'uuid': parent_uuid, 'createdOn': '2020-01-01',
+                                'modifiedOn': '2020-01-01', 'naam': 'parent', 'actief': True, 'links': []}
+    return asset_dict
+
+
+class FakeAssetService:
+    def __init__(self, asset_dicts: list[dict]):
+        self.assets = {d['uuid']: d for d in asset_dicts}
+
+    def search_assets_generator(self, query_dto: QueryDTO, prefetch_workers: int = 0):
+        if query_dto.selection is None:
+            uuids = list(self.assets)
+        else:
+            uuids = query_dto.selection.expressions[0].terms[0].value
+        yield from (AssetDTO.from_dict(self.assets[uuid]) for uuid in uuids if uuid in self.assets)
+
+
+class FakeFeedService(FeedService):
+    def __init__(self):
+        super().__init__(requester=None)
+        self.entries = [self.create_entry(i, 'bootstrapped') for i in range(5)]
+        self.requested_pages = []
+
+    @staticmethod
+    def create_entry(i: int, uuid: str) -> dict:
+        return {'id': str(i), 'updated': '2024-01-01', '_type': 'entry',
+                'content': {'value': {'_type': 'NAAM_GEWIJZIGD', 'aggregateId': {'uuid': uuid, '_type': 'onderdeel'}}}}
+
+    def create_page(self, page_num: int, page_size: int) -> FeedPage:
+        return FeedPage.from_dict({
+            'id': str(page_num), 'base': '', 'title': 'assets', 'updated': '2024-01-01',
+            'generator': {'uri': '', 'version': '1'},
+            'links': [{'rel': 'self', 'href': f'/{page_num}/{page_size}'}],
+            'entries': self.entries[page_num * page_size:(page_num + 1) * page_size]})
+
+    def get_current_feedproxy_page(self, feed_name: str) -> FeedPage:
+        return self.create_page(len(self.entries) // 2, 2)
+
+    def get_feedproxy_page(self, feed_name: str, page_num: int, page_size: int = 1) -> FeedPage:
+        self.requested_pages.append(page_num)
+        return self.create_page(page_num, page_size)
+
+
+@pytest.fixture
+def mirror():
+    asset_service = FakeAssetService([create_asset_dict('a1', 'camera 1', parent_uuid='p1'),
+                                      create_asset_dict('a2', 'camera 2', parent_uuid='p1'),
+                                      create_asset_dict('a3', 'camera 3')])
+    client = SimpleNamespace(asset_service=asset_service, feed_service=FakeFeedService())
+    with AssetMirror(client, ':memory:', page_size=2) as asset_mirror:
+        yield asset_mirror
+
+
+def test_bootstrap_and_lookups(mirror):
+    assert mirror.bootstrap() == 3
+
+    assert mirror.get_asset_by_uuid('a1').naam == 'camera 1'
+    assert mirror.get_asset_by_uuid('unknown') is None
+    assert [a.uuid for a in mirror.get_assets_by_naam('camera 2')] == ['a2']
+    assert [a.uuid for a in mirror.get_assets_by_type(
+        'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#Camera')] == ['a1', 'a2', 'a3']
+    assert [a.uuid for a in mirror.get_assets_by_parent('p1')] == ['a1', 'a2']
+
+
+def test_sync_before_bootstrap(mirror):
+    with pytest.raises(ValueError):
+        mirror.sync()
+
+
+def test_sync_applies_feed_entries(mirror):
+    mirror.bootstrap()
+    feed_service = mirror.feed_service
+    asset_service = mirror.asset_service
+
+    asset_service.assets['a1']['naam'] = 'renamed'
+    asset_service.assets['a4'] = create_asset_dict('a4', 'camera 4')
+    del asset_service.assets['a3']
+    feed_service.entries.extend([feed_service.create_entry(5, 'a1'), feed_service.create_entry(6, 'a4'),
+                                 feed_service.create_entry(7, 'a3')])
+
+    assert mirror.sync() == 4
+    # bootstrapped at page 2, which was not full yet
+    assert feed_service.requested_pages == [2, 3, 4]
+    assert mirror.get_asset_by_uuid('a1').naam == 'renamed'
+    assert mirror.get_asset_by_uuid('a4').naam == 'camera 4'
+    assert mirror.get_asset_by_uuid('a3') is None
+
+    # continues from the last page, that is not full
+    assert mirror.sync() == 0
+    assert feed_service.requested_pages == [2, 3, 4, 4]
@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from API.eminfra.AssettypeCatalogue import AssettypeCatalogue
+from API.eminfra.AssettypeService import AssettypeService
+from UnitTests.FakeRequester import FakeRequester, paged_response
+
+
+def create_assettype_dict(uuid: str, korte_uri: str) -> dict:
+    namespace = 'https://lgc.data.wegenenverkeer.be/ns/' if korte_uri.startswith('lgc:') else \
+        'https://wegenenverkeer.data.vlaanderen.be/ns/'
+    return {'_type': 'onderdeeltype', 'uuid': uuid, 'createdOn': '2020-01-01', 'modifiedOn': '2020-01-01',
+            'uri': namespace + korte_uri.removeprefix('lgc:'), 'korteUri': korte_uri,
+            'naam': korte_uri.split('#')[-1], 'actief': True, 'definitie': '', 'links': []}
+
+
+ASSETTYPE_DICTS = [create_assettype_dict('uuid-1', 'onderdeel#Camera'),
+                   create_assettype_dict('uuid-2', 'lgc:installatie#Kast'),
+                   create_assettype_dict('uuid-3', 'onderdeel#Wegkantkast')]
+
+
+@pytest.fixture
+def catalogue() -> AssettypeCatalogue:
+    requester = FakeRequester().route(
+        'GET', 'core/api/assettypes',
+        lambda request: paged_response(ASSETTYPE_DICTS, int(request.query['from']), int(request.query['size'])))
+    catalogue = AssettypeService(requester).get_assettype_catalogue(size=2)
+    assert len(requester.requests) == 2
+    return catalogue
+
+
+def test_lookups(catalogue):
+    assert len(catalogue) == 3
+    assert catalogue.get_by_uri('https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#Camera').uuid == 'uuid-1'
+    assert catalogue.get_by_uuid('uuid-2').korteUri == 'lgc:installatie#Kast'
+    assert catalogue.get_by_korte_uri('onderdeel#Wegkantkast').uuid == 'uuid-3'
+    assert catalogue.get_by_uuid('unknown') is None
+    assert 'https://lgc.data.wegenenverkeer.be/ns/installatie#Kast' in catalogue
+    assert [a.uuid for a in catalogue.get_legacy_assettypes()] == ['uuid-2']
+    assert [a.uuid for a in catalogue.get_otl_assettypes()] == ['uuid-1', 'uuid-3']
+
+
+def test_save_and_load(catalogue, tmp_path):
+    catalogue.save(tmp_path / 'assettypes.json')
+
+    loaded = AssettypeCatalogue.load(tmp_path / 'assettypes.json')
+
+    assert loaded.created == catalogue.created
+    assert [a.asdict() for a in loaded] == [a.asdict() for a in catalogue]
+    assert loaded.get_by_korte_uri('onderdeel#Camera').uuid == 'uuid-1'
+
+
+def test_load_other_version(tmp_path):
+    (tmp_path / 'assettypes.json').write_text(json.dumps({'version': 0, 'created': '', 'assettypes': []}))
+
+    with pytest.raises(ValueError):
+        AssettypeCatalogue.load(tmp_path / 'assettypes.json')
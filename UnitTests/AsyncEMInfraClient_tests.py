@@ -0,0 +1,88 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from API.Enums import AuthType, Environment
+from API.eminfra.AsyncEMInfraClient import AsyncEMInfraClient, AsyncService
+
+
+class SlowService:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def get_value(self, value: int) -> int:
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.05)
+        with self.lock:
+            self.running -= 1
+        return value
+
+    def search_values_generator(self, count: int):
+        yield from range(count)
+
+    def get_values_generator(self, count: int):
+        return (value for value in range(count))
+
+
+def test_async_methods_respect_concurrency_limit():
+    service = SlowService()
+
+    async def run():
+        async_service = AsyncService(service, asyncio.Semaphore(3))
+        return await asyncio.gather(*[async_service.get_value(i) for i in range(12)])
+
+    assert asyncio.run(run()) == list(range(12))
+    assert service.max_running == 3
+
+
+def test_generator_methods_become_async_generators():
+    async def run():
+        async_service = AsyncService(SlowService(), asyncio.Semaphore(1), generator_batch_size=4)
+        return [value async for value in async_service.search_values_generator(10)]
+
+    assert asyncio.run(run()) == list(range(10))
+
+
+def test_methods_returning_a_generator_become_async_generators():
+    async def run():
+        async_service = AsyncService(SlowService(), asyncio.Semaphore(1), generator_batch_size=4)
+        values = [value async for value in async_service.get_values_generator(10)]
+        with pytest.raises(TypeError):
+            [value async for value in async_service.get_value(1)]
+        return values
+
+    assert asyncio.run(run()) == list(range(10))
+
+
+def test_client_built_outside_the_event_loop():
+    client = AsyncEMInfraClient(auth_type=AuthType.COOKIE, env=Environment.PRD, cookie='test', max_concurrency=2)
+    service = SlowService()
+    async_service = AsyncService(service, client.semaphore)
+
+    async def run():
+        return await asyncio.gather(*[async_service.get_value(i) for i in range(6)])
+
+    # every asyncio.run is a new event loop
+    assert asyncio.run(run()) == list(range(6))
+    assert asyncio.run(run()) == list(range(6))
+    assert service.max_running == 2
+
+
+def test_client_mirrors_sync_services():
+    client = AsyncEMInfraClient(auth_type=AuthType.COOKIE, env=Environment.PRD, cookie='test', max_concurrency=20)
+
+    assert client.requester.first_part_url == 'https://apps.mow.vlaanderen.be/eminfra/'
+    assert client.requester.pool_maxsize == 20
+    for service_name in AsyncEMInfraClient.service_names:
+        assert getattr(client, service_name)._service is getattr(client.client, service_name)
+
+
+def test_invalid_max_concurrency():
+    with pytest.raises(ValueError):
+        AsyncEMInfraClient(auth_type=AuthType.COOKIE, env=Environment.PRD, cookie='test', max_concurrency=0)
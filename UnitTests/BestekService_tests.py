@@ -0,0 +1,117 @@
+from datetime import datetime
+
+import pytest
+
+from API.eminfra.BestekService import BestekService
+from API.eminfra.EMInfraDomain import (BestekKoppelingOperation, BestekKoppelingOperationEnum, BestekRef,
+                                       BulkUpdateStatusEnum)
+from API.eminfra.MetadataCache import MetadataCache
+from UnitTests.FakeRequester import FakeRequester, FakeRequest, FakeResponse, asset_handler
+
+
+def create_bestekref_dict(uuid: str) -> dict:
+    return {'uuid': uuid, 'type': 'bestekref', 'actief': True, 'links': [], 'eDeltaDossiernummer': f'dossier {uuid}',
+            'eDeltaBesteknummer': f'bestek {uuid}'}
+
+
+def create_koppeling_dict(bestekref_uuid: str, eind_datum: str = None) -> dict:
+    return {'bestekRef': create_bestekref_dict(bestekref_uuid), 'status': 'ACTIEF',
+            'startDatum': '2020-01-01T00:00:00.000+01:00', 'eindDatum': eind_datum, 'categorie': 'WERKBESTEK'}
+
+
+def koppelingen_requester(koppelingen: dict[str, list[dict]]) -> FakeRequester:
+    return (FakeRequester()
+            .route('GET', r'core/api/installaties/([^/]+)/kenmerken/[^/]+/bestekken',
+                   asset_handler({asset_uuid: {'data': items} for asset_uuid, items in koppelingen.items()}))
+            .route('PUT', r'core/api/assets/([^/]+)/kenmerken/[^/]+/bestekken',
+                   lambda request: FakeResponse(status_code=202)))
+
+
+def get_puts(requester: FakeRequester) -> dict[str, list[dict]]:
+    return {request.params[0]: request.body['data'] for request in requester.get_requests('PUT')}
+
+
+def test_bulk_update_bestekkoppelingen():
+    requester = koppelingen_requester({'a1': [create_koppeling_dict('old')],
+                               'a2': [create_koppeling_dict('new')],
+                               'a3': [create_koppeling_dict('old'), create_koppeling_dict('other')]})
+    service = BestekService(requester)
+    old, new = BestekRef.from_dict(create_bestekref_dict('old')), BestekRef.from_dict(create_bestekref_dict('new'))
+    replace = [BestekKoppelingOperation(BestekKoppelingOperationEnum.END, old, end_datetime=datetime(2024, 1, 1)),
+               BestekKoppelingOperation(BestekKoppelingOperationEnum.ADD, new, start_datetime=datetime(2024, 1, 1))]
+
+    results = service.bulk_update_bestekkoppelingen(
+        [(asset_uuid, operation) for asset_uuid in ('a1', 'a2', 'unknown') for operation in replace] +
+        [('a3', BestekKoppelingOperation(BestekKoppelingOperationEnum.REMOVE, old))], workers=2)
+
+    assert [(r.asset_uuid, r.status) for r in results] == [
+        ('a1', BulkUpdateStatusEnum.UPDATED), ('a2', BulkUpdateStatusEnum.UNCHANGED),
+        ('unknown', BulkUpdateStatusEnum.FAILED), ('a3', BulkUpdateStatusEnum.UPDATED)]
+    assert results[2].error == 'asset not found'
+    assert sorted(request.params[0] for request in requester.get_requests('GET')) == ['a1', 'a2', 'a3', 'unknown']
+    puts = get_puts(requester)
+    assert set(puts) == {'a1', 'a3'}
+    assert [(k['bestekRef']['uuid'], k['startDatum'], k['eindDatum']) for k in puts['a1']] == [
+        ('new', '2024-01-01T00:00:00.000+01:00', None),
+        ('old', '2020-01-01T00:00:00.000+01:00', '2024-01-01T00:00:00.000+01:00')]
+    assert [k['bestekRef']['uuid'] for k in puts['a3']] == ['other']
+
+
+def test_bulk_update_end_of_already_ended_koppeling_is_unchanged():
+    requester = koppelingen_requester(
+        {'a1': [create_koppeling_dict('old', eind_datum='2024-01-01T00:00:00.000+01:00')]})
+    service = BestekService(requester)
+
+    results = service.bulk_update_bestekkoppelingen(
+        [('a1', BestekKoppelingOperation(BestekKoppelingOperationEnum.END,
+                                         BestekRef.from_dict(create_bestekref_dict('old')),
+                                         end_datetime=datetime(2024, 1, 1)))])
+
+    assert results[0].status == BulkUpdateStatusEnum.UNCHANGED
+    assert get_puts(requester) == {}
+
+
+def get_search_term(request: FakeRequest) -> dict:
+    return request.body['selection']['expressions'][0]['terms'][0]
+
+
+def bestekref_requester(bestekref_dicts: list[dict]) -> FakeRequester:
+    def search_bestekrefs(request: FakeRequest) -> dict:
+        term = get_search_term(request)
+        values = term['value'] if term['operator'] == 'IN' else [term['value']]
+        data = [d for d in bestekref_dicts if d[term['property']] in values]
+        return {'data': data, 'from': 0, 'totalCount': len(data)}
+
+    return FakeRequester().route('POST', 'core/api/bestekrefs/search', search_bestekrefs)
+
+
+def get_searches(requester: FakeRequester) -> list:
+    return [get_search_term(request)['value'] for request in requester.requests]
+
+
+def test_get_bestekref_is_cached():
+    requester = bestekref_requester([create_bestekref_dict('1')])
+    service = BestekService(requester, cache=MetadataCache())
+
+    for _ in range(3):
+        assert service.get_bestekref(eDelta_dossiernummer='dossier 1').uuid == '1'
+    with pytest.raises(ValueError):
+        service.get_bestekref(eDelta_dossiernummer='dossier 2')
+
+    assert get_searches(requester) == ['dossier 1', 'dossier 2']
+
+
+def test_get_bestekrefs_prefetches_in_chunks():
+    requester = bestekref_requester([create_bestekref_dict(str(i)) for i in range(5)] +
+                                    [create_bestekref_dict('4')])
+    service = BestekService(requester, cache=MetadataCache())
+    service.get_bestekref(eDelta_besteknummer='bestek 0')
+
+    bestekrefs = service.get_bestekrefs(eDelta_besteknummers=['bestek 0', 'bestek 1', 'bestek 2', 'bestek 3',
+                                                               'bestek 4', 'bestek 1'], chunk_size=2)
+
+    assert {nummer: ref.uuid for nummer, ref in bestekrefs.items()} == {
+        'bestek 0': '0', 'bestek 1': '1', 'bestek 2': '2', 'bestek 3': '3'}
+    assert get_searches(requester) == ['bestek 0', ['bestek 1', 'bestek 2'], ['bestek 3', 'bestek 4']]
+    assert service.get_bestekref(eDelta_besteknummer='bestek 3').uuid == '3'
+    assert len(requester.requests) == 3
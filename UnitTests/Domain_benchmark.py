@@ -0,0 +1,57 @@
+"""
+Compares the construction of DTO's through from_dict (generated decoder) with the reflective path: cls(**d) after
+renaming the reserved words, converting the nested classes and enums in __post_init__, recursively.
+
+Run with: python -m UnitTests.Domain_benchmark
+"""
+import copy
+import timeit
+from contextlib import contextmanager
+
+from API.eminfra.EMInfraDomain import AssetDTO, BaseDataclass, RESERVED_WORD_RENAMES
+from UnitTests.Domain_tests import ASSET_DICT
+
+
+def reflective_from_dict(cls, dict_: dict):
+    dict_ = {RESERVED_WORD_RENAMES.get(k, k): v for k, v in dict_.items()}
+    return cls(**dict_)
+
+
+@contextmanager
+def reflective_path():
+    """Use reflective_from_dict for nested classes too"""
+    from_dict = BaseDataclass.__dict__['from_dict']
+    BaseDataclass.from_dict = classmethod(reflective_from_dict)
+    try:
+        yield
+    finally:
+        BaseDataclass.from_dict = from_dict
+
+
+def create_asset_dicts(count: int) -> list[dict]:
+    asset_dicts = []
+    for i in range(count):
+        asset_dict = copy.deepcopy(ASSET_DICT)
+        asset_dict['uuid'] = f'00000000-0000-0000-0000-{i:012d}'
+        asset_dict['parent'] = {'_type': 'beheerobject', 'uuid': f'10000000-0000-0000-0000-{i:012d}',
+                                'createdOn': '2020-01-01', 'modifiedOn': '2020-01-01', 'naam': f'parent_{i}',
+                                'actief': True, 'links': [{'rel': 'self', 'href': '/core/api/beheerobjecten/'}]}
+        asset_dicts.append(asset_dict)
+    return asset_dicts
+
+
+def benchmark(count: int = 100_000, repeat: int = 3) -> None:
+    asset_dicts = create_asset_dicts(count)
+    with reflective_path():
+        expected = [AssetDTO.from_dict(d) for d in asset_dicts[:10]]
+        reflective = min(timeit.repeat(lambda: [AssetDTO.from_dict(d) for d in asset_dicts], number=1, repeat=repeat))
+    assert [AssetDTO.from_dict(d) for d in asset_dicts[:10]] == expected
+    decoder = min(timeit.repeat(lambda: [AssetDTO.from_dict(d) for d in asset_dicts], number=1, repeat=repeat))
+
+    print(f'{count} AssetDTO objects')
+    print(f'cls(**d) + __post_init__: {reflective:.3f} s')
+    print(f'from_dict (decoder):      {decoder:.3f} s ({reflective / decoder:.1f}x)')
+
+
+if __name__ == '__main__':
+    benchmark()
@@ -1,8 +1,13 @@
+import copy
+import dataclasses
 import json
 from dataclasses import dataclass
 from enum import Enum
 
-from API.eminfra.EMInfraDomain import TermDTO, BaseDataclass
+import pytest
+
+from API.eminfra.EMInfraDomain import (TermDTO, BaseDataclass, AssetDTO, AssetDTOToestand, AssettypeDTO, Link,
+                                       QueryDTO, PagingModeEnum, DTOList)
 
 
 class TestEnum(Enum):
@@ -54,6 +59,14 @@ def test_reserved_prop():
                            'prop_object': None, 'test_enum': None}
 
 
+def test_reserved_prop_next():
+    dto_list = DTOList(links=[], _from=0, totalCount=1, size=10, _next='next page', previous=None, data=[])
+    d = dto_list.asdict()
+    assert d['next'] == 'next page'
+    assert '_next' not in d
+    assert DTOList.from_dict(d) == dto_list
+
+
 def test_nested_class():
     n = NestingTestClass(nested=TestClass(prop_str='test', prop_list_str=['test1', 'test2'], prop_bool=True))
     d = n.asdict()
@@ -83,3 +96,49 @@ def test_nested_class_list():
 
     n_created = NestingTestClass.from_dict(d)
     assert n_created == n
+
+
+ASSET_DICT = {
+    '_type': 'onderdeel', 'uuid': '00000000-0000-0000-0000-000000000001', 'createdOn': '2024-01-01T00:00:00.000+01:00',
+    'modifiedOn': '2024-01-02T00:00:00.000+01:00', 'actief': True, 'toestand': 'IN_GEBRUIK', 'naam': 'asset',
+    'links': [{'rel': 'self', 'href': '/core/api/assets/00000000-0000-0000-0000-000000000001'}],
+    'type': {'_type': 'onderdeeltype', 'uuid': '00000000-0000-0000-0000-000000000002', 'createdOn': '2020-01-01',
+             'modifiedOn': '2020-01-01', 'uri': 'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#Camera',
+             'korteUri': 'onderdeel#Camera', 'naam': 'Camera', 'actief': True, 'definitie': 'camera',
+             'links': [{'rel': 'self', 'href': '/core/api/onderdeeltypes/00000000-0000-0000-0000-000000000002'}]}}
+
+
+def test_from_dict_converts_nested_classes_and_enums():
+    asset = AssetDTO.from_dict(copy.deepcopy(ASSET_DICT))
+
+    assert asset == AssetDTO(**copy.deepcopy(ASSET_DICT))
+    assert asset.toestand == AssetDTOToestand.IN_GEBRUIK
+    assert isinstance(asset.type, AssettypeDTO)
+    assert asset.type.links == [Link(rel='self', href='/core/api/onderdeeltypes/00000000-0000-0000-0000-000000000002')]
+    assert asset.parent is None
+
+
+def test_from_dict_does_not_modify_dict():
+    d = {'size': 10, 'from': 20, 'pagingMode': 'OFFSET'}
+    query = QueryDTO.from_dict(d)
+
+    assert d == {'size': 10, 'from': 20, 'pagingMode': 'OFFSET'}
+    assert query.from_ == 20
+    assert query.pagingMode == PagingModeEnum.OFFSET
+    assert query.settings == {}
+
+
+def test_from_dict_invalid_keys():
+    with pytest.raises(TypeError, match="unexpected keyword argument 'unknown'"):
+        TestClass.from_dict({'unknown': 1})
+    with pytest.raises(TypeError, match="missing 1 required argument"):
+        Link.from_dict({'rel': 'self'})
+
+
+def test_json_renames_reserved_words_and_enums():
+    query = QueryDTO(size=10, from_=20, pagingMode=PagingModeEnum.OFFSET)
+
+    assert json.loads(query.json()) == {
+        'size': 10, 'from': 20, 'fromCursor': None, 'orderByProperty': None, 'settings': {}, 'selection': None,
+        'expansions': None, 'orderByDirection': None, 'pagingMode': 'OFFSET'}
+    assert dataclasses._asdict_inner.__module__ == 'dataclasses'
@@ -0,0 +1,95 @@
+import pytest
+
+from API.eminfra.EigenschapService import EigenschapService
+from API.eminfra.EMInfraDomain import BulkUpdateStatusEnum, Eigenschap, EigenschapValueUpdateDTO
+from API.eminfra.MetadataCache import MetadataCache
+from UnitTests.FakeRequester import FakeRequester, FakeResponse, paged_response
+
+
+def create_eigenschap(naam: str) -> Eigenschap:
+    return Eigenschap.from_dict({'uuid': f'eigenschap-{naam}', 'createdOn': '2020-01-01', 'modifiedOn': '2020-01-01',
+                                 'uri': f'https://wegenenverkeer.data.vlaanderen.be/ns/abstracten#{naam}',
+                                 'label': naam, 'naam': naam, 'alleenLezen': False, 'actief': True, 'definitie': '',
+                                 'categorie': 'OTL', 'type': {}, 'links': []})
+
+
+def create_value_dict(naam: str, value: str) -> dict:
+    return {'typedValue': {'_type': 'text', 'value': value}, 'determinedOn': '2024-01-01', 'determinedBy': 'test',
+            'eigenschap': create_eigenschap(naam).asdict(), 'actief': True,
+            'kenmerkType': {'uuid': 'kenmerk', 'createdOn': '2020-01-01', 'modifiedOn': '2020-01-01', 'naam': 'k',
+                            'actief': True, 'predefined': True, 'standard': True, 'definitie': '', 'links': []}}
+
+
+def create_update(naam: str, value: str) -> EigenschapValueUpdateDTO:
+    return EigenschapValueUpdateDTO(typedValue={'_type': 'text', 'value': value}, eigenschap=create_eigenschap(naam))
+
+
+def eigenschapwaarden_requester(values: dict[str, list[dict]]) -> FakeRequester:
+    url_pattern = r'core/api/assets/([^/]+)/kenmerken/([^/]+)/eigenschapwaarden'
+    return (FakeRequester()
+            .route('GET', url_pattern, lambda request: {'data': values[request.params[0]]})
+            .route('PATCH', url_pattern, lambda request: FakeResponse(status_code=202)))
+
+
+def test_bulk_update_eigenschappen():
+    requester = eigenschapwaarden_requester({'a1': [create_value_dict('merk', 'A'), create_value_dict('hoogte', '10')],
+                                             'a2': [create_value_dict('merk', 'A')]})
+    service = EigenschapService(requester)
+
+    results = service.bulk_update_eigenschappen(
+        [('a1', 'kenmerk', create_update('merk', 'B')),
+         ('a2', 'kenmerk', create_update('merk', 'A')),
+         ('a1', 'kenmerk', create_update('hoogte', '10')),
+         ('a1', 'kenmerk', create_update('kleur', 'rood')),
+         ('unknown', 'kenmerk', create_update('merk', 'A'))], workers=2)
+
+    assert [(r.asset_uuid, r.status) for r in results] == [
+        ('a1', BulkUpdateStatusEnum.UPDATED), ('a2', BulkUpdateStatusEnum.UNCHANGED),
+        ('unknown', BulkUpdateStatusEnum.FAILED)]
+    assert sorted(request.params for request in requester.get_requests('GET')) == [
+        ('a1', 'kenmerk'), ('a2', 'kenmerk'), ('unknown', 'kenmerk')]
+    assert [(request.params[0], {d['eigenschap']['naam']: d['typedValue']['value'] for d in request.body['data']})
+            for request in requester.get_requests('PATCH')] == [('a1', {'merk': 'B', 'kleur': 'rood'})]
+
+
+def catalogue_requester(eigenschappen: list[Eigenschap],
+                        kenmerktype_eigenschappen: dict[str, list[Eigenschap]]) -> FakeRequester:
+    eigenschap_dicts = [eigenschap.asdict() for eigenschap in eigenschappen]
+    return (FakeRequester()
+            .route('GET', 'core/api/eigenschappen',
+                   lambda request: paged_response(eigenschap_dicts, int(request.query['from']),
+                                                  int(request.query['size'])))
+            .route('GET', r'core/api/kenmerktypes/([^/]+)/eigenschappen',
+                   lambda request: {'data': [{'eigenschap': e.asdict()}
+                                             for e in kenmerktype_eigenschappen[request.params[0]]]}))
+
+
+def create_eigenschap_with_uri(naam: str, uri: str) -> Eigenschap:
+    eigenschap = create_eigenschap(naam)
+    eigenschap.uuid, eigenschap.uri = f'eigenschap-{uri}', uri
+    return eigenschap
+
+
+def test_get_eigenschap_resolves_locally(tmp_path):
+    onderdeel = 'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#'
+    merk_camera = create_eigenschap_with_uri('merk', f'{onderdeel}Camera.merk')
+    merk_kast = create_eigenschap_with_uri('merk', f'{onderdeel}Kast.merk')
+    eigenschappen = [merk_camera, merk_kast] + [create_eigenschap(f'e{i}') for i in range(150)]
+    requester = catalogue_requester(eigenschappen, {'kenmerk-camera': [merk_camera]})
+    service = EigenschapService(requester, cache=MetadataCache(path=tmp_path / 'cache.sqlite'))
+
+    assert service.get_eigenschap('e1').uuid == 'eigenschap-e1'
+    assert service.get_eigenschap('merk', uri='Kast').uuid == merk_kast.uuid
+    assert service.get_eigenschap('merk', kenmerktype_uuid='kenmerk-camera').uuid == merk_camera.uuid
+    assert service.get_eigenschap('merk', kenmerktype_uuid='kenmerk-camera').uuid == merk_camera.uuid
+    with pytest.raises(ValueError):
+        service.get_eigenschap('merk')
+    assert [e.uuid for e in service.search_eigenschappen('merk', use_index=True)] == [merk_camera.uuid,
+                                                                                       merk_kast.uuid]
+    assert len(requester.requests) == 3
+
+    # a new service with the same cache file doesn't need any request
+    requester.requests.clear()
+    service = EigenschapService(requester, cache=MetadataCache(path=tmp_path / 'cache.sqlite'))
+    assert len(service.get_eigenschap_index()) == 152
+    assert requester.requests == []
@@ -0,0 +1,109 @@
+import json
+import re
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from urllib.parse import parse_qs, urlparse
+
+
+@dataclass
+class FakeRequest:
+    method: str
+    url: str
+    # the groups of the url pattern of the route
+    params: tuple[str, ...]
+    # the json or data of the request, decoded
+    body: dict | list | None
+
+    @property
+    def query(self) -> dict[str, str]:
+        return {key: values[0] for key, values in parse_qs(urlparse(self.url).query).items()}
+
+
+class FakeResponse:
+    def __init__(self, body: dict | list | None = None, status_code: int = 200, content: bytes = None,
+                 headers: dict = None):
+        self.status_code = status_code
+        self._body = body
+        self.content = content if content is not None else json.dumps(body).encode()
+        self.headers = headers or {}
+
+    def json(self) -> dict | list | None:
+        return self._body
+
+
+def error_response(status_code: int, message: str) -> FakeResponse:
+    return FakeResponse(status_code=status_code, content=message.encode())
+
+
+def asset_handler(responses: dict[str, dict | list]) -> Callable[[FakeRequest], FakeResponse | dict | list]:
+    """Handler that answers with the response for the asset uuid, the first group of the url pattern."""
+    def handle(request: FakeRequest) -> FakeResponse | dict | list:
+        if request.params[0] not in responses:
+            return error_response(404, 'asset not found')
+        return responses[request.params[0]]
+    return handle
+
+
+def paged_response(items: list, from_: int, size: int) -> FakeResponse:
+    """A page of an OFFSET paged endpoint, the 'data' from from_ on."""
+    return FakeResponse({'data': items[from_:from_ + size], 'from': from_, 'totalCount': len(items)})
+
+
+def search_response(items: list, request: FakeRequest) -> FakeResponse:
+    """The page of items a search endpoint returns for the QueryDTO in the request."""
+    return paged_response(items, from_=request.body.get('from') or 0, size=request.body.get('size') or 100)
+
+
+class FakeRequester:
+    """
+    Requester for the service tests. A request is answered by the handler of the first route of which the method
+    matches and the url pattern (a regex) fully matches the url without query string. The handler gets the FakeRequest
+    and returns a FakeResponse, or a json body for a 200 response. All requests are kept in requests.
+    A request without a matching route fails the test.
+    """
+    def __init__(self):
+        self.routes: list[tuple[str, re.Pattern, Callable[[FakeRequest], FakeResponse | dict | list]]] = []
+        self.requests: list[FakeRequest] = []
+        self._lock = threading.Lock()
+
+    def route(self, method: str, url_pattern: str,
+              handler: Callable[[FakeRequest], FakeResponse | dict | list]) -> 'FakeRequester':
+        self.routes.append((method, re.compile(url_pattern), handler))
+        return self
+
+    def get_requests(self, method: str = None, url_pattern: str = None) -> list[FakeRequest]:
+        return [request for request in self.requests if (method is None or request.method == method) and
+                (url_pattern is None or re.fullmatch(url_pattern, request.url.split('?')[0]))]
+
+    def _request(self, method: str, url: str, data: str = None, json_body: dict | list = None) -> FakeResponse:
+        path = url.split('?')[0]
+        for route_method, pattern, handler in self.routes:
+            match = pattern.fullmatch(path) if route_method == method else None
+            if match is not None:
+                break
+        else:
+            raise AssertionError(f'Unexpected request: {method} {url}')
+
+        request = FakeRequest(method=method, url=url, params=match.groups(),
+                              body=json_body if json_body is not None else json.loads(data) if data else None)
+        # the services can call the requester from several threads
+        with self._lock:
+            self.requests.append(request)
+            response = handler(request)
+        return response if isinstance(response, FakeResponse) else FakeResponse(response)
+
+    def get(self, url: str, **kwargs) -> FakeResponse:
+        return self._request('GET', url)
+
+    def post(self, url: str, data: str = None, json: dict | list = None, **kwargs) -> FakeResponse:
+        return self._request('POST', url, data=data, json_body=json)
+
+    def put(self, url: str, data: str = None, json: dict | list = None, **kwargs) -> FakeResponse:
+        return self._request('PUT', url, data=data, json_body=json)
+
+    def patch(self, url: str, data: str = None, json: dict | list = None, **kwargs) -> FakeResponse:
+        return self._request('PATCH', url, data=data, json_body=json)
+
+    def delete(self, url: str, **kwargs) -> FakeResponse:
+        return self._request('DELETE', url)
@@ -0,0 +1,95 @@
+from itertools import islice
+
+from API.eminfra.EMInfraDomain import FeedCheckpoint, FeedPage
+from API.eminfra.FeedService import FeedService, FeedCheckpointStore, JsonFileFeedCheckpointStore
+
+
+class MemoryFeedCheckpointStore(FeedCheckpointStore):
+    def __init__(self, checkpoint: FeedCheckpoint = None):
+        self.checkpoint = checkpoint
+
+    def load(self) -> FeedCheckpoint | None:
+        return self.checkpoint
+
+    def save(self, checkpoint: FeedCheckpoint) -> None:
+        self.checkpoint = checkpoint
+
+
+class FakeFeedService(FeedService):
+    """A feed of entry_count entries with ids '0', '1', ..."""
+    def __init__(self, entry_count: int, previous_links: bool = False):
+        super().__init__(requester=None)
+        self.entry_count = entry_count
+        self.previous_links = previous_links
+        self.requested_pages = []
+
+    def get_feedproxy_page(self, feed_name: str, page_num: int, page_size: int = 1) -> FeedPage:
+        self.requested_pages.append((page_num, page_size))
+        links = [{'rel': 'self', 'href': f'/{page_num}/{page_size}'}]
+        if self.previous_links and (page_num + 1) * page_size < self.entry_count:
+            links.append({'rel': 'previous', 'href': f'/{page_num + 1}/{page_size}'})
+        return FeedPage.from_dict({
+            'id': str(page_num), 'base': '', 'title': 'assets', 'updated': '2024-01-01',
+            'generator': {'uri': '', 'version': '1'}, 'links': links,
+            'entries': [{'id': str(i), 'updated': '2024-01-01', '_type': 'entry', 'content': {'value': {}}}
+                        for i in range(page_num * page_size, min((page_num + 1) * page_size, self.entry_count))]})
+
+    def get_current_feedproxy_page(self, feed_name: str) -> FeedPage:
+        return self.get_feedproxy_page(feed_name, page_num=(self.entry_count - 1) // 10, page_size=10)
+
+
+def test_tail_feedproxy_from_checkpoint():
+    feed_service = FakeFeedService(entry_count=25)
+    store = MemoryFeedCheckpointStore(FeedCheckpoint(page_num=1, page_size=10, entry_id='12'))
+
+    entry_ids = [entry.id for entry in feed_service.tail_feedproxy('assets', store, page_size=10)]
+
+    assert entry_ids == [str(i) for i in range(13, 25)]
+    assert feed_service.requested_pages == [(1, 10), (2, 10)]
+    assert store.checkpoint == FeedCheckpoint(page_num=2, page_size=10, entry_id='24')
+
+
+def test_tail_feedproxy_without_checkpoint_starts_at_current_page():
+    feed_service = FakeFeedService(entry_count=25)
+    store = MemoryFeedCheckpointStore()
+
+    entry_ids = [entry.id for entry in feed_service.tail_feedproxy('assets', store, page_size=5)]
+
+    assert entry_ids == [str(i) for i in range(20, 25)]
+
+
+def test_tail_feedproxy_resumes_after_crash():
+    feed_service = FakeFeedService(entry_count=25)
+    store = MemoryFeedCheckpointStore(FeedCheckpoint(page_num=0, page_size=10))
+
+    # the consumer crashes while processing the fourth entry
+    generator = feed_service.tail_feedproxy('assets', store, page_size=4)
+    assert [entry.id for entry in islice(generator, 4)] == ['0', '1', '2', '3']
+    generator.close()
+    assert store.checkpoint == FeedCheckpoint(page_num=0, page_size=4, entry_id='2')
+
+    entry_ids = [entry.id for entry in feed_service.tail_feedproxy('assets', store, page_size=4)]
+    assert entry_ids == [str(i) for i in range(3, 25)]
+
+
+def test_tail_feedproxy_pages_follows_previous_links():
+    feed_service = FakeFeedService(entry_count=12, previous_links=True)
+    store = MemoryFeedCheckpointStore(FeedCheckpoint(page_num=0, page_size=5, entry_id='1'))
+
+    pages = [[entry.id for entry in entries] for entries in feed_service.tail_feedproxy_pages('assets', store,
+                                                                                                page_size=5)]
+
+    assert pages == [['2', '3', '4'], ['5', '6', '7', '8', '9'], ['10', '11']]
+    assert feed_service.requested_pages == [(0, 5), (1, 5), (2, 5)]
+    assert store.checkpoint == FeedCheckpoint(page_num=2, page_size=5, entry_id='11')
+
+
+def test_json_file_feed_checkpoint_store(tmp_path):
+    store = JsonFileFeedCheckpointStore(tmp_path / 'checkpoint.json')
+    assert store.load() is None
+
+    store.save(FeedCheckpoint(page_num=3, page_size=100, entry_id='abc'))
+
+    assert JsonFileFeedCheckpointStore(tmp_path / 'checkpoint.json').load() == FeedCheckpoint(
+        page_num=3, page_size=100, entry_id='abc')
+    assert [p.name for p in tmp_path.iterdir()] == ['checkpoint.json']
@@ -0,0 +1,104 @@
+import json
+import threading
+import time
+
+import pytest
+
+from API.eminfra.EMInfraDomain import QueryDTO, PagingModeEnum
+from API.eminfra.Generic import search_offset_paged_generator, read_ahead_generator
+
+
+class FakeResponse:
+    def __init__(self, json_dict: dict):
+        self.json_dict = json_dict
+
+    def json(self) -> dict:
+        return self.json_dict
+
+
+class OffsetPagedRequester:
+    """Serves an OFFSET paged search endpoint over range(total), slower for the early pages."""
+    def __init__(self, total: int):
+        self.total = total
+        self.requested_offsets = []
+        self.lock = threading.Lock()
+
+    def post(self, url: str, data: str) -> FakeResponse:
+        query = json.loads(data)
+        offset, size = query['from'], query['size']
+        with self.lock:
+            self.requested_offsets.append(offset)
+        time.sleep(0.02 if offset < 3 * size else 0.0)
+        return FakeResponse({'from': offset, 'totalCount': self.total,
+                             'data': list(range(offset, min(offset + size, self.total)))})
+
+
+def test_search_offset_paged_generator_sequential():
+    requester = OffsetPagedRequester(total=25)
+    query_dto = QueryDTO(size=10, from_=0, pagingMode=PagingModeEnum.OFFSET)
+
+    assert list(search_offset_paged_generator(requester, 'core/api/assets/search', query_dto)) == list(range(25))
+    assert requester.requested_offsets == [0, 10, 20]
+
+
+def test_search_offset_paged_generator_prefetch_keeps_order():
+    requester = OffsetPagedRequester(total=1005)
+    query_dto = QueryDTO(size=10, from_=0, pagingMode=PagingModeEnum.OFFSET)
+
+    items = list(search_offset_paged_generator(requester, 'core/api/assets/search', query_dto, prefetch_workers=4))
+
+    assert items == list(range(1005))
+    assert sorted(requester.requested_offsets) == list(range(0, 1005, 10))
+
+
+def test_search_offset_paged_generator_prefetch_is_bounded():
+    requester = OffsetPagedRequester(total=1000)
+    query_dto = QueryDTO(size=10, from_=0, pagingMode=PagingModeEnum.OFFSET)
+
+    generator = search_offset_paged_generator(requester, 'core/api/assets/search', query_dto, prefetch_workers=2)
+    assert [next(generator) for _ in range(15)] == list(range(15))
+    generator.close()
+
+    # first page + the page being consumed + at most 2 * prefetch_workers pages ahead
+    assert len(requester.requested_offsets) <= 6
+
+
+def cursor_pages(page_count: int, delay: float = 0.0, fail_at: int = None, fetched: list = None):
+    for page_number in range(page_count):
+        if page_number == fail_at:
+            raise ProcessLookupError(f'page {page_number} failed')
+        time.sleep(delay)
+        if fetched is not None:
+            fetched.append(page_number)
+        yield [page_number * 10 + i for i in range(10)]
+
+
+def test_read_ahead_generator_keeps_order():
+    assert list(read_ahead_generator(cursor_pages(5), read_ahead=2)) == list(range(50))
+    assert list(read_ahead_generator(cursor_pages(5), read_ahead=0)) == list(range(50))
+
+
+def test_read_ahead_generator_overlaps_fetching_and_processing():
+    start = time.monotonic()
+    for _ in read_ahead_generator(cursor_pages(5, delay=0.05), read_ahead=2):
+        time.sleep(0.005)  # 10 items => 0.05 s processing per page
+    # sequential would take 0.5 s
+    assert time.monotonic() - start < 0.4
+
+
+def test_read_ahead_generator_raises_exception_in_consumer():
+    items = []
+    with pytest.raises(ProcessLookupError, match='page 2 failed'):
+        for item in read_ahead_generator(cursor_pages(5, fail_at=2), read_ahead=2):
+            items.append(item)
+    assert items == list(range(20))
+
+
+def test_read_ahead_generator_stops_when_consumer_stops():
+    fetched = []
+    generator = read_ahead_generator(cursor_pages(100, fetched=fetched), read_ahead=2)
+    assert next(generator) == 0
+    generator.close()
+    time.sleep(0.3)
+    # page being consumed + 2 queued pages + 1 page waiting to be queued
+    assert len(fetched) <= 4
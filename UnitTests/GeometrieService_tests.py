@@ -0,0 +1,64 @@
+from API.eminfra.EMInfraDomain import BulkUpdateStatusEnum
+from API.eminfra.GeometrieService import GeometrieService
+from API.eminfra.LocatieService import LocatieService
+from API.eminfra.wkt_validator import wkt_equals
+from UnitTests.FakeRequester import FakeRequester, FakeResponse, asset_handler
+
+
+def kenmerk_requester(kenmerken: dict[str, dict]) -> FakeRequester:
+    requester = FakeRequester().route('GET', r'core/api/assets/([^/]+)/kenmerken/[^/]+', asset_handler(kenmerken))
+    for method in ('POST', 'PUT', 'DELETE'):
+        requester.route(method, r'core/api/assets/([^/]+)/kenmerken/.+', lambda request: FakeResponse(status_code=202))
+    return requester
+
+
+def get_writes(requester: FakeRequester) -> list[tuple[str, str, dict]]:
+    return [(request.method, request.params[0], request.body) for request in requester.requests
+            if request.method != 'GET']
+
+
+def create_geometrie_kenmerk(wkt: str) -> dict:
+    return {'_type': 'geometrie', 'type': {}, 'links': [],
+            'logs': [{'bron': 'MANUEEL', 'links': [], 'niveau': 'MIN_1', 'uuid': 'log-1', 'wkt': wkt}]}
+
+
+def create_locatie_kenmerk(wkt: str) -> dict:
+    return {'_type': 'locatie', 'type': {}, 'links': [], 'geometrie': wkt}
+
+
+def test_wkt_equals():
+    assert wkt_equals('POINT (1 2)', 'POINT(1.0 2.0)')
+    assert wkt_equals('POINT Z (1 2 3)', 'POINT Z (1.004 2 3)', tolerance=0.01)
+    assert not wkt_equals('POINT Z (1 2 3)', 'POINT Z (1.1 2 3)', tolerance=0.01)
+    assert not wkt_equals('POINT (1 2)', 'LINESTRING (1 2, 3 4)')
+    assert not wkt_equals(None, 'POINT (1 2)')
+    assert not wkt_equals('not a wkt', 'POINT (1 2)')
+
+
+def test_bulk_update_geometrie():
+    requester = kenmerk_requester({'a1': create_geometrie_kenmerk('POINT Z (1 2 0)'),
+                                   'a2': create_geometrie_kenmerk('POINT Z (1 2 0)')})
+    service = GeometrieService(requester)
+
+    results = service.bulk_update_geometrie([('a1', 'POINT Z (1.001 2 0)'), ('a2', 'POINT Z (5 6 0)'),
+                                             ('a3', 'POINT Z (5 6 0)'), ('a1', 'POINT (1')],
+                                            tolerance=0.01, workers=2)
+
+    assert [(r.asset_uuid, r.status) for r in results] == [
+        ('a1', BulkUpdateStatusEnum.UNCHANGED), ('a2', BulkUpdateStatusEnum.UPDATED),
+        ('a3', BulkUpdateStatusEnum.FAILED), ('a1', BulkUpdateStatusEnum.FAILED)]
+    assert results[3].error == 'WKT Geometry is invalid: POINT (1.'
+    writes = get_writes(requester)
+    assert [(method, asset_uuid) for method, asset_uuid, _ in writes] == [('DELETE', 'a2'), ('POST', 'a2')]
+    assert writes[1][2]['wkt'] == 'POINT Z (5 6 0)'
+
+
+def test_bulk_update_locatie():
+    requester = kenmerk_requester({'a1': create_locatie_kenmerk('POINT Z (1 2 0)'),
+                                   'a2': create_locatie_kenmerk(None)})
+    service = LocatieService(requester)
+
+    results = service.bulk_update_locatie([('a1', 'POINT Z (1 2 0)'), ('a2', 'POINT Z (5 6 0)')])
+
+    assert [r.status for r in results] == [BulkUpdateStatusEnum.UNCHANGED, BulkUpdateStatusEnum.UPDATED]
+    assert get_writes(requester) == [('PUT', 'a2', {'geometrie': 'POINT Z (5 6 0)'})]
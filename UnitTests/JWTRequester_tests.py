@@ -0,0 +1,73 @@
+import datetime
+import json
+import threading
+import time
+
+import jwt
+import jwt.algorithms as jwt_algo
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from API.JWTRequester import JWTRequester
+
+
+class CountingJWTRequester(JWTRequester):
+    """JWTRequester that hands out numbered tokens instead of calling authenticatie.vlaanderen.be"""
+    def __init__(self, *args, expires_in: int = 3600, delay: float = 0.0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.expires_in = expires_in
+        self.delay = delay
+        self.access_token_calls = 0
+
+    def get_access_token(self, token: str) -> (str, int):
+        time.sleep(self.delay)
+        self.access_token_calls += 1
+        return f'token_{self.access_token_calls}', self.expires_in
+
+
+@pytest.fixture
+def private_key_path(tmp_path):
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    path = tmp_path / 'private_key.json'
+    path.write_text(jwt_algo.RSAAlgorithm.to_jwk(key))
+    return path
+
+
+def test_token_is_requested_once_by_concurrent_threads(private_key_path):
+    requester = CountingJWTRequester(private_key_path=private_key_path, client_id='client', delay=0.2)
+    tokens = []
+    threads = [threading.Thread(target=lambda: tokens.append(requester.get_oauth_token())) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert requester.access_token_calls == 1
+    assert tokens == ['token_1'] * 10
+
+
+def test_private_key_is_read_once(private_key_path):
+    requester = CountingJWTRequester(private_key_path=private_key_path, client_id='client')
+    requester.generate_authentication_token()
+    # an unreadable key file would fail the next token if the key was read again
+    private_key_path.write_text(json.dumps({}))
+
+    token = requester.generate_authentication_token()
+    assert jwt.decode(token, options={'verify_signature': False})['iss'] == 'client'
+
+
+def test_token_is_refreshed_in_background_before_expiry(private_key_path):
+    requester = CountingJWTRequester(private_key_path=private_key_path, client_id='client', delay=0.2,
+                                     refresh_ahead_seconds=120)
+    assert requester.get_oauth_token() == 'token_1'
+
+    # move the token into the refresh-ahead window, it is still valid for 60 seconds
+    requester.expires = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=60)
+    start = time.monotonic()
+    assert requester.get_oauth_token() == 'token_1'
+    assert requester.get_oauth_token() == 'token_1'
+    assert time.monotonic() - start < 0.1
+
+    requester._background_refresh.join()
+    assert requester.access_token_calls == 2
+    assert requester.get_oauth_token() == 'token_2'
@@ -0,0 +1,108 @@
+import time
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+
+from API.eminfra.AssettypeService import AssettypeService
+from API.eminfra.EigenschapService import EigenschapService
+from API.eminfra.MetadataCache import MetadataCache
+from UnitTests.FakeRequester import FakeRequester
+
+ASSETTYPE_DICT = {'_type': 'onderdeeltype', 'uuid': 'type-1', 'createdOn': '2020-01-01', 'modifiedOn': '2020-01-01',
+                  'uri': 'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#Camera', 'korteUri': 'onderdeel#Camera',
+                  'naam': 'Camera', 'actief': True, 'definitie': 'camera', 'links': []}
+
+
+def search_requester(data: list[dict]) -> FakeRequester:
+    return FakeRequester().route('POST', r'core/api/(assettypes|eigenschappen)/search', lambda request: {'data': data})
+
+
+def test_get_or_load_counts_hits_and_misses():
+    cache = MetadataCache()
+    loads = []
+
+    for _ in range(3):
+        assert cache.get_or_load('key', lambda: loads.append(1) or {'a': 1}) == {'a': 1}
+
+    assert len(loads) == 1
+    assert cache.get_stats() == {'hits': 2, 'misses': 1, 'size': 1}
+
+
+def test_least_recently_used_is_evicted():
+    cache = MetadataCache(maxsize=2)
+    cache.get_or_load('a', lambda: 1)
+    cache.get_or_load('b', lambda: 2)
+    cache.get_or_load('a', lambda: 1)
+    cache.get_or_load('c', lambda: 3)
+
+    assert cache.get_or_load('a', lambda: 'reloaded') == 1
+    assert cache.get_or_load('b', lambda: 'reloaded') == 'reloaded'
+
+
+def test_failed_load_is_not_cached():
+    cache = MetadataCache()
+
+    def fail():
+        raise ValueError('not found')
+
+    with pytest.raises(ValueError):
+        cache.get_or_load('key', fail)
+    assert cache.get_or_load('key', lambda: 'found') == 'found'
+
+
+def test_maxsize_zero_disables_the_cache():
+    cache = MetadataCache(maxsize=0)
+    cache.get_or_load('key', lambda: 1)
+
+    assert cache.get_or_load('key', lambda: 2) == 2
+    assert cache.misses == 2
+
+
+def test_disk_store_survives_between_runs_and_expires(tmp_path):
+    path = tmp_path / 'metadata.sqlite'
+    cache = MetadataCache(path=path, ttl=timedelta(hours=1))
+    cache.get_or_load('key', lambda: {'uuid': 'type-1'})
+    cache.close()
+
+    cache = MetadataCache(path=path, ttl=timedelta(hours=1))
+    assert cache.get_or_load('key', lambda: 'reloaded') == {'uuid': 'type-1'}
+    assert cache.hits == 1
+
+    cache = MetadataCache(path=path, ttl=timedelta(hours=1))
+    with patch('API.eminfra.MetadataCache.time.time', return_value=time.time() + 7200):
+        assert cache.get_or_load('key', lambda: 'reloaded') == 'reloaded'
+
+
+def test_search_assettype_uses_the_cache():
+    requester = search_requester([ASSETTYPE_DICT])
+    service = AssettypeService(requester, cache=MetadataCache())
+
+    first = service.search_assettype(ASSETTYPE_DICT['uri'])
+    first.naam = 'changed'
+    second = service.search_assettype(ASSETTYPE_DICT['uri'])
+
+    assert len(requester.requests) == 1
+    assert second.uuid == 'type-1'
+    assert second.naam == 'Camera'
+
+
+def test_search_assettype_without_result_raises_every_time():
+    requester = search_requester([])
+    service = AssettypeService(requester, cache=MetadataCache())
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            service.search_assettype('unknown')
+    assert len(requester.requests) == 2
+
+
+def test_search_eigenschappen_keys_on_uri():
+    requester = search_requester([])
+    service = EigenschapService(requester, cache=MetadataCache())
+
+    service.search_eigenschappen('merk')
+    service.search_eigenschappen('merk')
+    service.search_eigenschappen('merk', uri='Camera')
+
+    assert len(requester.requests) == 2
@@ -0,0 +1,67 @@
+from API.eminfra.EMInfraDomain import AssetDTO, RelatieEnum
+from API.eminfra.RelatieService import RelatieService
+from UnitTests.FakeRequester import FakeRequester, FakeRequest, FakeResponse, error_response
+
+
+def to_uuid(name: str) -> str:
+    return f'{name:0>36}'
+
+
+def create_asset(name: str) -> AssetDTO:
+    return AssetDTO.from_dict({'_type': 'onderdeel', 'uuid': to_uuid(name), 'createdOn': '2024-01-01',
+                               'modifiedOn': '2024-01-01', 'actief': True, 'naam': name, 'links': []})
+
+
+def create_otl_relatie(bron: str, doel: str, relatie: RelatieEnum, actief: bool = True) -> dict:
+    bron_uuid, doel_uuid = to_uuid(bron), to_uuid(doel)
+    return {'@type': relatie.value, 'AIMDBStatus.isActief': actief,
+            'RelatieObject.bron': {'@id': f'https://data.awvvlaanderen.be/id/asset/{bron_uuid}-b25kZXJkZWVs'},
+            'RelatieObject.doel': {'@id': f'https://data.awvvlaanderen.be/id/asset/{doel_uuid}-b25kZXJkZWVs'}}
+
+
+def assetrelatie_requester(otl_relaties: list[dict]) -> FakeRequester:
+    created = []
+
+    def search_otl_relaties(request: FakeRequest) -> dict:
+        uuids = request.body['filters']['asset']
+        return {'@graph': [r for r in otl_relaties if r['RelatieObject.bron']['@id'][39:75] in uuids or
+                           r['RelatieObject.doel']['@id'][39:75] in uuids]}
+
+    def create_relatie(request: FakeRequest) -> FakeResponse:
+        if request.body['bronAsset']['uuid'] == to_uuid('broken'):
+            return error_response(400, 'bad request')
+        created.append(request)
+        return FakeResponse({'uuid': f'relatie-{len(created)}'}, status_code=202)
+
+    return (FakeRequester()
+            .route('POST', 'core/api/otl/assetrelaties/search', search_otl_relaties)
+            .route('POST', 'core/api/assetrelaties', create_relatie))
+
+
+def test_create_assetrelaties_if_missing():
+    requester = assetrelatie_requester([create_otl_relatie('kast', 'mast_1', RelatieEnum.VOEDT),
+                                        create_otl_relatie('mast_2', 'toestel_2', RelatieEnum.BEVESTIGING),
+                                        create_otl_relatie('kast', 'mast_3', RelatieEnum.VOEDT, actief=False)])
+    service = RelatieService(requester)
+    kast, broken = create_asset('kast'), create_asset('broken')
+    masten = [create_asset(f'mast_{i}') for i in range(1, 4)]
+    toestel_1, toestel_2 = create_asset('toestel_1'), create_asset('toestel_2')
+
+    summary = service.create_assetrelaties_if_missing(
+        [(kast, mast, RelatieEnum.VOEDT) for mast in masten] +
+        [(kast, masten[0], RelatieEnum.VOEDT),
+         (toestel_2, masten[1], RelatieEnum.BEVESTIGING),
+         (toestel_1, masten[0], RelatieEnum.BEVESTIGING),
+         (masten[0], toestel_1, RelatieEnum.BEVESTIGING),
+         (broken, kast, RelatieEnum.VOEDT)], chunk_size=2, workers=2)
+
+    # the inactive relatie between kast and mast_3 counts as existing
+    assert summary.existing == 3
+    assert sorted((request.body['bronAsset']['uuid'].lstrip('0'), request.body['doelAsset']['uuid'].lstrip('0'))
+                  for request in requester.get_requests(url_pattern='core/api/assetrelaties')) == [
+        ('broken', 'kast'), ('kast', 'mast_2'), ('mast_1', 'toestel_1')]
+    assert sorted(summary.created) == ['relatie-1', 'relatie-2']
+    assert summary.failed == {(to_uuid('broken'), to_uuid('kast'), RelatieEnum.VOEDT): 'bad request'}
+    assert [[uuid.lstrip('0') for uuid in request.body['filters']['asset']]
+            for request in requester.get_requests(url_pattern='core/api/otl/assetrelaties/search')] == [
+        ['kast', 'toestel_2'], ['toestel_1', 'mast_1'], ['broken']]
@@ -0,0 +1,150 @@
+import pytest
+
+from API.eminfra.EMInfraDomain import BulkUpdateStatusEnum
+from API.eminfra.MetadataCache import MetadataCache
+from API.eminfra.SchadebeheerderService import SchadebeheerderService
+from API.eminfra.ToezichterService import ToezichterService
+from UnitTests.FakeRequester import (FakeRequester, FakeRequest, FakeResponse, asset_handler, error_response,
+                                     search_response)
+
+
+def create_toezichter_kenmerk(toezichter_uuid: str | None, toezichtgroep_uuid: str | None) -> dict:
+    return {'_type': 'toezicht', 'type': {}, 'links': [],
+            'toezichter': {'uuid': toezichter_uuid} if toezichter_uuid else None,
+            'toezichtGroep': {'uuid': toezichtgroep_uuid} if toezichtgroep_uuid else None}
+
+
+def create_identiteit_dict(uuid: str, naam: str) -> dict:
+    return {'_type': 'identiteit', 'uuid': uuid, 'actief': True, 'systeem': False, 'naam': naam,
+            'gebruikersnaam': naam.lower(), 'voornaam': 'Jan', 'account': {}, 'contactFiche': {}}
+
+
+def create_toezichtgroep_dict(uuid: str, naam: str) -> dict:
+    return {'_type': 'toezichtgroep', 'naam': naam, 'uuid': uuid, 'referentie': naam, 'actiefInterval': '',
+            'contactFiche': {}, 'links': []}
+
+
+def create_schadebeheerder_dict(uuid: str, naam: str) -> dict:
+    return {'_type': 'beheerder', 'uuid': uuid, 'createdOn': '2020-01-01', 'modifiedOn': '2020-01-01',
+            'naam': naam, 'referentie': naam, 'actiefInterval': {}, 'contactFiche': {}}
+
+
+def kenmerk_requester(kenmerken: dict[str, dict], search_results: dict[str, list[dict]] = None) -> FakeRequester:
+    url_pattern = r'core/api/assets/([^/]+)/kenmerken/[^/]+'
+    requester = (FakeRequester()
+                 .route('GET', url_pattern, asset_handler(kenmerken))
+                 .route('PUT', url_pattern, lambda request: FakeResponse(status_code=202)))
+    for url, items in (search_results or {}).items():
+        requester.route('POST', url, lambda request, items=items: search_response(items, request))
+    return requester
+
+
+def get_puts(requester: FakeRequester) -> dict[str, dict]:
+    return {request.params[0]: request.body for request in requester.get_requests('PUT')}
+
+
+def test_bulk_assign_toezichter():
+    requester = kenmerk_requester(
+        {'a1': create_toezichter_kenmerk('jan', 'groep'),
+         'a2': create_toezichter_kenmerk('piet', 'groep'),
+         'a3': create_toezichter_kenmerk(None, None)},
+        {'identiteit/api/identiteiten/search': [create_identiteit_dict('jan', 'Janssens')],
+         'identiteit/api/toezichtgroepen/search': [create_toezichtgroep_dict('groep', 'AWV_groep')]})
+    service = ToezichterService(requester)
+
+    results = service.bulk_assign_toezichter(['a1', 'a2', 'a3', 'unknown'], toezichter_naam='Jan Janssens',
+                                             toezichtgroep_naam='AWV_groep', workers=2)
+
+    assert [(r.asset_uuid, r.status) for r in results] == [
+        ('a1', BulkUpdateStatusEnum.UNCHANGED), ('a2', BulkUpdateStatusEnum.UPDATED),
+        ('a3', BulkUpdateStatusEnum.UPDATED), ('unknown', BulkUpdateStatusEnum.FAILED)]
+    assert [request.url for request in requester.get_requests('POST')] == [
+        'identiteit/api/identiteiten/search', 'identiteit/api/toezichtgroepen/search']
+    assert get_puts(requester) == {'a2': {'toezichter': {'uuid': 'jan'}, 'toezichtGroep': {'uuid': 'groep'}},
+                                   'a3': {'toezichter': {'uuid': 'jan'}, 'toezichtGroep': {'uuid': 'groep'}}}
+
+
+def test_bulk_assign_toezichter_with_ambiguous_name():
+    requester = kenmerk_requester({}, {'identiteit/api/identiteiten/search': [
+        create_identiteit_dict('jan', 'Janssens'), create_identiteit_dict('jan2', 'Janssens')]})
+    service = ToezichterService(requester)
+
+    with pytest.raises(ValueError):
+        service.bulk_assign_toezichter(['a1'], toezichter_naam='Janssens')
+    assert get_puts(requester) == {}
+
+
+def test_bulk_assign_schadebeheerder():
+    requester = kenmerk_requester(
+        {'a1': {'schadeBeheerder': create_schadebeheerder_dict('district', 'District Gent')},
+         'a2': {'schadeBeheerder': create_schadebeheerder_dict('other', 'District Brugge')},
+         'a3': {}},
+        {'core/api/beheerders/search': [create_schadebeheerder_dict('district', 'District Gent')]})
+    service = SchadebeheerderService(requester)
+
+    results = service.bulk_assign_schadebeheerder(['a1', 'a2', 'a3', 'unknown'], naam='District Gent', workers=2)
+
+    assert [(r.asset_uuid, r.status) for r in results] == [
+        ('a1', BulkUpdateStatusEnum.UNCHANGED), ('a2', BulkUpdateStatusEnum.UPDATED),
+        ('a3', BulkUpdateStatusEnum.UPDATED), ('unknown', BulkUpdateStatusEnum.FAILED)]
+    assert results[3].error == 'asset not found'
+    assert get_puts(requester) == {'a2': {'schadeBeheerder': {'uuid': 'district'}},
+                                   'a3': {'schadeBeheerder': {'uuid': 'district'}}}
+
+
+def identiteit_requester(identiteit_dicts: list[dict], toezichtgroep_dicts: list[dict]) -> FakeRequester:
+    dicts = {'identiteiten': identiteit_dicts, 'toezichtgroepen': toezichtgroep_dicts}
+
+    def get_by_uuid(request: FakeRequest) -> FakeResponse | dict:
+        items = [d for d in dicts[request.params[0]] if d['uuid'] == request.params[1]]
+        return items[0] if items else error_response(404, 'not found')
+
+    def search(request: FakeRequest) -> FakeResponse:
+        term = request.body['selection']['expressions'][0]['terms'][0]
+        if term['operator'] == 'IN':
+            items = [d for d in dicts[request.params[0]] if d['uuid'] in term['value']]
+        else:
+            items = [d for d in dicts[request.params[0]] if term['value'] in d['naam']]
+        return search_response(items, request)
+
+    return (FakeRequester()
+            .route('POST', r'identiteit/api/(identiteiten|toezichtgroepen)/search', search)
+            .route('GET', r'identiteit/api/(identiteiten|toezichtgroepen)/([^/]+)', get_by_uuid))
+
+
+def test_identiteiten_and_toezichtgroepen_are_cached():
+    identiteiten = [create_identiteit_dict(f'identiteit-{i}', f'Naam{i}') for i in range(7)]
+    requester = identiteit_requester(identiteiten, [create_toezichtgroep_dict('groep', 'AWV_groep')])
+    service = ToezichterService(requester, cache=MetadataCache())
+
+    assert service.get_identiteit('identiteit-0').naam == 'Naam0'
+    found = service.get_identiteiten([f'identiteit-{i}' for i in range(7)] + ['identiteit-0', 'unknown'],
+                                     chunk_size=4)
+    assert sorted(found) == [f'identiteit-{i}' for i in range(7)]
+    assert [i.naam for i in service.search_identiteit('Naam1')] == ['Naam1']
+    assert service.get_toezichtgroep('groep').naam == 'AWV_groep'
+    assert service.get_toezichtgroepen(['groep'])['groep'].naam == 'AWV_groep'
+    assert len(requester.requests) == 5
+
+    requester.requests.clear()
+    for i in range(7):
+        assert service.get_identiteit(f'identiteit-{i}').naam == f'Naam{i}'
+    assert [i.uuid for i in service.search_identiteit('Naam1')] == ['identiteit-1']
+    assert service.get_toezichtgroep('groep').uuid == 'groep'
+    assert requester.requests == []
+
+
+def test_search_identiteit_pages_lazily():
+    identiteiten = [create_identiteit_dict(f'identiteit-{i}', f'Naam{i}') for i in range(150)]
+    requester = identiteit_requester(identiteiten, [])
+    service = ToezichterService(requester, cache=MetadataCache())
+
+    assert next(service.search_identiteit('Naam')).uuid == 'identiteit-0'
+    assert len(requester.requests) == 1
+
+    # the matches are only cached once all pages are consumed
+    assert len(list(service.search_identiteit('Naam'))) == 150
+    assert len(requester.requests) == 3
+    assert len(list(service.search_identiteit('Naam'))) == 150
+    assert service.get_identiteit('identiteit-149').naam == 'Naam149'
+    assert len(requester.requests) == 3
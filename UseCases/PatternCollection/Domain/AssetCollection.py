@@ -1,22 +1,47 @@
+import gzip
+import pickle
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from typing import Generator
 
 from Exceptions.AssetsMissingError import AssetsMissingError
 from Exceptions.ObjectAlreadyExistsError import ObjectAlreadyExistsError
+from UseCases.PatternCollection.Domain.ColumnarAdjacency import ColumnarAdjacency
 from UseCases.PatternCollection.Domain.Enums import Direction
 from UseCases.PatternCollection.Domain.InfoObject import InfoObject, full_uri_to_short_type, NodeInfoObject, \
-    RelationInfoObject, is_directional_relation
+    RelationInfoObject, RelationEdge, is_directional_relation
+
+# increase when the content of a snapshot changes, older snapshots can't be loaded anymore
+SNAPSHOT_VERSION = 1
 
 
 class AssetCollection:
     def __init__(self):
         self.object_dict: dict[str: InfoObject] = {}
         self.short_uri_dict = {}
+        # the uuids per short type in the order they were added, only appended to
+        self._added_uuids_by_type: dict[str, list[str]] = {}
+        self._columnar_adjacency: ColumnarAdjacency | None = None
+        # moment the snapshot this collection is loaded from was saved
+        self.snapshot_created: datetime | None = None
 
     def _update_short_uri_dict(self, short_uri: str, uuid: str) -> None:
         if short_uri not in self.short_uri_dict:
             self.short_uri_dict[short_uri] = {uuid}
-        else:
+        elif uuid not in self.short_uri_dict[short_uri]:
             self.short_uri_dict[short_uri].add(uuid)
+        else:
+            return
+        self._added_uuids_by_type.setdefault(short_uri, []).append(uuid)
+
+    def get_added_uuids_by_type(self, short_type: str, start: int = 0) -> list[str]:
+        """
+        The uuids of the objects of a short type in the order they were added to the collection, from position start on.
+        Pass the number of uuids already seen as start to only get the objects that were added since.
+        An object whose type changed with update_node stays in the list of its former type as well.
+        """
+        return self._added_uuids_by_type.get(short_type, [])[start:]
 
     def add_node(self, d: dict) -> None:
         uuid = d['uuid']
@@ -33,9 +58,28 @@ class AssetCollection:
         info_object.active = actief
 
         self.object_dict[d['uuid']] = info_object
+        self._columnar_adjacency = None
 
         self._update_short_uri_dict(short_uri=short_uri, uuid=uuid)
 
+    def update_node(self, d: dict) -> None:
+        """Add a node or replace the attributes of an existing node, keeping its relations."""
+        info_object = self.object_dict.get(d['uuid'])
+        if info_object is None:
+            self.add_node(d)
+            return
+        if info_object.is_relation:
+            raise ValueError(f"Object with uuid {d['uuid']} is a relation, not a node.")
+
+        short_uri = full_uri_to_short_type(d['typeURI'])
+        if short_uri != info_object.short_type:
+            self.short_uri_dict[info_object.short_type].discard(info_object.uuid)
+            self._update_short_uri_dict(short_uri=short_uri, uuid=info_object.uuid)
+            info_object.short_type = sys.intern(short_uri)
+        info_object.attr_dict = d
+        info_object.active = d.get("AIMDBStatus.isActief", True)
+        self._columnar_adjacency = None
+
     def add_relation(self, d: dict) -> None:
         uuid = d['uuid']
         self.check_if_exists(uuid)
@@ -55,7 +99,7 @@ class AssetCollection:
             raise asset_missing_error
 
         short_type_relation = full_uri_to_short_type(d['typeURI'])
-        relation_name = short_type_relation.split('#')[-1]
+        relation_name = sys.intern(short_type_relation.split('#')[-1])
         relation_info_object = RelationInfoObject(uuid=uuid, short_type=short_type_relation, attr_dict=d,
                                                   bron=bron_object, doel=doel_object)
 
@@ -68,25 +112,20 @@ class AssetCollection:
 
         if relation_name not in bron_object.relations:
             bron_object.relations[relation_name] = {}
-        bron_object.relations[relation_name][doel_object.uuid] = {
-            'direction': direction_1,
-            'relation_object': relation_info_object,
-            'node_object': doel_object
-        }
+        bron_object.relations[relation_name][doel_object.uuid] = RelationEdge(
+            direction=direction_1, relation_object=relation_info_object, node_object=doel_object)
 
         if relation_name not in doel_object.relations:
             doel_object.relations[relation_name] = {}
-        doel_object.relations[relation_name][bron_object.uuid] = {
-            'direction': direction_2,
-            'relation_object': relation_info_object,
-            'node_object': bron_object
-        }
+        doel_object.relations[relation_name][bron_object.uuid] = RelationEdge(
+            direction=direction_2, relation_object=relation_info_object, node_object=bron_object)
 
         actief = d.get("AIMDBStatus.isActief")
         if actief is not None:
             relation_info_object.active = actief
 
         self.object_dict[d['uuid']] = relation_info_object
+        self._columnar_adjacency = None
         self._update_short_uri_dict(short_uri=short_type_relation, uuid=uuid)
 
     def get_object_by_uuid(self, uuid: str) -> InfoObject:
@@ -116,7 +155,7 @@ class AssetCollection:
         return None if o is None else o.attr_dict
 
     def get_node_objects(self) -> Generator[NodeInfoObject, None, None]:
-        yield from [node for node in self.object_dict.values() if not node.is_relation]
+        yield from (node for node in self.object_dict.values() if not node.is_relation)
 
     def get_node_objects_by_types(self, list_of_short_types: [str]) -> Generator[NodeInfoObject, None, None]:
         for short_type in list_of_short_types:
@@ -124,13 +163,73 @@ class AssetCollection:
                 yield self.get_node_object_by_uuid(uuid)
 
     def get_relation_objects(self) -> Generator[RelationInfoObject, None, None]:
-        yield from [node for node in self.object_dict.values() if node.is_relation]
+        yield from (node for node in self.object_dict.values() if node.is_relation)
+
+    def get_columnar_adjacency(self) -> ColumnarAdjacency:
+        """
+        Get a columnar snapshot of the graph for vectorized traversal. The snapshot is cached until a node or relation
+        is added to the collection.
+        """
+        if self._columnar_adjacency is None:
+            self._columnar_adjacency = ColumnarAdjacency(node_objects=list(self.get_node_objects()),
+                                                         relation_objects=list(self.get_relation_objects()))
+        return self._columnar_adjacency
 
     def get_relation_objects_by_types(self, list_of_short_types: [str]) -> Generator[RelationInfoObject, None, None]:
         for short_type in list_of_short_types:
             for uuid in self.short_uri_dict.get(short_type, set()):
                 yield self.get_relation_object_by_uuid(uuid)
 
+    def save_snapshot(self, path: Path) -> None:
+        """
+        Save the nodes and relations to a compressed file, to load them with load_snapshot in a later run.
+        Only the attribute dicts are stored, the graph and the short uri index are rebuilt when loading.
+        """
+        snapshot = {
+            'version': SNAPSHOT_VERSION,
+            'created': datetime.now(timezone.utc),
+            'nodes': [node.attr_dict for node in self.get_node_objects()],
+            'relations': [relation.attr_dict for relation in self.get_relation_objects()]
+        }
+        with gzip.open(path, 'wb', compresslevel=1) as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load_snapshot(cls, path: Path) -> 'AssetCollection':
+        """
+        Create a collection from a file saved by save_snapshot. Only load snapshots you created yourself, as they are
+        unpickled.
+        """
+        with gzip.open(path, 'rb') as f:
+            snapshot = pickle.load(f)
+        if not isinstance(snapshot, dict) or snapshot.get('version') != SNAPSHOT_VERSION:
+            raise ValueError(f'{path} is not an AssetCollection snapshot of version {SNAPSHOT_VERSION}.')
+
+        collection = cls()
+        for d in snapshot['nodes']:
+            collection.add_node(d)
+        for d in snapshot['relations']:
+            collection.add_relation(d)
+        collection.snapshot_created = snapshot['created']
+        return collection
+
+    @classmethod
+    def load_snapshot_if_recent(cls, path: Path, max_age: timedelta) -> 'AssetCollection | None':
+        """
+        Load a snapshot with load_snapshot, unless it is missing, of another version or saved more than max_age ago.
+        A loaded snapshot only changes when it is refreshed, so max_age limits how stale the collection can be.
+        Returns None when the collection has to be collected again.
+        """
+        if not Path(path).exists():
+            return None
+        try:
+            collection = cls.load_snapshot(path)
+        except ValueError:
+            return None
+        if datetime.now(timezone.utc) - collection.snapshot_created > max_age:
+            return None
+        return collection
+
     def check_if_exists(self, uuid: str):
         existing = self.object_dict.get(uuid)
         if existing is not None:
@@ -159,17 +258,17 @@ class AssetCollection:
         for relation_type in relation_types:
             if relation_type not in starting_object.relations:
                 continue
-            for target_uuid, relation_info in starting_object.relations[relation_type].items():
-                if (relation_info['direction'] in allowed_directions and
-                        relation_info['node_object'].short_type in filtered_node_types):
-                    if return_only_active and (not relation_info['node_object'].active or
-                                               not relation_info['relation_object'].active):
+            for target_uuid, relation_edge in starting_object.relations[relation_type].items():
+                if (relation_edge.direction in allowed_directions and
+                        relation_edge.node_object.short_type in filtered_node_types):
+                    if return_only_active and (not relation_edge.node_object.active or
+                                               not relation_edge.relation_object.active):
                         continue
                     if return_type == 'uuid':
                         yield target_uuid
                         if return_relation_info:
-                            yield relation_info['relation_object'].uuid
+                            yield relation_edge.relation_object.uuid
                     else:
-                        yield relation_info['node_object']
+                        yield relation_edge.node_object
                         if return_relation_info:
-                            yield relation_info['relation_object']
+                            yield relation_edge.relation_object
@@ -1,6 +1,7 @@
 import itertools
 import re
-from typing import Generator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Generator, Iterable
 
 from API.eminfra.EMInfraClient import EMInfraClient
 from API.EMSONClient import EMSONClient
@@ -34,9 +35,21 @@ class AssetInfoCollector:
             asset['typeURI'] = asset.pop('@type')
             self.collection.add_node(asset)
 
-    def _common_collect_relation_info(self, assetrelaties_generator: Generator[dict, None, None],
-                                      ignore_duplicates: bool = False) -> None:
+    def refresh_asset_info(self, uuids: [str]) -> None:
+        """
+        Fetch the assets again and replace their attributes in the collection, e.g. after loading a snapshot.
+        Only these assets are refreshed, their relations and the other nodes keep the state of the snapshot. Limit the
+        age of the snapshot with AssetCollection.load_snapshot_if_recent.
+        """
+        for asset in self.get_assets_by_uuids(uuids=uuids):
+            asset['uuid'] = asset.pop('@id')[39:75]
+            asset['typeURI'] = asset.pop('@type')
+            self.collection.update_node(asset)
+
+    def _common_collect_relation_info(self, assetrelaties_generator: Iterable[dict],
+                                      ignore_duplicates: bool = False, collect_missing_assets: bool = False) -> None:
         asset_missing_error = AssetsMissingError(msg='')
+        relations_missing_assets = []
         for relation in assetrelaties_generator:
             relation['uuid'] = relation.pop('@id')[46:82]
             relation['typeURI'] = relation.pop('@type')
@@ -47,9 +60,25 @@ class AssetInfoCollector:
             except AssetsMissingError as e:
                 asset_missing_error.uuids.extend(e.uuids)
                 asset_missing_error.msg += e.msg
+                relations_missing_assets.append(relation)
             except ObjectAlreadyExistsError as e:
                 if not ignore_duplicates:
                     raise e
+
+        if asset_missing_error.uuids and collect_missing_assets:
+            # only the relations that failed are added again, instead of fetching all relations again
+            self.collect_asset_info(uuids=list(dict.fromkeys(asset_missing_error.uuids)))
+            asset_missing_error = AssetsMissingError(msg='')
+            for relation in relations_missing_assets:
+                try:
+                    self.collection.add_relation(relation)
+                except AssetsMissingError as e:
+                    asset_missing_error.uuids.extend(e.uuids)
+                    asset_missing_error.msg += e.msg
+                except ObjectAlreadyExistsError as e:
+                    if not ignore_duplicates:
+                        raise e
+
         if asset_missing_error.uuids:
             raise asset_missing_error
 
@@ -57,13 +86,46 @@ class AssetInfoCollector:
         self._common_collect_relation_info(self.get_assetrelaties_by_uuids(uuids=uuids),
                                            ignore_duplicates=ignore_duplicates)
 
-    def collect_relation_info_by_sources_or_targets(self, uuids: [str], ignore_duplicates: bool = False) -> None:
-        self._common_collect_relation_info(self.get_assetrelaties_by_source_or_target_uuids(uuids=uuids),
-                                           ignore_duplicates=ignore_duplicates)
+    def collect_relation_info_by_sources_or_targets(self, uuids: [str], ignore_duplicates: bool = False,
+                                                    chunk_size: int = 0, fetch_workers: int = 0,
+                                                    collect_missing_assets: bool = False) -> None:
+        """
+        Collect the relations of which the given assets are the source or target.
+
+        :param uuids: uuids of the assets
+        :param ignore_duplicates: ignore relations that are already in the collection
+        :param chunk_size: amount of uuids per search request. 0 (default) uses one request for all uuids.
+        :param fetch_workers: number of threads fetching the chunks concurrently. 0 (default) fetches them one after
+            the other. The relations are always added in the order of the chunks.
+        :param collect_missing_assets: collect the assets that are not in the collection yet and add the relations to
+            them, instead of raising an AssetsMissingError
+        """
+        if chunk_size < 1 or len(uuids) <= chunk_size:
+            self._common_collect_relation_info(self.get_assetrelaties_by_source_or_target_uuids(uuids=uuids),
+                                               ignore_duplicates=ignore_duplicates,
+                                               collect_missing_assets=collect_missing_assets)
+            return
+
+        chunks = [uuids[i:i + chunk_size] for i in range(0, len(uuids), chunk_size)]
+        if fetch_workers < 1:
+            relations = itertools.chain.from_iterable(
+                self.get_assetrelaties_by_source_or_target_uuids(uuids=chunk) for chunk in chunks)
+            self._common_collect_relation_info(relations, ignore_duplicates=ignore_duplicates,
+                                               collect_missing_assets=collect_missing_assets)
+            return
+
+        with ThreadPoolExecutor(max_workers=fetch_workers) as executor:
+            relations_per_chunk = executor.map(
+                lambda chunk: list(self.get_assetrelaties_by_source_or_target_uuids(uuids=chunk)), chunks)
+            self._common_collect_relation_info(itertools.chain.from_iterable(relations_per_chunk),
+                                               ignore_duplicates=ignore_duplicates,
+                                               collect_missing_assets=collect_missing_assets)
 
     def start_collecting_from_starting_uuids_using_pattern(self, starting_uuids: [str],
                                                            pattern: [tuple[str, str, object]],
-                                                           print_progress: bool = True) -> None:
+                                                           print_progress: bool = True,
+                                                           relation_chunk_size: int = 100,
+                                                           relation_fetch_workers: int = 0) -> None:
         uuid_pattern = next((t[2] for t in pattern if t[:2] == ('uuids', 'of')), None)
         type_of_patterns = [t for t in pattern if t[1] == 'type_of']
         relation_patterns = [t for t in pattern if re.match('^(<)?-\\[r(\\d)*]\\*?-(>)?$', t[1]) is not None]
@@ -85,6 +147,12 @@ class AssetInfoCollector:
         if print_progress:
             print(f'Collected asset info: {len(self.collection.object_dict)} objects')
 
+        types_per_object = self.get_types_per_object(type_of_patterns)
+        # the relations of a node are collected all at once, so every node only has to be expanded once
+        expanded_uuids = set()
+        # number of uuids per short type that were already taken into a frontier, the rest is pending
+        drained_per_type: dict[str, int] = {}
+
         matching_objects = [uuid_pattern]
         MAX_REPEATS_WITH_STAR_PATTERN = 5
         while relation_patterns:
@@ -112,21 +180,21 @@ class AssetInfoCollector:
 
                         new_matching_objects.append(relation_pattern[2])
 
-                        type_of_obj_l = [t[2] for t in type_of_patterns if t[0] == relation_pattern[0]]
-                        type_of_obj = []
-                        for l in type_of_obj_l:
-                            type_of_obj.extend(l)
-                        if type_of_obj is None:
-                            raise ValueError(f'No type_of pattern found for object {relation_pattern[0]}')
-
-                        type_of_uuids = [asset.uuid for asset in self.collection.get_node_objects_by_types(type_of_obj)]
-                        if not type_of_uuids:
+                        # only the frontier: the pending nodes of the type, in the order they were discovered
+                        frontier_uuids = []
+                        for short_type in types_per_object.get(relation_pattern[0], []):
+                            pending_uuids = self.collection.get_added_uuids_by_type(
+                                short_type, start=drained_per_type.get(short_type, 0))
+                            drained_per_type[short_type] = drained_per_type.get(short_type, 0) + len(pending_uuids)
+                            current_uuids = self.collection.short_uri_dict.get(short_type, ())
+                            frontier_uuids.extend(uuid for uuid in pending_uuids
+                                                  if uuid not in expanded_uuids and uuid in current_uuids)
+                        if not frontier_uuids:
                             break
-                        try:
-                            self.collect_relation_info_by_sources_or_targets(uuids=type_of_uuids, ignore_duplicates=True)
-                        except AssetsMissingError as e:
-                            self.collect_asset_info(uuids=e.uuids)
-                            self.collect_relation_info_by_sources_or_targets(uuids=type_of_uuids, ignore_duplicates=True)
+                        self.collect_relation_info_by_sources_or_targets(
+                            uuids=frontier_uuids, ignore_duplicates=True, chunk_size=relation_chunk_size,
+                            fetch_workers=relation_fetch_workers, collect_missing_assets=True)
+                        expanded_uuids.update(frontier_uuids)
 
                         if print_progress:
                             print(f'Collected asset info: {len(self.collection.object_dict)} objects')
@@ -135,7 +203,14 @@ class AssetInfoCollector:
                             break
 
                 relation_patterns = [t for t in relation_patterns if t[0] != obj]
-            matching_objects = list(set(new_matching_objects))
+            matching_objects = list(dict.fromkeys(new_matching_objects))
+
+    @classmethod
+    def get_types_per_object(cls, type_of_patterns: [tuple[str, str, object]]) -> dict[str, list[str]]:
+        types_per_object = {}
+        for type_of_pattern in type_of_patterns:
+            types_per_object.setdefault(type_of_pattern[0], []).extend(type_of_pattern[2])
+        return types_per_object
 
     @classmethod
     def order_patterns_for_object(cls, obj: str, relation_patterns: [tuple[str, str, str]]) -> [tuple[str, str, str]]:
@@ -169,7 +244,11 @@ class AssetInfoCollector:
         return level_dict
 
     def filter_collection_by_pattern(self, filter_pattern: [tuple[str, str, object]], starting_uuids: [str],
-                                     print_progress: bool = True) -> [NodeInfoObject]:
+                                     print_progress: bool = True, use_columnar: bool = False) -> [NodeInfoObject]:
+        """
+        Filter the collected objects by a pattern. With use_columnar, every hop expands all matching nodes at once
+        using the columnar snapshot of the collection instead of traversing the graph node by node.
+        """
         uuid_pattern = next((t[2] for t in filter_pattern if t[:2] == ('uuids', 'of')), None)
         type_of_patterns = [t for t in filter_pattern if t[1] == 'type_of']
         relation_patterns = [t for t in filter_pattern if re.match('^(<)?-\\[r(\\d)*]\\*?-(>)?$', t[1]) is not None]
@@ -250,12 +329,21 @@ class AssetInfoCollector:
                             t[2] for t in type_of_patterns if t[0] == target_code
                         ))
 
-                        for asset_uuid in type_of_uuids:
-                            objects.extend(list(
-                                self.collection.traverse_graph(
-                                    start_uuid=asset_uuid, relation_types=type_of_rel,
-                                    allowed_directions=allowed_directions, filtered_node_types=type_of_target,
-                                    return_type='info_object', return_relation_info=True)))
+                        if use_columnar:
+                            adjacency = self.collection.get_columnar_adjacency()
+                            _, target_ids, relation_ids = adjacency.expand(
+                                adjacency.get_node_ids(type_of_uuids), relation_types=type_of_rel,
+                                allowed_directions=allowed_directions, filtered_node_types=type_of_target)
+                            for target_id, relation_id in zip(target_ids.tolist(), relation_ids.tolist()):
+                                objects.append(adjacency.node_objects[target_id])
+                                objects.append(adjacency.relation_objects[relation_id])
+                        else:
+                            for asset_uuid in type_of_uuids:
+                                objects.extend(list(
+                                    self.collection.traverse_graph(
+                                        start_uuid=asset_uuid, relation_types=type_of_rel,
+                                        allowed_directions=allowed_directions, filtered_node_types=type_of_target,
+                                        return_type='info_object', return_relation_info=True)))
                         node_info_objects.extend(objects)
                         if print_progress:
                             print(f'Filtered objects: {len(node_info_objects)}')
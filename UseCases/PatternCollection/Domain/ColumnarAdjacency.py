@@ -0,0 +1,110 @@
+import numpy as np
+
+from UseCases.PatternCollection.Domain.Enums import Direction
+from UseCases.PatternCollection.Domain.InfoObject import NodeInfoObject, RelationInfoObject
+
+
+class ColumnarAdjacency:
+    """
+    Read-only snapshot of the graph of an AssetCollection. Nodes and relations get integer ids and the edges are kept
+    per (relation name, direction) in CSR form: the neighbours of node i are targets[indptr[i]:indptr[i + 1]].
+    This allows expanding a whole frontier of nodes in one vectorized step.
+    """
+    def __init__(self, node_objects: list[NodeInfoObject], relation_objects: list[RelationInfoObject]):
+        self.node_objects = node_objects
+        self.relation_objects = relation_objects
+        self.node_ids: dict[str, int] = {node.uuid: i for i, node in enumerate(node_objects)}
+
+        self.type_ids: dict[str, int] = {}
+        self.node_types = np.fromiter((self.type_ids.setdefault(node.short_type, len(self.type_ids))
+                                       for node in node_objects), dtype=np.int32, count=len(node_objects))
+        self.node_active = np.fromiter((bool(node.active) for node in node_objects), dtype=bool,
+                                       count=len(node_objects))
+        self.relation_active = np.fromiter((bool(relation.active) for relation in relation_objects), dtype=bool,
+                                           count=len(relation_objects))
+
+        edges: dict[tuple[str, Direction], tuple[list[int], list[int], list[int]]] = {}
+        for relation_id, relation in enumerate(relation_objects):
+            relation_name = relation.short_type.split('#')[-1]
+            bron_id, doel_id = self.node_ids[relation.bron.uuid], self.node_ids[relation.doel.uuid]
+            if relation.is_directional_relation:
+                self._add_edge(edges, (relation_name, Direction.WITH), bron_id, doel_id, relation_id)
+                self._add_edge(edges, (relation_name, Direction.REVERSED), doel_id, bron_id, relation_id)
+            else:
+                self._add_edge(edges, (relation_name, Direction.NONE), bron_id, doel_id, relation_id)
+                self._add_edge(edges, (relation_name, Direction.NONE), doel_id, bron_id, relation_id)
+
+        # (relation name, direction) => (indptr, targets, relation ids)
+        self.csr: dict[tuple[str, Direction], tuple[np.ndarray, np.ndarray, np.ndarray]] = {
+            key: self._to_csr(len(node_objects), *lists) for key, lists in edges.items()}
+
+    @staticmethod
+    def _add_edge(edges: dict, key: tuple[str, Direction], source: int, target: int, relation_id: int) -> None:
+        lists = edges.get(key)
+        if lists is None:
+            lists = edges[key] = ([], [], [])
+        lists[0].append(source)
+        lists[1].append(target)
+        lists[2].append(relation_id)
+
+    @staticmethod
+    def _to_csr(node_count: int, sources: list[int], targets: list[int], relation_ids: list[int]
+                ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        sources = np.asarray(sources, dtype=np.int64)
+        # stable, so the neighbours of a node keep the order in which the relations were added
+        order = np.argsort(sources, kind='stable')
+        indptr = np.zeros(node_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=node_count), out=indptr[1:])
+        return (indptr, np.asarray(targets, dtype=np.int32)[order],
+                np.asarray(relation_ids, dtype=np.int32)[order])
+
+    def get_node_ids(self, uuids: [str]) -> np.ndarray:
+        """Ids of the nodes with the given uuids, uuids that are not a node in the snapshot are ignored."""
+        return np.fromiter((self.node_ids[uuid] for uuid in uuids if uuid in self.node_ids), dtype=np.int64)
+
+    def expand(self, frontier: np.ndarray, relation_types: [str] = None, allowed_directions: [Direction] = None,
+               filtered_node_types: [str] = None, return_only_active: bool = True
+               ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        One hop from all nodes in the frontier, with the same filters as AssetCollection.traverse_graph.
+        Returns three aligned arrays: the position in the frontier of the source, the target node ids and the relation
+        ids, ordered by source and then by the order of relation_types.
+        """
+        if allowed_directions is None or len(allowed_directions) == 0:
+            allowed_directions = [Direction.WITH, Direction.REVERSED, Direction.NONE]
+        keys = [key for key in self.csr
+                if key[1] in allowed_directions and (not relation_types or key[0] in relation_types)]
+        if relation_types:
+            keys.sort(key=lambda k: relation_types.index(k[0]))
+
+        frontier = np.asarray(frontier, dtype=np.int64)
+        sources, targets, relations = [], [], []
+        for key in keys:
+            indptr, csr_targets, csr_relations = self.csr[key]
+            starts = indptr[frontier]
+            counts = indptr[frontier + 1] - starts
+            total = int(counts.sum())
+            if total == 0:
+                continue
+            source_positions = np.repeat(np.arange(len(frontier)), counts)
+            # position of every edge in the csr arrays: the start of its row + its index within the row
+            offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+            edge_positions = np.repeat(starts, counts) + offsets
+            sources.append(source_positions)
+            targets.append(csr_targets[edge_positions])
+            relations.append(csr_relations[edge_positions])
+
+        if not sources:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, empty
+        sources, targets, relations = np.concatenate(sources), np.concatenate(targets), np.concatenate(relations)
+
+        mask = np.ones(len(targets), dtype=bool)
+        if filtered_node_types:
+            type_ids = [self.type_ids[t] for t in filtered_node_types if t in self.type_ids]
+            mask &= np.isin(self.node_types[targets], type_ids)
+        if return_only_active:
+            mask &= self.node_active[targets] & self.relation_active[relations]
+
+        order = np.argsort(sources[mask], kind='stable')
+        return sources[mask][order], targets[mask][order], relations[mask][order]
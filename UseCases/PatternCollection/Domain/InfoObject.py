@@ -1,4 +1,8 @@
 import abc
+import sys
+from typing import NamedTuple
+
+from UseCases.PatternCollection.Domain.Enums import Direction
 
 directional_relations = {
     "onderdeel#HeeftAanvullendeGeometrie",
@@ -40,32 +44,50 @@ def full_uri_to_short_type(uri: str) -> str:
 
 
 class InfoObject(abc.ABC):
+    __slots__ = ('uuid', 'short_type', 'active', 'attr_dict')
+    is_relation: bool
+    is_directional_relation: bool
+
     @abc.abstractmethod
     def __init__(self, uuid: str, short_type: str, attr_dict: dict, active: bool = True):
         self.uuid: str = uuid
-        self.short_type: str = short_type
+        # the same few types are shared by many objects
+        self.short_type: str = sys.intern(short_type)
         self.active: bool = active
         self.attr_dict: dict = attr_dict
-        self.is_relation: bool
-        self.is_directional_relation: bool
 
     def __str__(self):
         return f'{self.short_type} {self.uuid}\n{self.attr_dict}'
 
 
+class RelationEdge(NamedTuple):
+    """One endpoint's view of a relation: the direction seen from that endpoint, the relation and the other node"""
+    direction: Direction
+    relation_object: 'RelationInfoObject'
+    node_object: 'NodeInfoObject'
+
+
 class NodeInfoObject(InfoObject):
+    __slots__ = ('relations',)
+    is_relation = False
+    is_directional_relation = False
+
     def __init__(self, uuid: str, short_type: str, attr_dict: dict, active: bool = True):
         super().__init__(uuid, short_type, attr_dict, active)
-        self.relations: dict = {}
-        self.is_relation: bool = False
-        self.is_directional_relation: bool = False
+        # relation name => uuid of the other node => RelationEdge
+        self.relations: dict[str, dict[str, RelationEdge]] = {}
 
 
 class RelationInfoObject(InfoObject):
+    __slots__ = ('bron', 'doel')
+    is_relation = True
+
     def __init__(self, uuid: str, short_type: str, attr_dict: dict, bron: NodeInfoObject, doel: NodeInfoObject,
                  active: bool = True):
         super().__init__(uuid, short_type, attr_dict, active)
-        self.is_relation: bool = True
-        self.is_directional_relation: bool = (self.is_relation and short_type not in non_directional_relations)
         self.bron: NodeInfoObject = bron
         self.doel: NodeInfoObject = doel
+
+    @property
+    def is_directional_relation(self) -> bool:
+        return self.short_type not in non_directional_relations
@@ -0,0 +1,95 @@
+"""
+Compares the memory used by the graph of an AssetCollection (slotted InfoObjects, RelationEdge tuples) with the
+previous layout: objects with a __dict__ and a dict with 'direction', 'relation_object' and 'node_object' per endpoint.
+The attribute dicts are shared by both layouts and excluded from the measurement.
+
+Run with: python -m UseCases.PatternCollection.UnitTests.AssetCollection_benchmark
+"""
+import tracemalloc
+
+from UseCases.PatternCollection.Domain.AssetCollection import AssetCollection
+from UseCases.PatternCollection.Domain.Enums import Direction
+
+
+class LegacyNode:
+    def __init__(self, uuid: str, short_type: str):
+        self.uuid = uuid
+        self.short_type = short_type
+        self.active = True
+        self.attr_dict = None
+        self.relations = {}
+        self.is_relation = False
+        self.is_directional_relation = False
+
+
+class LegacyRelation:
+    def __init__(self, uuid: str, short_type: str, bron: LegacyNode, doel: LegacyNode):
+        self.uuid = uuid
+        self.short_type = short_type
+        self.active = True
+        self.attr_dict = None
+        self.is_relation = True
+        self.is_directional_relation = True
+        self.bron = bron
+        self.doel = doel
+
+
+def create_dicts(node_count: int) -> tuple[list[dict], list[dict]]:
+    """A chain of lichtmasten with a Voedt relation between each pair of neighbours"""
+    nodes = [{'uuid': f'00000000-0000-0000-0000-{i:012d}', 'typeURI':
+              'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#WVLichtmast'} for i in range(node_count)]
+    relations = [{'uuid': f'{i:012d}-Voedt-{i + 1:012d}', 'bron': nodes[i]['uuid'], 'doel': nodes[i + 1]['uuid'],
+                  'typeURI': 'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#Voedt'}
+                 for i in range(node_count - 1)]
+    return nodes, relations
+
+
+def build_collection(nodes: list[dict], relations: list[dict]) -> AssetCollection:
+    collection = AssetCollection()
+    for node in nodes:
+        collection.add_node(node)
+    for relation in relations:
+        collection.add_relation(relation)
+    return collection
+
+
+def build_legacy(nodes: list[dict], relations: list[dict]) -> dict:
+    object_dict = {}
+    for node in nodes:
+        object_dict[node['uuid']] = LegacyNode(node['uuid'], node['typeURI'].split('/')[-1])
+    for relation in relations:
+        bron, doel = object_dict[relation['bron']], object_dict[relation['doel']]
+        short_type = relation['typeURI'].split('/')[-1]
+        relation_object = LegacyRelation(relation['uuid'], short_type, bron, doel)
+        relation_name = short_type.split('#')[-1]
+        bron.relations.setdefault(relation_name, {})[doel.uuid] = {
+            'direction': Direction.WITH, 'relation_object': relation_object, 'node_object': doel}
+        doel.relations.setdefault(relation_name, {})[bron.uuid] = {
+            'direction': Direction.REVERSED, 'relation_object': relation_object, 'node_object': bron}
+        object_dict[relation['uuid']] = relation_object
+    return object_dict
+
+
+def measure(build, *args) -> int:
+    tracemalloc.start()
+    try:
+        result = build(*args)
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+
+def benchmark(node_count: int = 200_000) -> None:
+    nodes, relations = create_dicts(node_count)
+    legacy = measure(build_legacy, nodes, relations)
+    current = measure(build_collection, nodes, relations)
+
+    print(f'{node_count} nodes, {len(relations)} relations')
+    print(f'__dict__ objects, dict edges: {legacy / 2 ** 20:.1f} MiB')
+    print(f'slotted objects, tuple edges: {current / 2 ** 20:.1f} MiB ({legacy / current:.1f}x)')
+
+
+if __name__ == '__main__':
+    benchmark()
@@ -0,0 +1,123 @@
+import gzip
+import pickle
+from datetime import timedelta
+
+import pytest
+
+from UseCases.PatternCollection.Domain.AssetCollection import AssetCollection
+from UseCases.PatternCollection.Domain.Enums import Direction
+
+ONDERDEEL = 'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#'
+
+
+def create_collection() -> AssetCollection:
+    collection = AssetCollection()
+    collection.add_node({'uuid': 'kast', 'typeURI': f'{ONDERDEEL}Wegkantkast'})
+    collection.add_node({'uuid': 'mast_1', 'typeURI': f'{ONDERDEEL}WVLichtmast'})
+    collection.add_node({'uuid': 'mast_2', 'typeURI': f'{ONDERDEEL}WVLichtmast'})
+    collection.add_node({'uuid': 'mast_3', 'typeURI': f'{ONDERDEEL}WVLichtmast', 'AIMDBStatus.isActief': False})
+    collection.add_node({'uuid': 'toestel', 'typeURI': f'{ONDERDEEL}VerlichtingstoestelLED'})
+    collection.add_relation({'uuid': 'voedt_1', 'bron': 'kast', 'doel': 'mast_1', 'typeURI': f'{ONDERDEEL}Voedt'})
+    collection.add_relation({'uuid': 'voedt_2', 'bron': 'kast', 'doel': 'mast_2', 'typeURI': f'{ONDERDEEL}Voedt'})
+    collection.add_relation({'uuid': 'voedt_3', 'bron': 'kast', 'doel': 'mast_3', 'typeURI': f'{ONDERDEEL}Voedt'})
+    collection.add_relation({'uuid': 'bevestiging', 'bron': 'toestel', 'doel': 'mast_1',
+                             'typeURI': f'{ONDERDEEL}Bevestiging'})
+    return collection
+
+
+def test_columnar_adjacency_expand_matches_traverse_graph():
+    collection = create_collection()
+    adjacency = collection.get_columnar_adjacency()
+
+    for start_uuid in ('kast', 'mast_1', 'toestel'):
+        for allowed_directions in (None, [Direction.WITH], [Direction.REVERSED], [Direction.NONE]):
+            expected = list(collection.traverse_graph(start_uuid, allowed_directions=allowed_directions,
+                                                      return_relation_info=True))
+            _, target_ids, relation_ids = adjacency.expand(adjacency.get_node_ids([start_uuid]),
+                                                           allowed_directions=allowed_directions)
+            result = []
+            for target_id, relation_id in zip(target_ids, relation_ids):
+                result.extend([adjacency.node_objects[target_id].uuid, adjacency.relation_objects[relation_id].uuid])
+            assert sorted(result) == sorted(expected)
+
+
+def test_columnar_adjacency_expand_frontier():
+    collection = create_collection()
+    adjacency = collection.get_columnar_adjacency()
+
+    sources, target_ids, _ = adjacency.expand(
+        adjacency.get_node_ids(['mast_2', 'mast_1']), relation_types=['Voedt', 'Bevestiging'],
+        filtered_node_types=['onderdeel#Wegkantkast', 'onderdeel#VerlichtingstoestelLED'])
+
+    assert sources.tolist() == [0, 1, 1]
+    assert [adjacency.node_objects[i].uuid for i in target_ids] == ['kast', 'kast', 'toestel']
+
+
+def test_columnar_adjacency_is_rebuilt_after_adding():
+    collection = create_collection()
+    adjacency = collection.get_columnar_adjacency()
+    assert collection.get_columnar_adjacency() is adjacency
+
+    collection.add_node({'uuid': 'mast_4', 'typeURI': f'{ONDERDEEL}WVLichtmast'})
+    collection.add_relation({'uuid': 'voedt_4', 'bron': 'kast', 'doel': 'mast_4', 'typeURI': f'{ONDERDEEL}Voedt'})
+
+    adjacency = collection.get_columnar_adjacency()
+    _, target_ids, _ = adjacency.expand(adjacency.get_node_ids(['kast']))
+    assert [adjacency.node_objects[i].uuid for i in target_ids] == ['mast_1', 'mast_2', 'mast_4']
+
+
+def test_save_and_load_snapshot(tmp_path):
+    collection = create_collection()
+    collection.save_snapshot(tmp_path / 'collection.snapshot')
+
+    loaded = AssetCollection.load_snapshot(tmp_path / 'collection.snapshot')
+
+    assert loaded.snapshot_created is not None
+    assert loaded.short_uri_dict == collection.short_uri_dict
+    assert {uuid: o.attr_dict for uuid, o in loaded.object_dict.items()} == {
+        uuid: o.attr_dict for uuid, o in collection.object_dict.items()}
+    assert list(loaded.traverse_graph('kast')) == ['mast_1', 'mast_2']
+    assert loaded.get_node_object_by_uuid('mast_3').active is False
+
+
+def test_load_snapshot_other_version(tmp_path):
+    with gzip.open(tmp_path / 'collection.snapshot', 'wb') as f:
+        pickle.dump({'version': 0, 'nodes': [], 'relations': []}, f)
+
+    with pytest.raises(ValueError):
+        AssetCollection.load_snapshot(tmp_path / 'collection.snapshot')
+
+
+def test_load_snapshot_if_recent(tmp_path):
+    path = tmp_path / 'collection.snapshot'
+    assert AssetCollection.load_snapshot_if_recent(path, max_age=timedelta(days=1)) is None
+
+    collection = create_collection()
+    collection.save_snapshot(path)
+
+    assert AssetCollection.load_snapshot_if_recent(path, max_age=timedelta(days=1)).object_dict.keys() == \
+        collection.object_dict.keys()
+    assert AssetCollection.load_snapshot_if_recent(path, max_age=timedelta(0)) is None
+
+
+def test_get_added_uuids_by_type():
+    collection = create_collection()
+    collection.add_node({'uuid': 'mast_4', 'typeURI': f'{ONDERDEEL}WVLichtmast'})
+    collection.add_node({'uuid': 'mast_1', 'typeURI': f'{ONDERDEEL}WVLichtmast'})
+
+    assert collection.get_added_uuids_by_type('onderdeel#WVLichtmast') == ['mast_1', 'mast_2', 'mast_3', 'mast_4']
+    assert collection.get_added_uuids_by_type('onderdeel#WVLichtmast', start=3) == ['mast_4']
+    assert collection.get_added_uuids_by_type('onderdeel#Camera') == []
+
+
+def test_update_node():
+    collection = create_collection()
+
+    collection.update_node({'uuid': 'mast_3', 'typeURI': f'{ONDERDEEL}WVConsole', 'AIMNaamObject.naam': 'console'})
+
+    node = collection.get_node_object_by_uuid('mast_3')
+    assert node.active is True
+    assert node.attr_dict['AIMNaamObject.naam'] == 'console'
+    assert collection.short_uri_dict['onderdeel#WVLichtmast'] == {'mast_1', 'mast_2'}
+    assert collection.short_uri_dict['onderdeel#WVConsole'] == {'mast_3'}
+    assert list(collection.traverse_graph('kast')) == ['mast_1', 'mast_2', 'mast_3']
@@ -1,4 +1,4 @@
-﻿from unittest.mock import Mock
+﻿from unittest.mock import Mock, patch
 
 from API.AbstractRequester import AbstractRequester
 from UseCases.PatternCollection.Domain.AssetInfoCollector import AssetInfoCollector
@@ -341,6 +341,47 @@ def test_start_collecting_from_starting_uuids_using_pattern_giving_uuids_of_b(fa
         'onderdeel#WVLichtmast': {'00000000-0000-0000-0000-000000000004'}}
 
 
+
+def test_collect_relation_info_by_sources_or_targets_in_chunks(fake_eminfra_client, fake_emson_client):
+    collector = AssetInfoCollector(em_infra_client=fake_eminfra_client, emson_client=fake_emson_client)
+    uuids = ['00000000-0000-0000-0000-000000000002', '00000000-0000-0000-0000-000000000003',
+             '00000000-0000-0000-0000-000000000025']
+    collector.collect_asset_info(uuids=uuids)
+
+    with patch.object(collector, 'get_assetrelaties_by_source_or_target_uuids',
+                      wraps=collector.get_assetrelaties_by_source_or_target_uuids) as get_relations:
+        collector.collect_relation_info_by_sources_or_targets(uuids=uuids, chunk_size=2, fetch_workers=2,
+                                                              collect_missing_assets=True)
+
+    # one request per chunk, the missing assets don't cause the relations to be fetched again
+    assert [c.kwargs['uuids'] for c in get_relations.call_args_list] == [uuids[:2], uuids[2:]]
+    assert collector.collection.short_uri_dict['onderdeel#Bevestiging'] == {
+        '000000000002-Bevestigin-000000000004', '000000000002-Bevestigin-000000000026',
+        '000000000003-Bevestigin-000000000007', '000000000005-Bevestigin-000000000003',
+        '000000000006-Bevestigin-000000000002'}
+    assert collector.collection.short_uri_dict['onderdeel#HoortBij'] == {'000000000025--HoortBij--000000000021'}
+
+
+
+def test_start_collecting_expands_every_node_once(fake_eminfra_client, fake_emson_client):
+    collector = AssetInfoCollector(em_infra_client=fake_eminfra_client, emson_client=fake_emson_client)
+
+    with patch.object(collector, 'get_assetrelaties_by_source_or_target_uuids',
+                      wraps=collector.get_assetrelaties_by_source_or_target_uuids) as get_relations:
+        collector.start_collecting_from_starting_uuids_using_pattern(
+            starting_uuids=['00000000-0000-0000-0000-000000000002'], print_progress=False,
+            pattern=[('uuids', 'of', 'a'),
+                     ('a', 'type_of', ['onderdeel#VerlichtingstoestelLED', 'onderdeel#WVLichtmast']),
+                     ('a', '-[r1]*-', 'a'),
+                     ('r1', 'type_of', ['onderdeel#Bevestiging'])])
+
+    expanded_uuids = [uuid for c in get_relations.call_args_list for uuid in c.kwargs['uuids']]
+    assert len(expanded_uuids) == len(set(expanded_uuids))
+    assert collector.collection.short_uri_dict['onderdeel#VerlichtingstoestelLED'] == {
+        '00000000-0000-0000-0000-000000000002', '00000000-0000-0000-0000-000000000022',
+        '00000000-0000-0000-0000-000000000023', '00000000-0000-0000-0000-000000000024'}
+
+
 def test_reverse_relation_pattern():
     reversed1 = AssetInfoCollector.reverse_relation_pattern(('a', '-[r1]-', 'b'))
     assert reversed1 == ('b', '-[r1]-', 'a')
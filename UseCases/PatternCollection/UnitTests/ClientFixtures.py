@@ -6,6 +6,7 @@ from unittest.mock import Mock, patch
 import pytest
 
 from API.AbstractRequester import AbstractRequester
+from API.eminfra.AssetService import AssetService
 from API.eminfra.EMInfraClient import EMInfraClient
 from API.EMSONClient import EMSONClient
 from API.Enums import AuthType, Environment
@@ -485,9 +486,9 @@ def fake_eminfra_client() -> EMInfraClient:
     def __init__(self, auth_type: AuthType, env: Environment, settings_path: Path = None, cookie: str = None):
         pass
 
-    def get_objects_from_oslo_search_endpoint(self, url_part: str,
-                                              filter_dict: dict = '{}', size: int = 100,
-                                              expansions_fields: [str] = None) -> list:
+    def get_objects_from_oslo_search_endpoint_gen(self, url_part: str,
+                                                  filter_dict: dict = '{}', size: int = 100,
+                                                  expansions_fields: [str] = None, read_ahead: int = 0) -> list:
         if url_part == 'assetrelaties' and 'asset' in filter_dict:
             yield from  [a for a in copy.deepcopy(fake_assets)
                     if '@id' in a and a['@id'].startswith('https://data.awvvlaanderen.be/id/assetrelatie/') and
@@ -499,8 +500,9 @@ def fake_eminfra_client() -> EMInfraClient:
     with patch.object(EMInfraClient, '__init__', __init__):
         eminfra_client = EMInfraClient(auth_type=AuthType.JWT, env=Environment.DEV, settings_path=None)
         eminfra_client.requester = Mock(spec=AbstractRequester)
-        with (patch.object(EMInfraClient, 'get_objects_from_oslo_search_endpoint',
-                           get_objects_from_oslo_search_endpoint)):
+        eminfra_client.asset_service = AssetService(eminfra_client.requester)
+        with (patch.object(AssetService, 'get_objects_from_oslo_search_endpoint_gen',
+                           get_objects_from_oslo_search_endpoint_gen)):
             yield eminfra_client
 
     #
@@ -1,8 +1,10 @@
 import logging
 import sys
+from datetime import timedelta
 from pathlib import Path
 
 from API.Enums import AuthType, Environment
+from UseCases.PatternCollection.Domain.AssetCollection import AssetCollection
 from UseCases.PatternCollection.Domain.PatternVisualiser import PatternVisualiser
 from UseCases.PatternCollection.Domain.PyVisWrapper import PyVisWrapper
 
@@ -16,6 +18,9 @@ handler.setFormatter(formatter)
 root.addHandler(handler)
 
 settings_path = Path('/home/davidlinux/Documents/AWV/resources/settings_SyncOTLDataToLegacy.json')
+# delete the snapshot to collect everything again, a snapshot older than max_snapshot_age is collected again as well
+max_snapshot_age = timedelta(days=1)
+snapshot_path = Path(__file__).parent / 'MIV233.snapshot'
 
 
 if __name__ == '__main__':
@@ -56,8 +61,14 @@ if __name__ == '__main__':
         'typeUri': 'https://wegenenverkeer.data.vlaanderen.be/ns/installatie#MIVModule', 'naam': 'MIV233'})
     l = (list(chosen_assets))
     asset_uuids = [x['@id'][39:75] for x in l]
-    syncer.collect_info_given_asset_uuids(asset_uuids=asset_uuids,
-                                          asset_info_collector=syncer.collector, pattern=pattern)
+    collection = AssetCollection.load_snapshot_if_recent(snapshot_path, max_age=max_snapshot_age)
+    if collection is not None:
+        syncer.collector.collection = collection
+        syncer.collector.refresh_asset_info(uuids=asset_uuids)
+    else:
+        syncer.collect_info_given_asset_uuids(asset_uuids=asset_uuids,
+                                              asset_info_collector=syncer.collector, pattern=pattern)
+        syncer.collector.collection.save_snapshot(snapshot_path)
     print(len(syncer.collector.collection.object_dict))
 
     objects_to_visualise = syncer.collector.filter_collection_by_pattern(filter_pattern=pattern,
@@ -5,13 +5,12 @@ from API.eminfra.EMInfraDomain import AssetDTO
 def get_toezichter_naam(eminfra_client: EMInfraClient, asset: AssetDTO) -> str | None:
     """
     Returns the complete toezichter naam (voornaam + naam) from an asset.
+    The identiteit is kept in the metadata cache of the client, so every toezichter is requested only once.
     """
-    toezichter_kenmerk = eminfra_client.get_kenmerk_toezichter_by_asset_uuid(
-        asset_uuid=asset.uuid
-    )
+    toezichter_kenmerk = eminfra_client.toezichter_service.get_toezichter_by_uuid(asset_uuid=asset.uuid)
     if toezichter_kenmerk and toezichter_kenmerk.toezichter:
-        toezichter_uuid = toezichter_kenmerk.toezichter.get("uuid")
-        toezichter = eminfra_client.get_identiteit(toezichter_uuid=toezichter_uuid)
+        toezichter = eminfra_client.toezichter_service.get_identiteit(
+            toezichter_uuid=toezichter_kenmerk.toezichter.uuid)
         return f'{toezichter.voornaam} {toezichter.naam}'
     else:
-        return None
\ No newline at end of file
+        return None